@@ -0,0 +1,208 @@
+'''
+Offline benchmarks for the hot paths of the package.
+
+Each benchmark is a function decorated with :func:`benchmark`.
+It does its setup and returns a zero-argument callable,
+which is then timed using :mod:`timeit`.
+'''
+
+import importlib
+import json
+import pkgutil
+import platform
+import statistics
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from timeit import Timer
+from typing import Any
+
+
+type Setup = Callable[[], Callable[[], object]]
+
+
+_registry: dict[str, Setup] = {}
+
+
+@dataclass(frozen = True, slots = True)
+class Result:
+	'''
+	Timing of a single benchmark, in nanoseconds per call.
+	'''
+	
+	best: float
+	median: float
+	number: int
+	repeat: int
+
+
+@dataclass(frozen = True, slots = True)
+class Regression:
+	'''
+	A benchmark that got slower than its threshold allows.
+	'''
+	
+	name: str
+	baseline: float
+	current: float
+	threshold: float
+	
+	@property
+	def ratio(self) -> float:
+		return self.current / self.baseline
+
+
+def benchmark(name: str, /) -> Callable[[Setup], Setup]:
+	'''
+	Register a benchmark under the given name.
+	Names are slash-separated, like ``parse/odd``.
+	'''
+	
+	def register(setup: Setup) -> Setup:
+		if name in _registry:
+			raise ValueError(f'Duplicate benchmark: {name!r}')
+		
+		_registry[name] = setup
+		
+		return setup
+	
+	return register
+
+
+def discover() -> dict[str, Setup]:
+	'''
+	Import every benchmark module in this package
+	and return all registered benchmarks.
+	'''
+	
+	for module in pkgutil.iter_modules(__path__):
+		if not module.name.startswith('_'):
+			importlib.import_module(f'{__name__}.{module.name}')
+	
+	return dict(sorted(_registry.items()))
+
+
+def measure(
+	function: Callable[[], object], /, *,
+	repeat: int = 5,
+	min_time: float = 0.05
+) -> Result:
+	'''
+	Time ``function``, calling it enough times per round
+	for a round to last at least ``min_time`` seconds.
+	'''
+	
+	timer = Timer(function)
+	number = 1
+	
+	while timer.timeit(number) < min_time:
+		number *= 2
+	
+	timings = [
+		total / number * 1e9
+		for total in timer.repeat(repeat = repeat, number = number)
+	]
+	
+	return Result(
+		best = min(timings),
+		median = statistics.median(timings),
+		number = number,
+		repeat = repeat
+	)
+
+
+def run(
+	names: Iterable[str] | None = None, /, *,
+	repeat: int = 5,
+	min_time: float = 0.05
+) -> Iterator[tuple[str, Result]]:
+	'''
+	Run the given benchmarks, or all of them.
+	'''
+	
+	benchmarks = discover()
+	
+	for name in benchmarks if names is None else names:
+		function = benchmarks[name]()
+		
+		yield name, measure(function, repeat = repeat, min_time = min_time)
+
+
+def environment() -> dict[str, str]:
+	'''
+	Describe the interpreter and the machine.
+	'''
+	
+	return {
+		'python': sys.version,
+		'implementation': platform.python_implementation(),
+		'machine': platform.machine(),
+		'system': platform.system()
+	}
+
+
+def dump(results: Mapping[str, Result], path: Path, /) -> None:
+	'''
+	Write results and the environment to a JSON file.
+	'''
+	
+	document = {
+		'environment': environment(),
+		'results': {
+			name: {
+				key: round(value, 1)
+				for key, value in asdict(result).items()
+			}
+			for name, result in results.items()
+		}
+	}
+	
+	path.write_text(json.dumps(document, indent = '\t') + '\n')
+
+
+def load(path: Path, /) -> tuple[dict[str, Result], dict[str, float]]:
+	'''
+	Read results written by :func:`dump`, as well as
+	per-benchmark thresholds, if the file has any.
+	'''
+	
+	document: dict[str, Any] = json.loads(path.read_text())
+	results = {
+		name: Result(**result)
+		for name, result in document['results'].items()
+	}
+	
+	return results, document.get('thresholds', {})
+
+
+def compare(
+	baseline: Mapping[str, Result],
+	current: Mapping[str, Result], /, *,
+	threshold: float = 0.25,
+	thresholds: Mapping[str, float] | None = None
+) -> list[Regression]:
+	'''
+	Find benchmarks whose best timing exceeds that of
+	the baseline by more than the allowed fraction.
+	
+	:param threshold: The default allowed slowdown; ``0.25`` means 25%.
+	:param thresholds: Per-benchmark overrides of ``threshold``.
+	'''
+	
+	thresholds = thresholds or {}
+	regressions: list[Regression] = []
+	
+	for name, result in current.items():
+		if name not in baseline:
+			continue
+		
+		allowed = thresholds.get(name, threshold)
+		before = baseline[name].best
+		
+		if result.best > before * (1 + allowed):
+			regressions.append(
+				Regression(name, before, result.best, allowed)
+			)
+	
+	return regressions
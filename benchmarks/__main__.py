@@ -0,0 +1,106 @@
+'''
+Run the benchmarks: ``python -m benchmarks``.
+'''
+
+import argparse
+import fnmatch
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from . import compare, discover, dump, load, Result, run
+
+
+_default_baseline = Path(__file__).parent / 'baseline.json'
+
+
+def _argument_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(prog = 'python -m benchmarks')
+	
+	parser.add_argument(
+		'patterns', nargs = '*', metavar = 'PATTERN',
+		help = 'glob patterns of benchmark names to run (default: all)'
+	)
+	parser.add_argument(
+		'-o', '--output', type = Path,
+		help = 'write the results to this JSON file'
+	)
+	parser.add_argument(
+		'-b', '--baseline', type = Path, default = _default_baseline,
+		help = 'compare against this JSON file (default: %(default)s)'
+	)
+	parser.add_argument(
+		'--no-compare', action = 'store_true',
+		help = 'do not compare against the baseline'
+	)
+	parser.add_argument(
+		'-t', '--threshold', type = float, default = 0.25,
+		help = 'allowed slowdown before failing (default: %(default)s)'
+	)
+	parser.add_argument(
+		'-r', '--repeat', type = int, default = 5,
+		help = 'number of rounds per benchmark (default: %(default)s)'
+	)
+	parser.add_argument(
+		'--min-time', type = float, default = 0.05,
+		help = 'minimum duration of a round (default: %(default)s)'
+	)
+	parser.add_argument(
+		'-l', '--list', action = 'store_true',
+		help = 'list the benchmarks and exit'
+	)
+	
+	return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+	arguments = _argument_parser().parse_args(argv)
+	names = list(discover())
+	
+	if arguments.patterns:
+		names = [
+			name for name in names
+			if any(fnmatch.fnmatch(name, pattern) for pattern in arguments.patterns)
+		]
+	
+	if arguments.list:
+		print('\n'.join(names))
+		return 0
+	
+	results: dict[str, Result] = {}
+	width = max(map(len, names), default = 0)
+	
+	for name, result in run(
+		names,
+		repeat = arguments.repeat,
+		min_time = arguments.min_time
+	):
+		results[name] = result
+		print(f'{name:<{width}}  {result.best:>12,.1f} ns  (median {result.median:,.1f})')
+	
+	if arguments.output:
+		dump(results, arguments.output)
+	
+	if arguments.no_compare or not arguments.baseline.exists():
+		return 0
+	
+	baseline, thresholds = load(arguments.baseline)
+	regressions = compare(
+		baseline, results,
+		threshold = arguments.threshold,
+		thresholds = thresholds
+	)
+	
+	for regression in regressions:
+		print(
+			f'REGRESSION {regression.name}: '
+			f'{regression.baseline:,.1f} -> {regression.current:,.1f} ns '
+			f'({regression.ratio:.2f}x, allowed {1 + regression.threshold:.2f}x)',
+			file = sys.stderr
+		)
+	
+	return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,56 @@
+from array import array
+from collections import deque
+
+from a_n_plus_b import ANPlusB, batch_counts, batch_indices
+from . import benchmark
+
+
+_pattern = ANPlusB(3, 2)
+_populations = [population % 500 for population in range(0, 100_000, 37)]
+
+
+@benchmark('batch/indices/loop')
+def indices_loop():
+	def collect() -> None:
+		indices, offsets = array('q'), array('q', [0])
+		
+		for population in _populations:
+			indices.extend(_pattern.indices(population))
+			offsets.append(len(indices))
+	
+	return collect
+
+
+@benchmark('batch/indices/array')
+def indices_array():
+	return lambda: batch_indices(_pattern, _populations)
+
+
+@benchmark('batch/counts/loop')
+def counts_loop():
+	def count() -> None:
+		for population in _populations:
+			deque(_pattern.indices(population), maxlen = 0)
+	
+	return count
+
+
+@benchmark('batch/counts/array')
+def counts_array():
+	return lambda: batch_counts(_pattern, _populations)
+
+
+try:
+	import numpy
+except ImportError:
+	pass
+else:
+	_numpy_populations = numpy.array(_populations)
+	
+	@benchmark('batch/indices/numpy')
+	def indices_numpy():
+		return lambda: batch_indices(_pattern, _numpy_populations)
+	
+	@benchmark('batch/counts/numpy')
+	def counts_numpy():
+		return lambda: batch_counts(_pattern, _numpy_populations)
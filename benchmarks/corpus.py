@@ -0,0 +1,119 @@
+'''
+A deterministic, offline generator of realistic ``an+b`` arguments
+and of the populations they are evaluated against.
+
+Arguments are drawn from weighted categories resembling
+what is found in real stylesheets: mostly keywords and
+short ``an+b`` forms, some padded or mixed-case ones,
+a few huge integers and a share of invalid strings.
+'''
+
+import random
+from collections.abc import Callable
+
+
+type Generator = Callable[[random.Random], str]
+
+
+def _keyword(generator: random.Random) -> str:
+	return generator.choice(['odd', 'even'])
+
+
+def _a_n_plus_b(generator: random.Random) -> str:
+	step = generator.choice([1, 2, 2, 2, 3, 3, 4, 5, 6, 10, -1, -1, -2])
+	offset = generator.choice([0, 1, 1, 1, 2, 3, 4, 5, -1, -2])
+	n = {1: 'n', -1: '-n'}.get(step, f'{step}n')
+	
+	if offset == 0:
+		return n
+	
+	return f'{n}{offset:+d}'
+
+
+def _integer(generator: random.Random) -> str:
+	value = generator.choice([1, 1, 1, 2, 2, 3, 4, 5, 6, 8, 10, 12])
+	
+	return generator.choice([str(value), f'+{value}'])
+
+
+def _padded(generator: random.Random) -> str:
+	template = generator.choice([
+		' {} ', '{}\n', '\t{}', '  {}  ',
+		'{a} + {b}', '{a} - {b}', '{a}+ {b}', ' + {b}'
+	])
+	
+	if '{}' in template:
+		return template.format(_a_n_plus_b(generator))
+	
+	a = generator.choice(['2n', '3n', '-n', 'n', '+n', '4n'])
+	b = generator.randint(0, 9)
+	
+	# " + 5" is found in the wild, but is not valid.
+	return template.format(a = a, b = b)
+
+
+def _mixed_case(generator: random.Random) -> str:
+	text = generator.choice([_keyword, _a_n_plus_b])(generator)
+	
+	return ''.join(
+		character.upper() if generator.random() < 0.5 else character
+		for character in text
+	)
+
+
+def _large_integer(generator: random.Random) -> str:
+	digits = generator.randint(19, 200)
+	a = generator.randrange(10 ** (digits - 1), 10 ** digits)
+	b = generator.randrange(10 ** digits)
+	
+	return generator.choice([f'{a}', f'{a}n', f'{a}n+{b}', f'-{a}n-{b}'])
+
+
+def _invalid(generator: random.Random) -> str:
+	return generator.choice([
+		'', ' ', 'first', 'last', 'auto', '2n+', 'n+-1', '3 n',
+		'- n+3', '2n+1 of', '1.5', '1px', '--n', 'n2', 'odd even',
+		'2n+1)', '(2n+1)', '+ n', 'evens', '0x10', '2n+ -1'
+	])
+
+
+categories: dict[str, tuple[Generator, float]] = {
+	'keyword': (_keyword, 30),
+	'a_n_plus_b': (_a_n_plus_b, 30),
+	'integer': (_integer, 12),
+	'padded': (_padded, 10),
+	'mixed_case': (_mixed_case, 5),
+	'large_integer': (_large_integer, 3),
+	'invalid': (_invalid, 10)
+}
+'''
+The categories of arguments, with their generators and weights.
+'''
+
+
+def arguments(size: int, /, *, seed: int = 0) -> list[str]:
+	'''
+	Generate ``size`` arguments. The same seed
+	always produces the same arguments.
+	'''
+	
+	generator = random.Random(seed)
+	generators = [generate for generate, _ in categories.values()]
+	weights = [weight for _, weight in categories.values()]
+	chosen = generator.choices(generators, weights, k = size)
+	
+	return [generate(generator) for generate in chosen]
+
+
+def populations(size: int, /, *, seed: int = 0) -> list[int]:
+	'''
+	Generate ``size`` numbers of children: mostly short lists
+	and table pages, with a long tail of large ones.
+	'''
+	
+	generator = random.Random(seed)
+	
+	return [
+		min(100_000, round(generator.lognormvariate(3, 1.2)))
+		for _ in range(size)
+	]
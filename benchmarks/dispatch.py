@@ -0,0 +1,44 @@
+from a_n_plus_b import ANPlusB, compile_rules
+from . import benchmark
+
+
+_population = 100
+
+_rules = [
+	(f'rule-{step}-{offset}-{from_last}', ANPlusB(step, offset), from_last)
+	for step in (-3, 2, 3, 4, 5)
+	for offset in (-1, 1, 4)
+	for from_last in (False, True)
+]
+
+
+@benchmark('dispatch/per_pattern')
+def dispatch_per_pattern():
+	predicates = [
+		(rule_id, instance.compile(from_last = from_last))
+		for rule_id, instance, from_last in _rules
+	]
+	population = _population
+	
+	def per_pattern() -> None:
+		for index in range(1, population + 1):
+			[rule_id for rule_id, matches in predicates if matches(index, population)]
+	
+	return per_pattern
+
+
+@benchmark('dispatch/compiled')
+def dispatch_compiled():
+	dispatch = compile_rules(_rules)
+	population = _population
+	
+	def compiled() -> None:
+		for index in range(1, population + 1):
+			dispatch(index, population)
+	
+	return compiled
+
+
+@benchmark('dispatch/compile')
+def dispatch_compile():
+	return lambda: compile_rules(_rules)
@@ -0,0 +1,175 @@
+'''
+End-to-end throughput over a realistic corpus: parse every argument,
+serialize it back through ``__str__`` and evaluate its indices.
+
+Run ``python -m benchmarks.end_to_end`` for a report
+of items per second and per-item latency percentiles.
+'''
+
+import argparse
+import sys
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from time import perf_counter_ns
+
+from a_n_plus_b import ANPlusB, ParseError
+from . import benchmark
+from .corpus import arguments, populations
+
+
+_size = 1_000
+
+
+@dataclass(frozen = True, slots = True)
+class Throughput:
+	'''
+	Per-item timings of one stage, in nanoseconds.
+	'''
+	
+	items: int
+	total: int
+	p50: int
+	p90: int
+	p99: int
+	
+	@property
+	def items_per_second(self) -> float:
+		return self.items / self.total * 1e9 if self.total else 0.0
+
+
+def _parse(text: str) -> ANPlusB | None:
+	try:
+		return ANPlusB.parse(text)
+	except ParseError:
+		return None
+
+
+def _consume(instance: ANPlusB, population: int) -> None:
+	deque(instance.indices(population), maxlen = 0)
+
+
+def _timed[T](
+	function: Callable[[T], object],
+	items: Sequence[T], /
+) -> Throughput:
+	timings: list[int] = []
+	
+	for item in items:
+		start = perf_counter_ns()
+		function(item)
+		timings.append(perf_counter_ns() - start)
+	
+	timings.sort()
+	
+	return Throughput(
+		items = len(items),
+		total = sum(timings),
+		p50 = _percentile(timings, 0.5),
+		p90 = _percentile(timings, 0.9),
+		p99 = _percentile(timings, 0.99)
+	)
+
+
+def _percentile(timings: list[int], fraction: float, /) -> int:
+	# Nearest rank, so that a single timing is its own percentile.
+	if not timings:
+		return 0
+	
+	return timings[min(len(timings) - 1, int(fraction * len(timings)))]
+
+
+def report(size: int = 10_000, /, *, seed: int = 0) -> dict[str, Throughput]:
+	'''
+	Measure each stage over a corpus of ``size`` arguments.
+	Invalid arguments are only counted by the parse stage.
+	'''
+	
+	texts = arguments(size, seed = seed)
+	parsed = [instance for instance in map(_parse, texts) if instance is not None]
+	counts = populations(len(parsed), seed = seed)
+	pairs = list(zip(parsed, counts, strict = True))
+	
+	return {
+		'parse': _timed(_parse, texts),
+		'serialize': _timed(str, parsed),
+		'indices': _timed(lambda pair: _consume(*pair), pairs),
+		'end_to_end': _timed(_end_to_end, list(zip(
+			texts, populations(size, seed = seed),
+			strict = True
+		)))
+	}
+
+
+def _end_to_end(item: tuple[str, int]) -> None:
+	text, population = item
+	
+	if (instance := _parse(text)) is not None:
+		str(instance)
+		_consume(instance, population)
+
+
+@benchmark('end_to_end/parse')
+def end_to_end_parse():
+	texts = arguments(_size)
+	
+	return lambda: [_parse(text) for text in texts]
+
+
+@benchmark('end_to_end/serialize')
+def end_to_end_serialize():
+	instances = [_parse(text) for text in arguments(_size)]
+	instances = [instance for instance in instances if instance is not None]
+	
+	return lambda: [str(instance) for instance in instances]
+
+
+@benchmark('end_to_end/indices')
+def end_to_end_indices():
+	instances = [_parse(text) for text in arguments(_size)]
+	instances = [instance for instance in instances if instance is not None]
+	pairs = list(zip(instances, populations(len(instances)), strict = True))
+	
+	def consume() -> None:
+		for instance, population in pairs:
+			_consume(instance, population)
+	
+	return consume
+
+
+@benchmark('end_to_end/corpus')
+def end_to_end_corpus():
+	items = list(zip(arguments(_size), populations(_size), strict = True))
+	
+	def run() -> None:
+		for item in items:
+			_end_to_end(item)
+	
+	return run
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+	parser = argparse.ArgumentParser(prog = 'python -m benchmarks.end_to_end')
+	parser.add_argument(
+		'-n', '--size', type = int, default = 10_000,
+		help = 'number of arguments in the corpus (default: %(default)s)'
+	)
+	parser.add_argument(
+		'-s', '--seed', type = int, default = 0,
+		help = 'seed of the corpus (default: %(default)s)'
+	)
+	options = parser.parse_args(argv)
+	
+	for stage, result in report(options.size, seed = options.seed).items():
+		print(
+			f'{stage:<12} {result.items_per_second:>14,.0f} items/s  '
+			f'p50 {result.p50:>9,.0f} ns  '
+			f'p90 {result.p90:>9,.0f} ns  '
+			f'p99 {result.p99:>9,.0f} ns'
+		)
+	
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,87 @@
+from collections import deque
+
+from a_n_plus_b import ANPlusB, IndicesCache
+from . import benchmark
+
+
+_population = 10_000
+
+
+def _consume(instance: ANPlusB, from_last: bool, order: str):
+	def consume() -> None:
+		indices = instance.indices(
+			_population,
+			from_last = from_last,
+			order = order
+		)
+		deque(indices, maxlen = 0)
+	
+	return consume
+
+
+def _register(
+	name: str, instance: ANPlusB,
+	from_last: bool, order: str
+) -> None:
+	benchmark(name)(lambda: _consume(instance, from_last, order))
+
+
+for _step_name, _instance in [
+	('positive', ANPlusB(3, -2)),
+	('negative', ANPlusB(-3, 9_000)),
+	('zero', ANPlusB(0, 5_000)),
+	('unit', ANPlusB(1, 0))
+]:
+	for _from_last in (False, True):
+		for _order in ('default', 'ascending', 'descending'):
+			_register(
+				'/'.join([
+					'indices', _step_name,
+					'last' if _from_last else 'first', _order
+				]),
+				_instance, _from_last, _order
+			)
+
+
+@benchmark('indices/small_population')
+def indices_small_population():
+	instance = ANPlusB(2, 1)
+	
+	return lambda: list(instance.indices(10))
+
+
+@benchmark('indices/empty')
+def indices_empty():
+	instance = ANPlusB(-2, -1)
+	
+	return lambda: list(instance.indices(10))
+
+
+# A renderer laying out the same list sizes every frame.
+_frame = [
+	(instance, population)
+	for instance in (ANPlusB(2, 1), ANPlusB(2, 0), ANPlusB(3, 0), ANPlusB(-1, 3))
+	for population in (10, 20, 50)
+]
+
+
+@benchmark('indices/frame/uncached')
+def indices_frame_uncached():
+	def render() -> None:
+		for instance, population in _frame:
+			for _ in instance.indices(population):
+				pass
+	
+	return render
+
+
+@benchmark('indices/frame/cached')
+def indices_frame_cached():
+	cache = IndicesCache()
+	
+	def render() -> None:
+		for instance, population in _frame:
+			for _ in cache.indices(instance, population):
+				pass
+	
+	return render
@@ -0,0 +1,156 @@
+'''
+Memory and allocation measurements, using :mod:`tracemalloc`.
+
+Run ``python -m benchmarks.memory`` for a report.
+The budgets enforced by ``tests/test_memory.py`` are based on these.
+'''
+
+import gc
+import sys
+import tracemalloc
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import islice
+
+from a_n_plus_b import ANPlusB
+
+
+@dataclass(frozen = True, slots = True)
+class Allocation:
+	'''
+	Memory allocated by a single call, on average.
+	
+	``retained`` and ``blocks`` describe what is still alive
+	after the call; ``peak`` is the highest amount of
+	memory in use while the call was running.
+	'''
+	
+	retained: float
+	blocks: float
+	peak: int
+
+
+def _traced[T](function: Callable[[], T]) -> tuple[T, int, int, int]:
+	# Warm up, so that one-time allocations (caches,
+	# specialization, coverage data) are not counted.
+	function()
+	
+	result, size, count, peak = _traced_uncalibrated(function)
+	_, overhead_size, overhead_count, overhead_peak = \
+		_traced_uncalibrated(lambda: None)
+	
+	return (
+		result,
+		size - overhead_size,
+		count - overhead_count,
+		max(0, peak - overhead_peak)
+	)
+
+
+def _traced_uncalibrated[T](
+	function: Callable[[], T]
+) -> tuple[T, int, int, int]:
+	gc.collect()
+	tracemalloc.start()
+	
+	try:
+		before = tracemalloc.take_snapshot()
+		tracemalloc.reset_peak()
+		baseline, _ = tracemalloc.get_traced_memory()
+		
+		result = function()
+		
+		_, peak = tracemalloc.get_traced_memory()
+		after = tracemalloc.take_snapshot()
+	
+	finally:
+		tracemalloc.stop()
+	
+	differences = after.compare_to(before, 'filename')
+	size = sum(difference.size_diff for difference in differences)
+	count = sum(difference.count_diff for difference in differences)
+	
+	return result, size, count, peak - baseline
+
+
+def retained(
+	factory: Callable[[], object], /, *,
+	number: int = 1000
+) -> Allocation:
+	'''
+	Measure the memory kept alive by each result of ``factory``.
+	'''
+	
+	results: list[object] = [None] * number
+	
+	def fill() -> None:
+		for index in range(number):
+			results[index] = factory()
+	
+	_, size, count, peak = _traced(fill)
+	
+	return Allocation(size / number, count / number, peak // number)
+
+
+def transient(function: Callable[[], object], /) -> Allocation:
+	'''
+	Measure the memory used while ``function`` runs,
+	discarding its result.
+	'''
+	
+	_, size, count, peak = _traced(lambda: function() and None)
+	
+	return Allocation(size, count, peak)
+
+
+def per_item(
+	iterable: Callable[[], Iterable[object]],
+	length: int, /
+) -> Allocation:
+	'''
+	Measure the memory used while consuming ``length`` items
+	of the iterable returned by ``iterable``, per item.
+	'''
+	
+	def consume() -> None:
+		deque(islice(iterable(), length), maxlen = 0)
+	
+	_, size, count, peak = _traced(consume)
+	
+	return Allocation(size / length, count / length, peak // length)
+
+
+def instance_size() -> int:
+	'''
+	The size of an :class:`ANPlusB` instance whose
+	step and offset are small, cached integers.
+	'''
+	
+	return sys.getsizeof(ANPlusB(3, 2))
+
+
+def report() -> dict[str, Allocation | int]:
+	'''
+	Measure every tracked quantity.
+	'''
+	
+	instance = ANPlusB(3, -2)
+	long_text = '\t' * 1000 + '2n + 1' + ' ' * 1000
+	
+	return {
+		'instance/getsizeof': instance_size(),
+		'instance/retained': retained(lambda: ANPlusB(3, 2)),
+		'parse/retained': retained(lambda: ANPlusB.parse('-12n+345')),
+		'parse/keyword': transient(lambda: ANPlusB.parse('odd')),
+		'parse/integer': transient(lambda: ANPlusB.parse('42')),
+		'parse/a_n_plus_b': transient(lambda: ANPlusB.parse(' -12n + 345 ')),
+		'parse/long_whitespace': transient(lambda: ANPlusB.parse(long_text)),
+		'indices/per_index': per_item(lambda: instance.indices(100_000), 33_333),
+		'values/per_step': per_item(instance.values, 100_000)
+	}
+
+
+if __name__ == '__main__':
+	for name, value in report().items():
+		print(f'{name:<24} {value}')
@@ -0,0 +1,54 @@
+from a_n_plus_b import ANPlusB
+from . import benchmark
+
+
+_instances = [
+	ANPlusB(0, 5), ANPlusB(1, 0), ANPlusB(-1, 3),
+	ANPlusB(2, 1), ANPlusB(-4, -6), ANPlusB(10 ** 20, -(10 ** 20))
+]
+
+
+@benchmark('str/mixed')
+def str_mixed():
+	return lambda: [str(instance) for instance in _instances]
+
+
+@benchmark('repr/mixed')
+def repr_mixed():
+	return lambda: [repr(instance) for instance in _instances]
+
+
+@benchmark('math/add')
+def math_add():
+	instance = ANPlusB(3, 2)
+	
+	return lambda: instance + 5
+
+
+@benchmark('math/neg_sub')
+def math_neg_sub():
+	instance = ANPlusB(3, 2)
+	
+	return lambda: 4 - instance
+
+
+@benchmark('math/mul')
+def math_mul():
+	instance = ANPlusB(3, 2)
+	
+	return lambda: -3 * instance
+
+
+@benchmark('construct/two_arguments')
+def construct_two_arguments():
+	return lambda: ANPlusB(3, 2)
+
+
+@benchmark('construct/from_complex')
+def construct_from_complex():
+	return lambda: ANPlusB.from_complex(5j - 2)
+
+
+@benchmark('hash_eq/set')
+def hash_eq_set():
+	return lambda: len(set(_instances + _instances))
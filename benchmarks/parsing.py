@@ -0,0 +1,98 @@
+from a_n_plus_b import ANPlusB, LazyANPlusB, ParseError
+from . import benchmark
+
+
+_realistic = [
+	'odd', 'even', '2n+1', '3n', '-n+3', 'n+2', '4n-1', '5',
+	' 2n + 1 ', 'EVEN', '2N+1', '+5', '-2n+10', '10n+9'
+]
+
+_adversarial = [
+	'\t\n\f\r ' * 100 + '2n+1' + '\t\n\f\r ' * 100,
+	'9' * 1000 + 'n+' + '9' * 1000,
+	'+' + '0' * 4000 + 'n' + ' ' * 1000 + '-' + ' ' * 1000 + '0' * 4000,
+	'1' * 5000 + 'n-',
+	'n' * 5000
+]
+
+# Scraped arguments: nine in ten are not valid.
+_mostly_invalid = [
+	'2n+1', 'foo', '', '3n+', '+ n', 'n-n', 'auto', '1px', 'first', ' ',
+	'odd', 'inherit', '2n+1 of .a', '--', 'n+', 'none', '-2n+', 'x', 'e', '0.5'
+]
+
+
+def _parse_all(texts: list[str]) -> None:
+	for text in texts:
+		try:
+			ANPlusB.parse(text)
+		except ParseError:
+			pass
+
+
+@benchmark('parse/odd')
+def parse_odd():
+	return lambda: ANPlusB.parse('odd')
+
+
+@benchmark('parse/integer')
+def parse_integer():
+	return lambda: ANPlusB.parse('-42')
+
+
+@benchmark('parse/a_n_plus_b')
+def parse_a_n_plus_b():
+	return lambda: ANPlusB.parse('-12n+345')
+
+
+@benchmark('parse/whitespace')
+def parse_whitespace():
+	return lambda: ANPlusB.parse('\t 2n\n+\f1 \r')
+
+
+@benchmark('parse/invalid')
+def parse_invalid():
+	return lambda: _parse_all(['3n+', '', 'foo'])
+
+
+@benchmark('parse/realistic')
+def parse_realistic():
+	return lambda: _parse_all(_realistic)
+
+
+@benchmark('parse/adversarial')
+def parse_adversarial():
+	return lambda: _parse_all(_adversarial)
+
+
+@benchmark('parse/mostly_invalid')
+def parse_mostly_invalid():
+	return lambda: _parse_all(_mostly_invalid)
+
+
+@benchmark('try_parse/mostly_invalid')
+def try_parse_mostly_invalid():
+	def try_parse_all() -> None:
+		for text in _mostly_invalid:
+			ANPlusB.try_parse(text)
+	
+	return try_parse_all
+
+
+@benchmark('is_valid/mostly_invalid')
+def is_valid_mostly_invalid():
+	def validate_all() -> None:
+		for text in _mostly_invalid:
+			ANPlusB.is_valid(text)
+	
+	return validate_all
+
+
+@benchmark('parse/lazy')
+def parse_lazy():
+	# Only the first rule is ever used.
+	def create_all() -> None:
+		lazy = [LazyANPlusB(text) for text in _realistic]
+		lazy[0].instance
+	
+	return create_all
@@ -0,0 +1,49 @@
+from a_n_plus_b import ANPlusB, bitmasks
+from . import benchmark
+
+
+_batch = [population * 7 % 5_000 for population in range(500)]
+
+# Each scenario is run with every strategy and with the planner's
+# choice, which should never be much slower than the fastest one.
+_scenarios = {
+	'tiny': (ANPlusB(2, 1), [10], False),
+	'dense': (ANPlusB(2, 1), [100_000], False),
+	'sparse': (ANPlusB(5_000, 3), [100_000], False),
+	'bounded': (ANPlusB(-1, 5), [100_000], True),
+	'batch': (ANPlusB(3, 2), _batch, True),
+	'batch_sparse': (ANPlusB(997, 2), _batch, False)
+}
+
+# Too slow to be worth measuring.
+_skipped = {
+	('dense', 'range'), ('dense', 'predicate'),
+	('sparse', 'predicate'), ('bounded', 'predicate'),
+	('batch', 'predicate'), ('batch_sparse', 'predicate')
+}
+
+
+def _register(
+	name: str, instance: ANPlusB,
+	populations: list[int], from_last: bool,
+	strategy: str | None
+) -> None:
+	def setup():
+		return lambda: bitmasks(
+			instance, populations,
+			from_last = from_last,
+			strategy = strategy
+		)
+	
+	benchmark(f'planner/{name}/{strategy or "auto"}')(setup)
+
+
+for _name, (_instance, _populations, _from_last) in _scenarios.items():
+	for _strategy in ('range', 'strided', 'predicate', 'table', None):
+		if (_name, _strategy) in _skipped:
+			continue
+		
+		if _strategy == 'table' and len(_populations) == 1:
+			continue
+		
+		_register(_name, _instance, _populations, _from_last, _strategy)
@@ -0,0 +1,69 @@
+from a_n_plus_b import ANPlusB
+from . import benchmark
+
+
+_population = 1_000
+
+
+def _generic(instance: ANPlusB, from_last: bool):
+	values = instance.values()
+	population = _population
+	
+	def generic() -> int:
+		matched = 0
+		
+		for index in range(1, population + 1):
+			position = population - index + 1 if from_last else index
+			matched += position in values
+		
+		return matched
+	
+	return generic
+
+
+def _compiled(instance: ANPlusB, from_last: bool):
+	matches = instance.compile(from_last = from_last)
+	population = _population
+	
+	def compiled() -> int:
+		matched = 0
+		
+		for index in range(1, population + 1):
+			matched += matches(index, population)
+		
+		return matched
+	
+	return compiled
+
+
+def _register(
+	name: str, instance: ANPlusB,
+	from_last: bool
+) -> None:
+	benchmark(f'predicates/{name}/generic')(
+		lambda: _generic(instance, from_last)
+	)
+	benchmark(f'predicates/{name}/compiled')(
+		lambda: _compiled(instance, from_last)
+	)
+
+
+for _step_name, _instance in [
+	('positive', ANPlusB(3, -2)),
+	('offset', ANPlusB(3, 20)),
+	('negative', ANPlusB(-3, 900)),
+	('zero', ANPlusB(0, 500)),
+	('unit', ANPlusB(1, 0))
+]:
+	for _from_last in (False, True):
+		_register(
+			f'{_step_name}/{'last' if _from_last else 'first'}',
+			_instance, _from_last
+		)
+
+
+@benchmark('predicates/compile')
+def predicates_compile():
+	instance = ANPlusB(3, -2)
+	
+	return lambda: instance.compile(from_last = True)
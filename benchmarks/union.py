@@ -0,0 +1,39 @@
+from collections import deque
+
+from a_n_plus_b import ANPlusB, union
+from . import benchmark
+
+
+_population = 10_000
+
+
+def _register(name: str, patterns: list[tuple[ANPlusB, bool]]) -> None:
+	def with_set():
+		def collect() -> None:
+			indices: set[int] = set()
+			
+			for instance, from_last in patterns:
+				indices.update(instance.indices(_population, from_last = from_last))
+			
+			sorted(indices)
+		
+		return collect
+	
+	def merged():
+		return lambda: deque(union(patterns, _population), maxlen = 0)
+	
+	benchmark(f'union/{name}/set')(with_set)
+	benchmark(f'union/{name}/merged')(merged)
+
+
+_register('small_steps', [
+	(ANPlusB(3, 0), False),
+	(ANPlusB(5, 1), False),
+	(ANPlusB(-1, 4), False),
+	(ANPlusB(4, 2), True)
+])
+_register('large_steps', [
+	(ANPlusB(1009, 0), False),
+	(ANPlusB(1013, 1), False),
+	(ANPlusB(1019, 7), True)
+])
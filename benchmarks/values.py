@@ -0,0 +1,108 @@
+from array import array
+from itertools import islice
+
+from a_n_plus_b import ANPlusB
+from . import benchmark
+
+
+@benchmark('values/iterate')
+def values_iterate():
+	values = ANPlusB(3, 2).values()
+	
+	return lambda: sum(islice(values, 1000))
+
+
+@benchmark('values/getitem')
+def values_getitem():
+	values = ANPlusB(3, 2).values()
+	
+	return lambda: values[123_456]
+
+
+@benchmark('values/contains')
+def values_contains():
+	values = ANPlusB(3, 2).values()
+	
+	return lambda: 6405429723686292014 in values
+
+
+@benchmark('values/not_contains')
+def values_not_contains():
+	values = ANPlusB(3, 2).values()
+	
+	return lambda: 6405429723686292015 in values
+
+
+@benchmark('values/contains_zero_step')
+def values_contains_zero_step():
+	values = ANPlusB(0, 2).values()
+	
+	return lambda: 2 in values
+
+
+@benchmark('values/contains_non_integer')
+def values_contains_non_integer():
+	values = ANPlusB(3, 2).values()
+	
+	return lambda: 2.0 in values
+
+
+_window = (1_000_000, 1_100_000)
+_candidates = list(range(3_000_000, 3_300_000, 3))
+
+
+@benchmark('values/window/loop')
+def values_window_loop():
+	values = ANPlusB(3, 2).values()
+	
+	return lambda: array('q', [values[n] for n in range(*_window)])
+
+
+@benchmark('values/window/array')
+def values_window_array():
+	values = ANPlusB(3, 2).values()
+	
+	return lambda: values.window(*_window)
+
+
+@benchmark('values/window/buffer')
+def values_window_buffer():
+	values = ANPlusB(3, 2).values()
+	out = array('q', bytes(8 * (_window[1] - _window[0])))
+	
+	return lambda: values.window(*_window, out = out)
+
+
+@benchmark('values/contains_each/loop')
+def values_contains_each_loop():
+	values = ANPlusB(3, 2).values()
+	
+	return lambda: [candidate in values for candidate in _candidates]
+
+
+@benchmark('values/contains_each/list')
+def values_contains_each_list():
+	values = ANPlusB(3, 2).values()
+	
+	return lambda: values.contains_each(_candidates)
+
+
+try:
+	import numpy
+except ImportError:
+	pass
+else:
+	_numpy_candidates = numpy.array(_candidates)
+	
+	@benchmark('values/window/numpy')
+	def values_window_numpy():
+		values = ANPlusB(3, 2).values()
+		out = numpy.empty(_window[1] - _window[0], numpy.int64)
+		
+		return lambda: values.window(*_window, out = out)
+	
+	@benchmark('values/contains_each/numpy')
+	def values_contains_each_numpy():
+		values = ANPlusB(3, 2).values()
+		
+		return lambda: values.contains_each(_numpy_candidates)
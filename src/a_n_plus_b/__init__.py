@@ -2,7 +2,8 @@
 Toolkit for working with the An+B CSS microsyntax.
 '''
 
-from typing import Final
+from __future__ import annotations
+
 from ._a_n_plus_b import (
 	ANPlusB,
 	ComplexWithNonIntegerPart,
@@ -11,19 +12,65 @@ from ._a_n_plus_b import (
 	InputIsNotParsable,
 	InvalidNumberOfChildren,
 	InvalidOrder,
+	NotComposable,
 	ParseError
 )
+from ._complement import Complement
+
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+	from typing import Final
+	
+	from ._batch import batch_counts, batch_indices
+	from ._cursor import IndicesCursor, InvalidCursorState, InvalidNumberOfParts
+	from ._disk_cache import CorruptedCacheFile, PersistentParseCache
+	from ._dispatch import compile_rules
+	from ._filtered import FilteredChildren
+	from ._grid import Grid, InvalidGrouping, InvalidNumberOfColumns
+	from ._instrumentation import Instrumentation, instrumentation
+	from ._lazy import LazyANPlusB
+	from ._memo import IndicesCache, InvalidCacheSize
+	from ._minify import minify, minify_stylesheet
+	from ._planner import bitmask, bitmasks, InvalidStrategy, plan, Plan
+	from ._service import Service, ServiceClient, ServiceError
+	from ._simplify import simplify
+	from ._synthesis import IndexOutOfRange, from_indices
+	from ._union import union
+	from ._vectorized import BufferTooSmall, UnsupportedDType, ValueTooLarge
 
 
 __all__ = [  # noqa: RUF022
-	'ANPlusB', 'n',
+	'ANPlusB', 'n', 'Complement', 'LazyANPlusB', 'FilteredChildren',
+	'IndicesCursor', 'IndicesCache', 'Grid',
+	'batch_counts', 'batch_indices',
+	'compile_rules', 'from_indices', 'simplify', 'union',
+	'minify', 'minify_stylesheet',
+	'bitmask', 'bitmasks', 'plan', 'Plan',
+	'Instrumentation', 'instrumentation',
+	'BufferTooSmall',
 	'ComplexWithNonIntegerPart',
 	'EmptyInput',
 	'IncorrectUseOfConstructor',
+	'IndexOutOfRange',
 	'InputIsNotParsable',
+	'InvalidCacheSize',
+	'InvalidCursorState',
+	'InvalidGrouping',
 	'InvalidNumberOfChildren',
+	'InvalidNumberOfColumns',
+	'InvalidNumberOfParts',
 	'InvalidOrder',
-	'ParseError'
+	'InvalidStrategy',
+	'NotComposable',
+	'ParseError',
+	'PersistentParseCache', 'CorruptedCacheFile',
+	'Service',
+	'ServiceClient',
+	'ServiceError',
+	'UnsupportedDType',
+	'ValueTooLarge'
 ]
 
 
@@ -31,3 +78,61 @@ n: Final = ANPlusB(1, 0)
 '''
 Helper object for creating :class:`ANPlusB` instances.
 '''
+
+
+# Features with expensive dependencies are only
+# imported when they are first accessed.
+_lazy_exports = {
+	'batch_counts': '_batch',
+	'batch_indices': '_batch',
+	'bitmask': '_planner',
+	'bitmasks': '_planner',
+	'BufferTooSmall': '_vectorized',
+	'compile_rules': '_dispatch',
+	'CorruptedCacheFile': '_disk_cache',
+	'FilteredChildren': '_filtered',
+	'from_indices': '_synthesis',
+	'Grid': '_grid',
+	'IndexOutOfRange': '_synthesis',
+	'Instrumentation': '_instrumentation',
+	'IndicesCache': '_memo',
+	'IndicesCursor': '_cursor',
+	'instrumentation': '_instrumentation',
+	'InvalidCacheSize': '_memo',
+	'InvalidCursorState': '_cursor',
+	'InvalidGrouping': '_grid',
+	'InvalidNumberOfColumns': '_grid',
+	'InvalidNumberOfParts': '_cursor',
+	'InvalidStrategy': '_planner',
+	'LazyANPlusB': '_lazy',
+	'minify': '_minify',
+	'minify_stylesheet': '_minify',
+	'PersistentParseCache': '_disk_cache',
+	'plan': '_planner',
+	'Plan': '_planner',
+	'Service': '_service',
+	'ServiceClient': '_service',
+	'ServiceError': '_service',
+	'simplify': '_simplify',
+	'union': '_union',
+	'UnsupportedDType': '_vectorized',
+	'ValueTooLarge': '_vectorized'
+}
+
+
+def __getattr__(name: str) -> object:
+	if name not in _lazy_exports:
+		message = f'module {__name__!r} has no attribute {name!r}'
+		raise AttributeError(message)
+	
+	from importlib import import_module  # noqa: PLC0415
+	
+	module = import_module(f'.{_lazy_exports[name]}', __name__)
+	value = getattr(module, name)
+	globals()[name] = value
+	
+	return value
+
+
+def __dir__() -> list[str]:
+	return sorted({*globals(), *__all__})
@@ -0,0 +1,324 @@
+'''
+Command-line interface: ``python -m a_n_plus_b``.
+
+Reads newline-delimited ``<An+B>`` strings from standard input
+or from the given files and writes one result per input line.
+'''
+
+import argparse
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from struct import Struct
+from typing import BinaryIO
+
+from ._a_n_plus_b import ANPlusB
+from ._progressions import length, matched_positions
+
+
+_INVALID = '!'
+
+_BATCH_SIZE = 1 << 14
+_READ_HINT = 1 << 20
+
+_VALID = 1
+_OUT_OF_RANGE = 2
+
+_int64_range = range(-(1 << 63), 1 << 63)
+
+_flag = Struct('<B')
+_int64 = Struct('<q')
+_pair = Struct('<Bqq')
+
+
+@dataclass(frozen = True, slots = True)
+class _Options:
+	mode: str
+	population: int
+	from_last: bool
+	order: str
+	binary: bool
+
+
+def _parse(line: bytes, /) -> ANPlusB | None:
+	return ANPlusB.try_parse(line.decode('utf-8', 'replace'))
+
+
+def _normalize_text(instance: ANPlusB | None, _options: _Options) -> str:
+	return _INVALID if instance is None else str(instance)
+
+
+def _validate_text(instance: ANPlusB | None, _options: _Options) -> str:
+	return '0' if instance is None else '1'
+
+
+def _indices_text(instance: ANPlusB | None, options: _Options) -> str:
+	if instance is None:
+		return _INVALID
+	
+	indices = instance.indices(
+		options.population,
+		from_last = options.from_last,
+		order = options.order
+	)
+	
+	return ' '.join(map(str, indices))
+
+
+def _count_text(instance: ANPlusB | None, options: _Options) -> str:
+	if instance is None:
+		return _INVALID
+	
+	return str(_count(instance, options))
+
+
+def _count(instance: ANPlusB, options: _Options) -> int:
+	positions = matched_positions(
+		instance.step, instance.offset,
+		options.population
+	)
+	
+	return length(positions)
+
+
+def _normalize_binary(instance: ANPlusB | None, _options: _Options) -> bytes:
+	if instance is None:
+		return _pair.pack(0, 0, 0)
+	
+	step, offset = instance.step, instance.offset
+	
+	if step not in _int64_range or offset not in _int64_range:
+		return _pair.pack(_OUT_OF_RANGE, 0, 0)
+	
+	return _pair.pack(_VALID, step, offset)
+
+
+def _validate_binary(instance: ANPlusB | None, _options: _Options) -> bytes:
+	return _flag.pack(instance is not None)
+
+
+def _indices_binary(instance: ANPlusB | None, options: _Options) -> bytes:
+	if instance is None:
+		return _int64.pack(-1)
+	
+	indices = list(instance.indices(
+		options.population,
+		from_last = options.from_last,
+		order = options.order
+	))
+	
+	return Struct(f'<q{len(indices)}q').pack(len(indices), *indices)
+
+
+def _count_binary(instance: ANPlusB | None, options: _Options) -> bytes:
+	if instance is None:
+		return _int64.pack(-1)
+	
+	return _int64.pack(_count(instance, options))
+
+
+_text_formatters: dict[str, Callable[[ANPlusB | None, _Options], str]] = {
+	'normalize': _normalize_text,
+	'validate': _validate_text,
+	'indices': _indices_text,
+	'count': _count_text
+}
+
+_binary_formatters: dict[str, Callable[[ANPlusB | None, _Options], bytes]] = {
+	'normalize': _normalize_binary,
+	'validate': _validate_binary,
+	'indices': _indices_binary,
+	'count': _count_binary
+}
+
+
+def _process(batch: list[bytes], options: _Options) -> bytes:
+	'''
+	Turn a batch of input lines into a single chunk of output.
+	'''
+	
+	instances = map(_parse, batch)
+	
+	if options.binary:
+		binary_formatter = _binary_formatters[options.mode]
+		
+		return b''.join(
+			binary_formatter(instance, options) for instance in instances
+		)
+	
+	text_formatter = _text_formatters[options.mode]
+	lines = [text_formatter(instance, options) for instance in instances]
+	lines.append('')
+	
+	return '\n'.join(lines).encode('utf-8')
+
+
+def _lines(stream: BinaryIO, /) -> Iterator[bytes]:
+	while lines := stream.readlines(_READ_HINT):
+		yield from lines
+
+
+def _batches(lines: Iterable[bytes], /) -> Iterator[list[bytes]]:
+	iterator = iter(lines)
+	
+	while batch := list(islice(iterator, _BATCH_SIZE)):
+		yield batch
+
+
+def _open_all(paths: Sequence[str], stdin: BinaryIO, /) -> Iterator[bytes]:
+	for path in paths:
+		if path == '-':
+			yield from _lines(stdin)
+			continue
+		
+		with Path(path).open('rb') as file:
+			yield from _lines(file)
+
+
+def _process_in_parallel(
+	batches: Iterable[list[bytes]],
+	options: _Options,
+	workers: int
+) -> Iterator[bytes]:
+	'''
+	Process batches in worker processes, yielding their outputs
+	in input order while keeping only a few batches in flight.
+	'''
+	
+	pending: deque[Future[bytes]] = deque()
+	
+	with ProcessPoolExecutor(workers) as executor:
+		for batch in batches:
+			pending.append(executor.submit(_process, batch, options))
+			
+			if len(pending) > workers * 2:
+				yield pending.popleft().result()
+		
+		while pending:
+			yield pending.popleft().result()
+
+
+def _population(value: str, /) -> int:
+	population = int(value)
+	
+	if population < 0:
+		message = f'expected a non-negative number, got: {value!r}'
+		raise argparse.ArgumentTypeError(message)
+	
+	return population
+
+
+def _argument_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(
+		prog = 'python -m a_n_plus_b',
+		description = (
+			'Process newline-delimited <An+B> strings. '
+			f'Invalid lines are written as {_INVALID!r} in text mode.'
+		)
+	)
+	
+	parser.add_argument(
+		'mode', choices = ['normalize', 'validate', 'indices', 'count'],
+		help = 'what to output for each line'
+	)
+	parser.add_argument(
+		'files', nargs = '*', default = ['-'], metavar = 'FILE',
+		help = 'input files; "-" or nothing means standard input'
+	)
+	parser.add_argument(
+		'-p', '--population', type = _population, default = 0,
+		help = 'number of children, used by "indices" and "count"'
+	)
+	parser.add_argument(
+		'--from-last', action = 'store_true',
+		help = 'count indices from the last child'
+	)
+	parser.add_argument(
+		'--order', choices = ['ascending', 'descending', 'default'],
+		default = 'default',
+		help = 'order of the indices written by "indices"'
+	)
+	parser.add_argument(
+		'-b', '--binary', action = 'store_true',
+		help = 'write little-endian binary records instead of text'
+	)
+	parser.add_argument(
+		'-j', '--workers', type = int, default = 1,
+		help = 'number of worker processes'
+	)
+	
+	return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+	'''
+	Run the command-line interface.
+	
+	Binary records are, per input line:
+	
+	* ``normalize``: A validity byte, ``step`` and ``offset``.
+	* ``validate``: A validity byte.
+	* ``indices``: The number of indices, then the indices.
+	* ``count``: The number of indices.
+	
+	All numbers are little-endian signed 64-bit integers.
+	For invalid lines, the number of indices is ``-1``.
+	The validity byte is ``0`` for invalid lines and ``1`` for
+	valid ones, or ``2`` if the ``step`` or the ``offset`` does not
+	fit in 64 bits, in which case both are written as ``0``.
+	In binary mode, the population must fit in 64 bits.
+	
+	:param argv: The arguments, not including the program name.
+	:return: The exit status.
+	:raise SystemExit: \
+		With status ``2`` if the arguments are invalid,
+		or ``1`` if an input file cannot be read.
+	'''
+	
+	parser = _argument_parser()
+	arguments = parser.parse_intermixed_args(argv)
+	
+	if arguments.binary and arguments.population not in _int64_range:
+		parser.error('the population must fit in 64 bits in binary mode')
+	
+	options = _Options(
+		mode = arguments.mode,
+		population = arguments.population,
+		from_last = arguments.from_last,
+		order = arguments.order,
+		binary = arguments.binary
+	)
+	
+	stdout = sys.stdout.buffer
+	batches = _batches(_open_all(arguments.files, sys.stdin.buffer))
+	
+	try:
+		if arguments.workers <= 1:
+			for batch in batches:
+				stdout.write(_process(batch, options))
+		
+		else:
+			stdout.writelines(
+				_process_in_parallel(batches, options, arguments.workers)
+			)
+	
+	except OSError as error:
+		# Only errors from reading an input file have a file name.
+		if error.filename is None:
+			raise
+		
+		message = f'{parser.prog}: error: {error.filename}: {error.strerror}'
+		stdout.flush()
+		parser.exit(1, f'{message}\n')
+	
+	stdout.flush()
+	
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
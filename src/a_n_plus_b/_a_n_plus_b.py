@@ -2,31 +2,39 @@
 The main feature of the package: :class:`ANPlusB`.
 '''
 
-import math
-from collections.abc import Iterator
-from itertools import count
-from typing import Any, Literal, Self, overload
-
-from ._grammar import a_n_plus_b, integer, Regex, whitespace
+from __future__ import annotations
 
-_surrounding_whitespace = Regex(fr'\A{whitespace}+|{whitespace}+\Z')
+from itertools import count
 
+from ._complement import Complement
+from ._grammar import (
+	a_n_plus_b,
+	is_integer,
+	normalize,
+	remove_whitespace,
+	selector_separator
+)
+from ._predicates import compile_predicate
+from ._progressions import matched_indices, matched_positions
+from ._relations import (
+	composition,
+	intersection,
+	is_subset,
+	positions,
+	to_pattern,
+	universe
+)
 
-def _normalize(text: str, /) -> str:
-	'''
-	Strip surrounding whitespace and
-	convert ``text`` to lowercase.
-	'''
-	
-	return _surrounding_whitespace.sub('', text).lower()
 
+TYPE_CHECKING = False
 
-def _remove_whitespace(text: str, /) -> str:
-	'''
-	Remove all whitespace.
-	'''
+if TYPE_CHECKING:
+	from array import array
+	from collections.abc import Buffer, Iterable, Iterator, Sequence
+	from typing import Literal, Self, overload
 	
-	return whitespace.sub('', text)
+	from ._predicates import Predicate
+	from ._vectorized import NDArray
 
 
 def _is_integer(value: float, /) -> bool:
@@ -43,7 +51,7 @@ class IncorrectUseOfConstructor(TypeError):
 	is passed a single :class:`str` argument.
 	'''
 	
-	def __init__(self, cls: type['ANPlusB'], /) -> None:
+	def __init__(self, cls: type[ANPlusB], /) -> None:
 		'''
 		:param cls: The class whose main constructor was called.
 		'''
@@ -133,11 +141,28 @@ class ComplexWithNonIntegerPart(ValueError):
 		)
 
 
+class NotComposable(ValueError):
+	'''
+	Raised when the composition computed by :meth:`ANPlusB.compose`
+	cannot be expressed as a single ``ANPlusB`` object.
+	'''
+	
+	def __init__(self, outer: ANPlusB, inner: ANPlusB, /) -> None:
+		'''
+		:param outer: The pattern :meth:`ANPlusB.compose` was called on.
+		:param inner: The pattern passed to :meth:`ANPlusB.compose`.
+		'''
+		
+		super().__init__(
+			f'{outer} of {inner} cannot be expressed as a single pattern'
+		)
+
+
 class _InfiniteRange:
 	'''
 	Representation of all possible values
 	an :class:`ANPlusB` instance may yield.
-
+	
 	Basically a thin wrapper around :class:`count`,
 	providing a :class:`Sequence`-like interface.
 	There is no ``__len__`` method, since ``len()``
@@ -197,6 +222,76 @@ class _InfiniteRange:
 		quotient, remainder = divmod(item - self._start, self._step)
 		
 		return quotient >= 0 and remainder == 0
+	
+	if TYPE_CHECKING:
+		@overload
+		def window(self, start: int, stop: int, /) -> array[int]:
+			...
+		
+		@overload
+		def window[B: Buffer](
+			self, start: int, stop: int, /, *,
+			out: B
+		) -> B:
+			...
+	
+	def window(
+		self, start: int, stop: int, /, *,
+		out: Buffer | NDArray | None = None
+	) -> array[int] | Buffer | NDArray:
+		r'''
+		Get the values from index ``start`` inclusive
+		to index ``stop`` exclusive all at once,
+		as 64-bit integers.
+		
+		By default, they are returned as a new :class:`array.array`.
+		If ``out`` is given, they are written at the start of it
+		instead and ``out`` itself is returned. ``out`` may be any
+		writable buffer, such as an :class:`array.array`,
+		a :class:`bytearray` or a NumPy array of 64-bit integers.
+		
+		:param start: The index of the first value.
+		:param stop: The index after the last value.
+		:param out: A buffer to write the values into.
+		:raise IndexError: If ``start`` is negative.
+		:raise ValueTooLarge: If a value does not fit in 64 bits.
+		:raise BufferTooSmall: If ``out`` cannot hold every value.
+		:raise UnsupportedDType: \
+			If ``out`` is a NumPy array not of 64-bit integers.
+		'''
+		
+		from ._vectorized import window  # noqa: PLC0415
+		
+		return window(self._start, self._step, start, stop, out = out)
+	
+	if TYPE_CHECKING:
+		@overload
+		def contains_each(
+			self, items: Sequence[int] | array[int], /
+		) -> list[bool]:
+			...
+		
+		@overload
+		def contains_each(self, items: NDArray, /) -> NDArray:
+			...
+	
+	def contains_each(
+		self, items: Iterable[int] | NDArray, /
+	) -> list[bool] | NDArray:
+		'''
+		Check whether each of ``items`` is a possible value,
+		as a list of booleans, or as a boolean NumPy array
+		if ``items`` is a NumPy array.
+		
+		:param items: The integers to check.
+		:raise TypeError: If an item is not an integer.
+		:raise UnsupportedDType: \
+			If ``items`` is a NumPy array not of integers.
+		'''
+		
+		from ._vectorized import contains_each  # noqa: PLC0415
+		
+		return contains_each(self._start, self._step, items)
 
 
 class ANPlusB:
@@ -210,20 +305,21 @@ class ANPlusB:
 	_step: int
 	_offset: int
 	
-	@overload
-	def __new__(cls, offset: int, /) -> Self:
-		...
-	
-	@overload
-	def __new__(cls, step: int, offset: int, /) -> Self:
-		...
+	if TYPE_CHECKING:
+		@overload
+		def __new__(cls, offset: int, /) -> Self:
+			...
+		
+		@overload
+		def __new__(cls, step: int, offset: int, /) -> Self:
+			...
 	
 	def __new__(cls, step: int, offset: int | None = None, /) -> Self:
 		'''
 		If only one argument is passed, that argument would be
 		interpreted as ``offset`` and ``step`` would be ``0``.
 		That is, ``ANPlusB(3)`` is the same as ``ANPlusB(0, 3)``.
-
+		
 		:param step: The step, also known as ``a``.
 		:param offset: The offset, also known as ``b``.
 		'''
@@ -341,6 +437,9 @@ class ANPlusB:
 	def __hash__(self) -> int:
 		return hash((self._step, self._offset))
 	
+	def __getnewargs__(self) -> tuple[int, int]:
+		return self._step, self._offset
+	
 	@property
 	def step(self) -> int:
 		'''
@@ -364,38 +463,16 @@ class ANPlusB:
 	) -> Iterator[int]:
 		a, b = self._step, self._offset
 		
-		if population == 0:
-			return
-		
 		if a <= 0 and b <= 0:
 			return
 		
 		if a == 0:
-			index = population - b + 1 if from_last else b
-			yield from [index] if 1 <= index <= population else []
-			return
-		
-		if a < 0:
-			# 0 -> an -> -inf | 0 -> n -> inf
-			#
-			# n min <=> an + b max <=> n = 0 <=> an + b = b
-			
-			start = b
-			stop = 0
-		
-		else:
-			# (a > 0)
-			# 1 <= an + b <= p
-			# 1 - b <= an <= p - b
-			#
-			# n min <=> an = 1 - b <=> n = (1 - b) / a
-			
-			min_n = max(0, math.ceil((1 - b) / a))
+			if 1 <= b <= population:
+				yield population - b + 1 if from_last else b
 			
-			start = a * min_n + b
-			stop = population + 1
+			return
 		
-		indices: Any = range(start, stop, a)
+		positions = matched_positions(a, b, population)
 		default_order = 'descending' if a < 0 else 'ascending'
 		
 		if order == 'default':
@@ -406,26 +483,27 @@ class ANPlusB:
 			reverse_order = not from_last
 		
 		if reverse_order:
-			indices = reversed(indices)
+			positions = positions[::-1]
 		
-		for index in indices:
+		for index in positions:
 			yield population - index + 1 if from_last else index
 	
-	@overload
-	def indices(
-		self, population: int, *,
-		from_last: Literal[False] = ...,
-		order: Literal['ascending', 'descending', 'default'] = 'default'
-	) -> Iterator[int]:
-		...
-	
-	@overload
-	def indices(
-		self, population: int, *,
-		from_last: bool = False,
-		order: str
-	) -> Iterator[int]:
-		...
+	if TYPE_CHECKING:
+		@overload
+		def indices(
+			self, population: int, *,
+			from_last: Literal[False] = ...,
+			order: Literal['ascending', 'descending', 'default'] = 'default'
+		) -> Iterator[int]:
+			...
+		
+		@overload
+		def indices(
+			self, population: int, *,
+			from_last: bool = False,
+			order: str
+		) -> Iterator[int]:
+			...
 	
 	def indices(
 		self, population: int, *,
@@ -438,7 +516,7 @@ class ANPlusB:
 		pseudo-class whose argument is the serialization of
 		this ``ANPlusB`` object would match if it were to be
 		applied to an element with ``population`` children.
-
+		
 		:param population: The number of children.
 		:param from_last: Whether to start from the last index.
 		:param order: \
@@ -461,6 +539,163 @@ class ANPlusB:
 			order = order
 		)
 	
+	def complement(
+		self, population: int, *,
+		from_last: bool = False,
+		order: str = 'default'
+	) -> Complement:
+		'''
+		Return a lazy view of the 1-based indices of the children
+		that :meth:`indices` would *not* yield for ``population``,
+		as in ``:not(:nth-child())``.
+		
+		The view supports :func:`len` and ``in``
+		in constant time, as well as :func:`reversed`.
+		
+		:param population: The number of children.
+		:param from_last: Whether to count indices from the last one.
+		:param order: \
+			The order in which to yield the indices.
+			``ascending`` means the first index yielded will be the smallest.
+			``descending`` means the first index yielded will be the greatest.
+			``default`` means ``descending`` if ``from_last`` is true,
+			and ``ascending`` otherwise.
+		:raise InvalidOrder: If ``order`` is not one of the above.
+		:raise InvalidNumberOfChildren: If ``population`` is negative.
+		'''
+		
+		if order not in ('ascending', 'descending', 'default'):
+			raise InvalidOrder(order)
+		
+		if population < 0:
+			raise InvalidNumberOfChildren(population)
+		
+		matched = matched_indices(
+			self._step, self._offset, population,
+			from_last = from_last
+		)
+		descending = from_last if order == 'default' else order == 'descending'
+		
+		return Complement(matched, population, descending = descending)
+	
+	def _positions(
+		self, other: ANPlusB, population: int | None, /
+	) -> tuple[range, range]:
+		patterns = [(self._step, self._offset), (other._step, other._offset)]
+		
+		if population is None:
+			population = universe(patterns)
+		elif population < 0:
+			raise InvalidNumberOfChildren(population)
+		
+		this, that = patterns
+		
+		return positions(this, population), positions(that, population)
+	
+	def is_subset(self, other: ANPlusB, population: int | None = None) -> bool:
+		'''
+		Check whether every child matched by this ``ANPlusB`` object
+		is also matched by ``other``.
+		
+		Both patterns are assumed to count children from the same end.
+		The check takes logarithmic time, regardless of the population.
+		
+		:param other: The pattern to compare against.
+		:param population: \
+			The number of children. If not given,
+			the check holds for any number of children.
+		:raise InvalidNumberOfChildren: If ``population`` is negative.
+		'''
+		
+		return is_subset(*self._positions(other, population))
+	
+	def is_disjoint(
+		self, other: ANPlusB, population: int | None = None
+	) -> bool:
+		'''
+		Check whether no child is matched by
+		both this ``ANPlusB`` object and ``other``.
+		
+		Both patterns are assumed to count children from the same end.
+		The check takes logarithmic time, regardless of the population.
+		
+		:param other: The pattern to compare against.
+		:param population: \
+			The number of children. If not given,
+			the check holds for any number of children.
+		:raise InvalidNumberOfChildren: If ``population`` is negative.
+		'''
+		
+		return not intersection(*self._positions(other, population))
+	
+	def is_equivalent(
+		self, other: ANPlusB, population: int | None = None
+	) -> bool:
+		'''
+		Check whether this ``ANPlusB`` object and ``other``
+		match exactly the same children.
+		
+		Unlike ``==``, this compares matched children rather than
+		steps and offsets: ``-n+3`` and ``n`` are equivalent
+		for 3 children, while ``2n`` and ``2n+2`` always are.
+		
+		:param other: The pattern to compare against.
+		:param population: \
+			The number of children. If not given,
+			the check holds for any number of children.
+		:raise InvalidNumberOfChildren: If ``population`` is negative.
+		'''
+		
+		this, that = self._positions(other, population)
+		
+		return this == that
+	
+	def compose(self, inner: ANPlusB, population: int | None = None) -> Self:
+		'''
+		Return an ``ANPlusB`` object matching the children this one
+		would match if only those matched by ``inner`` were counted,
+		as in ``:nth-child(self of :nth-child(inner))``.
+		
+		For example, ``3n`` composed with ``2n+1`` is ``6n+5``:
+		every third child among the odd ones. Compositions can be
+		nested, so that selections of selections are evaluated
+		as a single progression.
+		
+		:param inner: The pattern selecting the children to count.
+		:param population: \
+			The number of children. If not given, the result
+			is equivalent for any number of children.
+		:raise InvalidNumberOfChildren: If ``population`` is negative.
+		:raise NotComposable: \
+			If the matched children are bounded on both ends
+			in a way no single ``ANPlusB`` object can express,
+			such as ``-n+3`` composed with ``n+5``.
+		'''
+		
+		outer_pattern = (self._step, self._offset)
+		inner_pattern = (inner._step, inner._offset)
+		
+		if population is None:
+			# Large enough for every bounded composition to end,
+			# followed by a gap longer than its step, and for
+			# every unbounded one to match at least twice.
+			a, b = inner_pattern
+			c, d = outer_pattern
+			bound = abs(b) + abs(a) * (abs(c) + abs(d) + 1) + 1
+			population = 2 * bound + abs(a * c) + 1
+		elif population < 0:
+			raise InvalidNumberOfChildren(population)
+		
+		matched = composition(outer_pattern, inner_pattern, population)
+		
+		if not matched:
+			return self.__class__(0, 0)
+		
+		if (pattern := to_pattern(matched, population)) is None:
+			raise NotComposable(self, inner)
+		
+		return self.__class__(*pattern)
+	
 	def values(self) -> _InfiniteRange:
 		'''
 		Return an iterable that yield possible values
@@ -469,25 +704,33 @@ class ANPlusB:
 		
 		return _InfiniteRange(self._offset, self._step)
 	
-	@classmethod
-	def parse(cls, text: str, /) -> Self:
+	def compile(self, *, from_last: bool = False) -> Predicate:
 		'''
-		Parse the given text and return an ``ANPlusB`` instance.
+		Return a function that takes an index and a population
+		and tells whether that index would be yielded by
+		:meth:`indices` for that population.
 		
-		Surrounding whitespace (spaces, tabs, carriage returns,
-		newlines, form feeds) are tolerated.
-		However, there must be no whitespace between
-		the digits of ``a`` (or ``n``) and its sign, if any.
+		The function is specialized for this ``ANPlusB`` object,
+		making it much cheaper to call repeatedly than
+		:meth:`indices` or :meth:`values`. It does not validate
+		its arguments: indices out of range simply do not match.
 		
-		:param text: The text to parse.
-		:raise EmptyInput: If the input is empty or only contains whitespace.
-		:raise InputIsNotParsable: If the text is not parsable.
+		:param from_last: Whether to count indices from the last one.
 		'''
 		
-		text = _normalize(text)
-		
-		if not text:
-			raise EmptyInput
+		return compile_predicate(
+			self._step, self._offset,
+			from_last = from_last
+		)
+	
+	@classmethod
+	def _from_normalized(cls, text: str, /) -> Self | None:
+		'''
+		The engine shared by :meth:`parse`, :meth:`try_parse`
+		and :meth:`is_valid`. ``text`` must be normalized and
+		non-empty; ``None`` is returned if it is not parsable,
+		so that no exception is ever created.
+		'''
 		
 		if text == 'even':
 			return cls(2, 0)
@@ -495,15 +738,15 @@ class ANPlusB:
 		if text == 'odd':
 			return cls(2, 1)
 		
-		if integer.fullmatch(text):
+		if is_integer(text):
 			return cls(int(text))
 		
 		match = a_n_plus_b.fullmatch(text)
 		
 		if not match:
-			raise InputIsNotParsable(text)
+			return None
 		
-		a, b = match['a'], _remove_whitespace(match['b'] or '')
+		a, b = match['a'], remove_whitespace(match['b'] or '')
 		
 		if not a:
 			step = 0
@@ -518,11 +761,105 @@ class ANPlusB:
 		
 		return cls(step, offset)
 	
+	@classmethod
+	def parse(cls, text: str, /) -> Self:
+		'''
+		Parse the given text and return an ``ANPlusB`` instance.
+		
+		Surrounding whitespace (spaces, tabs, carriage returns,
+		newlines, form feeds) are tolerated.
+		However, there must be no whitespace between
+		the digits of ``a`` (or ``n``) and its sign, if any.
+		
+		:param text: The text to parse.
+		:raise EmptyInput: If the input is empty or only contains whitespace.
+		:raise InputIsNotParsable: If the text is not parsable.
+		'''
+		
+		text = normalize(text)
+		
+		if not text:
+			raise EmptyInput
+		
+		instance = cls._from_normalized(text)
+		
+		if instance is None:
+			raise InputIsNotParsable(text)
+		
+		return instance
+	
+	@classmethod
+	def parse_with_selector(cls, text: str, /) -> tuple[Self, int | None]:
+		'''
+		Parse the argument of ``:nth-child()`` or ``:nth-last-child()``,
+		which may end with ``of <selector>``.
+		
+		The selector itself is not parsed; instead, the position
+		at which it starts in ``text`` is returned along with the
+		``ANPlusB`` instance, or ``None`` if there is no selector.
+		
+		>>> ANPlusB.parse_with_selector('2n+1 of li.item')
+		(ANPlusB(2n+1), 8)
+		
+		:param text: The text to parse.
+		:raise EmptyInput: If the ``<an+b>`` part is empty.
+		:raise InputIsNotParsable: \
+			If the ``<an+b>`` part is not parsable
+			or the selector is empty.
+		'''
+		
+		match = selector_separator.search(text)
+		
+		if match is None:
+			return cls.parse(text), None
+		
+		if not normalize(text[match.end():]):
+			raise InputIsNotParsable(normalize(text))
+		
+		return cls.parse(text[:match.start()]), match.end()
+	
+	@classmethod
+	def try_parse(cls, text: str, /) -> Self | None:
+		'''
+		Same as :meth:`parse`, but return ``None`` instead of
+		raising an exception if the text is empty or not parsable.
+		
+		No exception object is created for invalid inputs,
+		which makes this much cheaper than catching the errors
+		raised by :meth:`parse` when most inputs are invalid.
+		
+		:param text: The text to parse.
+		'''
+		
+		text = normalize(text)
+		
+		if not text:
+			return None
+		
+		return cls._from_normalized(text)
+	
+	@staticmethod
+	def is_valid(text: str, /) -> bool:
+		'''
+		Check whether :meth:`parse` would accept the given text,
+		without creating an ``ANPlusB`` instance or an exception.
+		
+		:param text: The text to check.
+		'''
+		
+		text = normalize(text)
+		
+		return (
+			text in ('even', 'odd')
+			or is_integer(text)
+			or a_n_plus_b.fullmatch(text) is not None
+		)
+	
 	@classmethod
 	def from_complex(cls, value: complex, /) -> Self:
 		'''
 		Convert a complex number to an ``ANPlusB`` instance.
-
+		
 		For readability, ``value`` should be written in the form ``2j + 3``.
 		'''
 		
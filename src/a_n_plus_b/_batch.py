@@ -0,0 +1,203 @@
+'''
+Evaluation of one pattern over many populations at once.
+
+Results are laid out as in compressed sparse row matrices:
+the indices for all populations are concatenated into one
+flat buffer, and the indices for the ``i``-th population
+are ``indices[offsets[i]:offsets[i + 1]]``.
+
+NumPy is used if, and only if, the populations are given as
+a NumPy array; it is never imported by this module. Otherwise,
+results are :class:`array.array` objects of 64-bit integers.
+'''
+
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import accumulate
+from types import ModuleType
+from typing import overload
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren, InvalidOrder
+from ._progressions import length, matched_positions, ordered_indices
+from ._vectorized import NDArray, numpy_for
+
+
+def _validated(populations: Iterable[int], /) -> list[int]:
+	populations = [int(population) for population in populations]
+	
+	for population in populations:
+		if population < 0:
+			raise InvalidNumberOfChildren(population)
+	
+	return populations
+
+
+def _counts_with_numpy(
+	numpy: ModuleType,
+	step: int, offset: int,
+	populations: NDArray, /
+) -> NDArray:
+	'''
+	Same as ``len(matched_positions(step, offset, population))``
+	for every population, computed using NumPy.
+	'''
+	
+	a, b = step, offset
+	populations = populations.astype(numpy.int64)
+	
+	if populations.size and (smallest := populations.min()) < 0:
+		raise InvalidNumberOfChildren(int(smallest))
+	
+	if a == 0:
+		return (populations >= b).astype(numpy.int64) * (b >= 1)
+	
+	if a > 0:
+		first = a * max(0, -((b - 1) // a)) + b
+		
+		return numpy.maximum(0, (populations - first) // a + 1)
+	
+	# Positions from b down to 1, less those above the population.
+	if b < 1:
+		return numpy.zeros_like(populations)
+	
+	total = (b - 1) // -a + 1
+	above = numpy.where(
+		populations < b,
+		(b - populations - 1) // -a + 1,
+		0
+	)
+	
+	return numpy.maximum(0, total - above)
+
+
+@overload
+def batch_counts(
+	pattern: ANPlusB,
+	populations: Sequence[int] | array[int], /
+) -> array[int]:
+	...
+
+
+@overload
+def batch_counts(pattern: ANPlusB, populations: NDArray, /) -> NDArray:
+	...
+
+
+def batch_counts(
+	pattern: ANPlusB,
+	populations: Iterable[int] | NDArray, /
+) -> array[int] | NDArray:
+	'''
+	Return the number of indices :meth:`ANPlusB.indices`
+	would yield for each population, in closed form.
+	
+	:param pattern: The pattern to evaluate.
+	:param populations: \
+		The numbers of children, as any iterable or a NumPy array,
+		in which case a NumPy array is returned.
+	:raise InvalidNumberOfChildren: If a population is negative.
+	'''
+	
+	step, offset = pattern.step, pattern.offset
+	
+	if (numpy := numpy_for(populations)) is not None:
+		return _counts_with_numpy(numpy, step, offset, populations)
+	
+	return array('q', [
+		length(matched_positions(step, offset, population))
+		for population in _validated(populations)
+	])
+
+
+def _indices_with_numpy(
+	numpy: ModuleType,
+	sequences: list[range], /
+) -> tuple[NDArray, NDArray]:
+	'''
+	Expand the sequences into a flat buffer without
+	iterating over their elements in Python.
+	'''
+	
+	starts = numpy.array([indices.start for indices in sequences], numpy.int64)
+	steps = numpy.array([indices.step for indices in sequences], numpy.int64)
+	counts = numpy.array([len(indices) for indices in sequences], numpy.int64)
+	
+	offsets = numpy.zeros(len(sequences) + 1, numpy.int64)
+	numpy.cumsum(counts, out = offsets[1:])
+	
+	ranks = numpy.arange(offsets[-1], dtype = numpy.int64)
+	ranks -= numpy.repeat(offsets[:-1], counts)
+	indices = numpy.repeat(starts, counts) + ranks * numpy.repeat(steps, counts)
+	
+	return indices, offsets
+
+
+@overload
+def batch_indices(
+	pattern: ANPlusB,
+	populations: Sequence[int] | array[int], /, *,
+	from_last: bool = False,
+	order: str = 'default'
+) -> tuple[array[int], array[int]]:
+	...
+
+
+@overload
+def batch_indices(
+	pattern: ANPlusB,
+	populations: NDArray, /, *,
+	from_last: bool = False,
+	order: str = 'default'
+) -> tuple[NDArray, NDArray]:
+	...
+
+
+def batch_indices(
+	pattern: ANPlusB,
+	populations: Iterable[int] | NDArray, /, *,
+	from_last: bool = False,
+	order: str = 'default'
+) -> tuple[array[int], array[int]] | tuple[NDArray, NDArray]:
+	'''
+	Return the indices :meth:`ANPlusB.indices` would yield
+	for each population, as a flat buffer and offsets into it.
+	
+	The indices for the ``i``-th population are
+	``indices[offsets[i]:offsets[i + 1]]``, in the same
+	order as they would be yielded by :meth:`ANPlusB.indices`.
+	
+	:param pattern: The pattern to evaluate.
+	:param populations: \
+		The numbers of children, as any iterable or a NumPy array,
+		in which case NumPy arrays are returned.
+	:param from_last: Same as for :meth:`ANPlusB.indices`.
+	:param order: Same as for :meth:`ANPlusB.indices`.
+	:raise InvalidOrder: If ``order`` is not valid.
+	:raise InvalidNumberOfChildren: If a population is negative.
+	'''
+	
+	if order not in ('ascending', 'descending', 'default'):
+		raise InvalidOrder(order)
+	
+	numpy = numpy_for(populations)
+	sequences = [
+		ordered_indices(
+			pattern.step, pattern.offset, population,
+			from_last = from_last,
+			order = order
+		)
+		for population in _validated(populations)
+	]
+	
+	if numpy is not None:
+		return _indices_with_numpy(numpy, sequences)
+	
+	indices = array('q')
+	
+	for sequence in sequences:
+		indices.extend(sequence)
+	
+	offsets = array('q', [0])
+	offsets.extend(accumulate(len(sequence) for sequence in sequences))
+	
+	return indices, offsets
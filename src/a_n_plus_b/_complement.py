@@ -0,0 +1,103 @@
+'''
+Lazy views of the indices not matched by a pattern.
+'''
+
+from __future__ import annotations
+
+from ._progressions import length
+
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+	from collections.abc import Iterator
+
+
+class Complement:
+	'''
+	The 1-based indices of the children that are
+	*not* matched by a pattern, as in ``:not(:nth-child())``.
+	
+	Indices are generated from the gaps between
+	the matched ones, which are never enumerated
+	unless they are interleaved with the former.
+	The length and membership tests take constant time.
+	
+	Use :meth:`ANPlusB.complement` to create instances.
+	'''
+	
+	__slots__ = ('_descending', '_matched', '_population')
+	
+	_descending: bool
+	_matched: range
+	_population: int
+	
+	def __init__(
+		self, matched: range, population: int, /, *,
+		descending: bool
+	) -> None:
+		'''
+		:param matched: The matched indices, in ascending order.
+		:param population: The number of children.
+		:param descending: Whether to iterate in descending order.
+		'''
+		
+		self._matched = matched
+		self._population = population
+		self._descending = descending
+	
+	def __repr__(self) -> str:
+		matched, population = self._matched, self._population
+		
+		return f'{self.__class__.__name__}({matched = }, {population = })'
+	
+	def __len__(self) -> int:
+		return self._population - length(self._matched)
+	
+	def __contains__(self, item: object) -> bool:
+		if not isinstance(item, int):
+			return False
+		
+		return 1 <= item <= self._population and item not in self._matched
+	
+	def __iter__(self) -> Iterator[int]:
+		if self._descending:
+			return self._descending_indices()
+		
+		return self._ascending_indices()
+	
+	def __reversed__(self) -> Iterator[int]:
+		if self._descending:
+			return self._ascending_indices()
+		
+		return self._descending_indices()
+	
+	def _ascending_indices(self) -> Iterator[int]:
+		matched, population = self._matched, self._population
+		
+		if not matched:
+			yield from range(1, population + 1)
+			return
+		
+		yield from range(1, matched[0])
+		
+		if matched.step > 1:
+			for index in matched[:-1]:
+				yield from range(index + 1, index + matched.step)
+		
+		yield from range(matched[-1] + 1, population + 1)
+	
+	def _descending_indices(self) -> Iterator[int]:
+		matched, population = self._matched, self._population
+		
+		if not matched:
+			yield from range(population, 0, -1)
+			return
+		
+		yield from range(population, matched[-1], -1)
+		
+		if matched.step > 1:
+			for index in matched[:0:-1]:
+				yield from range(index - 1, index - matched.step, -1)
+		
+		yield from range(matched[0] - 1, 0, -1)
@@ -0,0 +1,305 @@
+'''
+Resumable, splittable iteration over the indices matched by a pattern.
+'''
+
+from collections.abc import Iterator, Mapping
+from typing import Any, cast, Self
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren, InvalidOrder
+from ._progressions import length, ordered_indices
+
+
+class InvalidNumberOfParts(ValueError):
+	'''
+	Raised when a non-positive number of parts
+	is passed to :meth:`IndicesCursor.split`.
+	'''
+	
+	def __init__(self, value: object, /) -> None:
+		'''
+		:param value: The value passed to :meth:`IndicesCursor.split`.
+		'''
+		
+		super().__init__(f'Expected a positive number, got: {value!r}')
+
+
+class InvalidCursorState(ValueError):
+	'''
+	Raised when the state passed to :meth:`IndicesCursor.from_json`
+	does not describe a valid cursor.
+	'''
+	
+	def __init__(self, state: object, /) -> None:
+		'''
+		:param state: The value passed to :meth:`IndicesCursor.from_json`.
+		'''
+		
+		if isinstance(state, Mapping):
+			state = dict(cast('Mapping[object, object]', state))
+		
+		super().__init__(f'Invalid cursor state: {state!r}')
+
+
+# The type of each field of the state returned by to_json().
+_state_types: dict[str, type] = {
+	'step': int, 'offset': int, 'population': int,
+	'from_last': bool, 'order': str,
+	'start': int, 'position': int, 'stop': int
+}
+
+
+def _has_type(value: object, expected: type, /) -> bool:
+	# Booleans are integers, but not the other way around.
+	if expected is int and isinstance(value, bool):
+		return False
+	
+	return isinstance(value, expected)
+
+
+def _is_well_formed(state: Mapping[str, Any], /) -> bool:
+	try:
+		return all(
+			_has_type(state[name], expected)
+			for name, expected in _state_types.items()
+		)
+	except (KeyError, TypeError):
+		return False
+
+
+class IndicesCursor:
+	'''
+	A resumable iterator over the indices :meth:`ANPlusB.indices`
+	would yield, in the same order.
+	
+	A cursor covers a contiguous part ``[start, stop)`` of the
+	sequence of indices and remembers the rank of the next one.
+	As that sequence is an arithmetic progression, moving to
+	any rank and getting the index at it take constant time.
+	
+	Cursors can be pickled, or converted to and from
+	JSON-compatible dictionaries using :meth:`to_json`
+	and :meth:`from_json`, to be resumed later.
+	'''
+	
+	__slots__ = (
+		'_from_last', '_indices', '_order', '_pattern',
+		'_population', '_position', '_start', '_stop'
+	)
+	
+	_from_last: bool
+	_indices: range
+	_order: str
+	_pattern: ANPlusB
+	_population: int
+	_position: int
+	_start: int
+	_stop: int
+	
+	def __init__(
+		self, pattern: ANPlusB, population: int, /, *,
+		from_last: bool = False,
+		order: str = 'default'
+	) -> None:
+		'''
+		:param pattern: The pattern whose indices to iterate over.
+		:param population: The number of children.
+		:param from_last: Same as for :meth:`ANPlusB.indices`.
+		:param order: Same as for :meth:`ANPlusB.indices`.
+		:raise InvalidOrder: If ``order`` is not valid.
+		:raise InvalidNumberOfChildren: If ``population`` is negative.
+		'''
+		
+		if order not in ('ascending', 'descending', 'default'):
+			raise InvalidOrder(order)
+		
+		if population < 0:
+			raise InvalidNumberOfChildren(population)
+		
+		self._pattern = pattern
+		self._population = population
+		self._from_last = from_last
+		self._order = order
+		self._indices = ordered_indices(
+			pattern.step, pattern.offset, population,
+			from_last = from_last,
+			order = order
+		)
+		self._start = self._position = 0
+		self._stop = length(self._indices)
+	
+	def __repr__(self) -> str:
+		pattern, population = self._pattern, self._population
+		start, position, stop = self._start, self._position, self._stop
+		
+		return (
+			f'{self.__class__.__name__}('
+			f'{pattern}, {population = }, '
+			f'{start = }, {position = }, {stop = })'
+		)
+	
+	def __eq__(self, other: object) -> bool:
+		if not isinstance(other, self.__class__):
+			return NotImplemented
+		
+		return self.to_json() == other.to_json()
+	
+	__hash__ = None  # type: ignore[assignment]
+	
+	def __iter__(self) -> Iterator[int]:
+		return self
+	
+	def __next__(self) -> int:
+		position = self._position
+		
+		if position >= self._stop:
+			raise StopIteration
+		
+		self._position = position + 1
+		
+		return self._indices[position]
+	
+	@property
+	def start(self) -> int:
+		'''
+		The rank of the first index covered by this cursor.
+		'''
+		
+		return self._start
+	
+	@property
+	def position(self) -> int:
+		'''
+		The rank of the next index to be yielded.
+		'''
+		
+		return self._position
+	
+	@property
+	def stop(self) -> int:
+		'''
+		The rank after the last index covered by this cursor.
+		'''
+		
+		return self._stop
+	
+	@property
+	def remaining(self) -> int:
+		'''
+		The number of indices left to be yielded.
+		'''
+		
+		return self._stop - self._position
+	
+	def take(self, count: int, /) -> range:
+		'''
+		Return up to ``count`` of the next indices
+		as a :class:`range` and move past them.
+		
+		:param count: The maximum number of indices to take.
+		'''
+		
+		position = self._position
+		end = min(self._stop, position + max(0, count))
+		self._position = end
+		
+		return self._indices[position:end]
+	
+	def seek(self, rank: int, /) -> None:
+		'''
+		Move to the given rank, so that the next index
+		yielded is the one at that rank in the sequence.
+		
+		:param rank: A rank between :attr:`start` and :attr:`stop`.
+		:raise IndexError: If ``rank`` is out of that range.
+		'''
+		
+		if not self._start <= rank <= self._stop:
+			raise IndexError(rank)
+		
+		self._position = rank
+	
+	def _part(self, start: int, stop: int, /) -> Self:
+		part = self.__class__.__new__(self.__class__)
+		part._pattern = self._pattern
+		part._population = self._population
+		part._from_last = self._from_last
+		part._order = self._order
+		part._indices = self._indices
+		part._start = part._position = start
+		part._stop = stop
+		
+		return part
+	
+	def split(self, parts: int, /) -> list[Self]:
+		'''
+		Split the remaining indices into ``parts`` disjoint,
+		contiguous cursors whose sizes differ by at most one,
+		in order. This cursor is left unchanged.
+		
+		:param parts: The number of cursors to return.
+		:raise InvalidNumberOfParts: If ``parts`` is not positive.
+		'''
+		
+		if parts < 1:
+			raise InvalidNumberOfParts(parts)
+		
+		size, extra = divmod(self.remaining, parts)
+		cursors: list[Self] = []
+		start = self._position
+		
+		for part in range(parts):
+			stop = start + size + (part < extra)
+			cursors.append(self._part(start, stop))
+			start = stop
+		
+		return cursors
+	
+	def to_json(self) -> dict[str, Any]:
+		'''
+		Return the state of this cursor as a dictionary
+		that can be serialized using :mod:`json`.
+		'''
+		
+		return {
+			'step': self._pattern.step,
+			'offset': self._pattern.offset,
+			'population': self._population,
+			'from_last': self._from_last,
+			'order': self._order,
+			'start': self._start,
+			'position': self._position,
+			'stop': self._stop
+		}
+	
+	@classmethod
+	def from_json(cls, state: Mapping[str, Any], /) -> Self:
+		'''
+		Recreate a cursor from the result of :meth:`to_json`.
+		
+		:param state: The state of the cursor.
+		:raise InvalidCursorState: If ``state`` is not valid.
+		'''
+		
+		if not _is_well_formed(state):
+			raise InvalidCursorState(state)
+		
+		try:
+			cursor = cls(
+				ANPlusB(state['step'], state['offset']),
+				state['population'],
+				from_last = state['from_last'],
+				order = state['order']
+			)
+		except (InvalidNumberOfChildren, InvalidOrder):
+			raise InvalidCursorState(state) from None
+		
+		start, stop = state['start'], state['stop']
+		position = state['position']
+		
+		if not 0 <= start <= position <= stop <= cursor._stop:
+			raise InvalidCursorState(state)
+		
+		part = cursor._part(start, stop)
+		part.seek(position)
+		
+		return part
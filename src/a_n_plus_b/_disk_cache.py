@@ -0,0 +1,416 @@
+'''
+A persistent, append-only cache of :meth:`ANPlusB.parse` results,
+shared between processes through a memory-mapped file.
+'''
+
+import mmap
+import os
+import zlib
+from pathlib import Path
+from struct import Struct
+from types import TracebackType
+from typing import Self
+
+from ._a_n_plus_b import ANPlusB, EmptyInput, InputIsNotParsable
+from ._grammar import normalize
+
+
+type _Entry = ANPlusB | int
+
+
+_MAGIC = b'ANPB\x02\x00\x00\x00'
+_SYNC = b'\xa5\xa5NB'
+
+_SMALL = 1
+_BIG = 2
+_EMPTY = 3
+_UNPARSABLE = 4
+
+_record_header = Struct('<4sIBI')
+_small_values = Struct('<qq')
+_big_value_lengths = Struct('<II')
+
+_int64_range = range(-(1 << 63), 1 << 63)
+
+
+class CorruptedCacheFile(ValueError):
+	'''
+	Raised when a file passed to :class:`PersistentParseCache`
+	is not a parse cache file.
+	'''
+	
+	def __init__(self, path: Path, /) -> None:
+		'''
+		:param path: The path of the file.
+		'''
+		
+		super().__init__(f'Not a parse cache file: {str(path)!r}')
+
+
+class _ShortWrite(OSError):
+	
+	def __init__(self, path: Path, /) -> None:
+		super().__init__(f'Records were partially written to {str(path)!r}')
+
+
+def _encode(key: str, entry: _Entry, /) -> bytes:
+	encoded_key = key.encode('utf-8', 'surrogatepass')
+	
+	if isinstance(entry, int):
+		kind, values = entry, b''
+	
+	elif entry.step in _int64_range and entry.offset in _int64_range:
+		kind, values = _SMALL, _small_values.pack(entry.step, entry.offset)
+	
+	else:
+		step, offset = str(entry.step).encode(), str(entry.offset).encode()
+		kind = _BIG
+		values = _big_value_lengths.pack(len(step), len(offset)) + step + offset
+	
+	payload = encoded_key + values
+	header = _record_header.pack(
+		_SYNC, zlib.crc32(payload),
+		kind, len(encoded_key)
+	)
+	
+	return header + payload
+
+
+def _decode_values(kind: int, data: bytes, /) -> _Entry | None:
+	if kind in (_EMPTY, _UNPARSABLE):
+		return kind if not data else None
+	
+	if kind == _SMALL and len(data) == _small_values.size:
+		return ANPlusB(*_small_values.unpack(data))
+	
+	if kind != _BIG or len(data) < _big_value_lengths.size:
+		return None
+	
+	step_length, offset_length = _big_value_lengths.unpack_from(data)
+	values = data[_big_value_lengths.size:]
+	
+	if len(values) != step_length + offset_length:
+		return None
+	
+	return ANPlusB(int(values[:step_length]), int(values[step_length:]))
+
+
+def _record(
+	buffer: mmap.mmap | bytes,
+	position: int, /
+) -> tuple[str, _Entry, int] | None:
+	'''
+	Decode the record starting at ``position``.
+	
+	:return: \
+		The key, the entry and the position right after the record,
+		or ``None`` if the record is incomplete or damaged.
+	'''
+	
+	end = len(buffer)
+	
+	if position + _record_header.size > end:
+		return None
+	
+	sync, checksum, kind, key_length = \
+		_record_header.unpack_from(buffer, position)
+	
+	if sync != _SYNC:
+		return None
+	
+	payload_start = position + _record_header.size
+	payload_end = _payload_end(buffer, payload_start, kind, key_length)
+	
+	if payload_end is None or payload_end > end:
+		return None
+	
+	payload = bytes(buffer[payload_start:payload_end])
+	
+	if zlib.crc32(payload) != checksum:
+		return None
+	
+	entry = _decode_values(kind, payload[key_length:])
+	
+	if entry is None:
+		return None
+	
+	key = payload[:key_length].decode('utf-8', 'surrogatepass')
+	
+	return key, entry, payload_end
+
+
+def _records(
+	buffer: mmap.mmap | bytes,
+	start: int, /
+) -> tuple[list[tuple[str, _Entry]], int]:
+	'''
+	Decode the records found in ``buffer``, starting at ``start``.
+	
+	Incomplete or damaged records, such as those left by
+	a writer that crashed, are skipped by searching for
+	the sync marker of the next record. Trailing ones are
+	not skipped, as they may still be being written.
+	
+	:return: The records and the position right after the last one.
+	'''
+	
+	records: list[tuple[str, _Entry]] = []
+	position = resumption = start
+	
+	while position < len(buffer):
+		record = _record(buffer, position)
+		
+		if record is None:
+			position = buffer.find(_SYNC, position + 1)
+			
+			if position == -1:
+				break
+			
+			continue
+		
+		key, entry, position = record
+		records.append((key, entry))
+		resumption = position
+	
+	return records, resumption
+
+
+def _payload_end(
+	buffer: mmap.mmap | bytes,
+	start: int,
+	kind: int,
+	key_length: int, /
+) -> int | None:
+	values_start = start + key_length
+	
+	if kind in (_EMPTY, _UNPARSABLE):
+		return values_start
+	
+	if kind == _SMALL:
+		return values_start + _small_values.size
+	
+	if kind != _BIG or values_start + _big_value_lengths.size > len(buffer):
+		return None
+	
+	step_length: int
+	offset_length: int
+	step_length, offset_length = \
+		_big_value_lengths.unpack_from(buffer, values_start)
+	
+	return values_start + _big_value_lengths.size + step_length + offset_length
+
+
+class PersistentParseCache:
+	'''
+	A cache in front of :meth:`ANPlusB.parse`,
+	persisted to an append-only file.
+	
+	Each record holds an input string along with either
+	the resulting ``step`` and ``offset`` or a marker
+	for the error raised. Loading a file decodes these
+	records without parsing anything.
+	
+	Any number of processes may read from and append to the
+	same file: new results are written with a single
+	``O_APPEND`` write per :meth:`flush`. Each record starts
+	with a sync marker and ends with a checksum, so that readers
+	can skip records left incomplete or damaged by a failed
+	write and still find those appended after them.
+	Duplicate records are harmless.
+	'''
+	
+	__slots__ = ('_entries', '_loaded_size', '_path', '_pending')
+	
+	_entries: dict[str, _Entry]
+	_loaded_size: int
+	_path: Path
+	_pending: list[bytes]
+	
+	def __init__(self, path: str | os.PathLike[str], /) -> None:
+		'''
+		Open or create a cache file and load its records.
+		
+		:param path: The path of the cache file.
+		:raise CorruptedCacheFile: \
+			If the file exists but is not a cache file.
+		'''
+		
+		self._path = Path(path)
+		self._entries = {}
+		self._pending = []
+		self._loaded_size = len(_MAGIC)
+		
+		self._create()
+		self.load()
+	
+	def __len__(self) -> int:
+		return len(self._entries)
+	
+	def __contains__(self, text: object) -> bool:
+		return text in self._entries
+	
+	def __enter__(self) -> Self:
+		return self
+	
+	def __exit__(
+		self,
+		exception_type: type[BaseException] | None,
+		exception: BaseException | None,
+		traceback: TracebackType | None
+	) -> None:
+		self.flush()
+	
+	@property
+	def path(self) -> Path:
+		'''
+		The path of the cache file.
+		'''
+		
+		return self._path
+	
+	def _create(self) -> None:
+		if self._path.exists():
+			return
+		
+		# Publish the header atomically, so that other
+		# processes never see a file without one.
+		temporary = self._path.with_name(
+			f'.{self._path.name}.{os.getpid()}.tmp'
+		)
+		temporary.write_bytes(_MAGIC)
+		
+		try:
+			os.link(temporary, self._path)
+		except FileExistsError:
+			pass
+		finally:
+			temporary.unlink()
+	
+	def load(self) -> int:
+		'''
+		Load records appended since the last load,
+		including those written by other processes.
+		
+		:return: The number of newly loaded records.
+		:raise CorruptedCacheFile: If the file is not a cache file.
+		'''
+		
+		with self._path.open('rb') as file:
+			size = os.fstat(file.fileno()).st_size
+			
+			if size < len(_MAGIC):
+				raise CorruptedCacheFile(self._path)
+			
+			with mmap.mmap(
+				file.fileno(), 0,
+				access = mmap.ACCESS_READ
+			) as buffer:
+				if buffer[:len(_MAGIC)] != _MAGIC:
+					raise CorruptedCacheFile(self._path)
+				
+				records, self._loaded_size = \
+					_records(buffer, self._loaded_size)
+		
+		self._entries.update(records)
+		
+		return len(records)
+	
+	def parse(self, text: str, /) -> ANPlusB:
+		'''
+		Same as :meth:`ANPlusB.parse`,
+		but results are looked up in the cache first.
+		
+		New results are kept in memory until :meth:`flush`.
+		
+		:param text: The text to parse.
+		:raise EmptyInput: If the input is empty or only contains whitespace.
+		:raise InputIsNotParsable: If the text is not parsable.
+		'''
+		
+		entry = self._entries.get(text)
+		
+		if entry is None:
+			entry = self._parse_and_record(text)
+		
+		if isinstance(entry, ANPlusB):
+			return entry
+		
+		if entry == _EMPTY:
+			raise EmptyInput
+		
+		raise InputIsNotParsable(normalize(text))
+	
+	def _parse_and_record(self, text: str, /) -> _Entry:
+		entry: _Entry
+		
+		try:
+			entry = ANPlusB.parse(text)
+		except EmptyInput:
+			entry = _EMPTY
+		except InputIsNotParsable:
+			entry = _UNPARSABLE
+		
+		self._entries[text] = entry
+		self._pending.append(_encode(text, entry))
+		
+		return entry
+	
+	def flush(self) -> None:
+		'''
+		Append results not yet written to the file.
+		
+		If the write is cut short, the results are kept
+		and written again in full by the next call;
+		readers skip the partial copy.
+		
+		:raise OSError: If the write fails or is cut short.
+		'''
+		
+		if not self._pending:
+			return
+		
+		data = b''.join(self._pending)
+		flags = os.O_WRONLY | os.O_APPEND | getattr(os, 'O_BINARY', 0)
+		descriptor = os.open(self._path, flags)
+		
+		try:
+			written = os.write(descriptor, data)
+		finally:
+			os.close(descriptor)
+		
+		if written != len(data):
+			raise _ShortWrite(self._path)
+		
+		self._pending.clear()
+	
+	def merge(self, *paths: str | os.PathLike[str]) -> int:
+		'''
+		Copy records from other cache files
+		that this cache does not have yet.
+		
+		:param paths: The paths of the other cache files.
+		:return: The number of records copied.
+		:raise CorruptedCacheFile: If any file is not a cache file.
+		'''
+		
+		self.load()
+		
+		copied = 0
+		
+		for path in paths:
+			other = Path(path).read_bytes()
+			
+			if other[:len(_MAGIC)] != _MAGIC:
+				raise CorruptedCacheFile(Path(path))
+			
+			records, _ = _records(other, len(_MAGIC))
+			
+			for text, entry in records:
+				if text not in self._entries:
+					self._entries[text] = entry
+					self._pending.append(_encode(text, entry))
+					copied += 1
+		
+		self.flush()
+		
+		return copied
@@ -0,0 +1,142 @@
+'''
+Dispatchers that match an index against a whole rule set at once.
+'''
+
+from collections.abc import Callable, Iterable
+
+from ._a_n_plus_b import ANPlusB
+
+
+type Rule[T] = tuple[T, ANPlusB, bool]
+type Dispatcher[T] = Callable[[int, int], list[T]]
+
+
+class _Generator:
+	'''
+	Accumulates the source of a dispatcher
+	and the constants it refers to.
+	'''
+	
+	__slots__ = ('_constants', '_lines', '_remainders')
+	
+	_constants: dict[str, object]
+	_lines: list[str]
+	_remainders: dict[tuple[str, int], str]
+	
+	def __init__(self) -> None:
+		self._constants = {}
+		self._lines = []
+		self._remainders = {}
+	
+	def constant(self, value: object, /) -> str:
+		# Small integers are inlined as literals, which
+		# are faster to load than globals. Huge ones are
+		# not, as their conversion to strings is limited.
+		if isinstance(value, int) and -(1 << 63) <= value < 1 << 63:
+			return repr(value)
+		
+		name = f'_constant_{len(self._constants)}'
+		self._constants[name] = value
+		
+		return name
+	
+	def line(self, line: str, /) -> None:
+		self._lines.append(line)
+	
+	def remainder(self, position: str, modulus: int, /) -> str:
+		'''
+		The name of a variable holding ``position % modulus``,
+		which is computed once for all rules needing it.
+		'''
+		
+		key = (position, modulus)
+		
+		if key not in self._remainders:
+			name = f'{position}_mod_{len(self._remainders)}'
+			self._remainders[key] = name
+			self.line(f'\t{name} = {position} % {self.constant(modulus)}')
+		
+		return self._remainders[key]
+	
+	def condition(self, instance: ANPlusB, position: str, /) -> str | None:
+		'''
+		A Python expression telling whether ``position``,
+		known to be between 1 and the population, is matched.
+		'''
+		
+		a, b = instance.step, instance.offset
+		
+		if a <= 0 and b <= 0:
+			return None
+		
+		if a == 0:
+			return f'{position} == {self.constant(b)}'
+		
+		conditions: list[str] = []
+		
+		if a > 0 and b > 1:
+			conditions.append(f'{position} >= {self.constant(b)}')
+		
+		if a < 0:
+			conditions.append(f'{position} <= {self.constant(b)}')
+		
+		if abs(a) != 1:
+			remainder = self.remainder(position, abs(a))
+			conditions.append(f'{remainder} == {self.constant(b % abs(a))}')
+		
+		return ' and '.join(conditions) or 'True'
+	
+	def build[T](self, rules: Iterable[Rule[T]], /) -> Dispatcher[T]:
+		self.line('def dispatch(index, population):')
+		self.line('\tif not 1 <= index <= population:')
+		self.line('\t\treturn []')
+		self.line('\tmatched = []')
+		
+		counts_from_last = False
+		
+		for rule_id, instance, from_last in rules:
+			position = 'last' if from_last else 'index'
+			condition = self.condition(instance, position)
+			
+			if condition is None:
+				continue
+			
+			if from_last and not counts_from_last:
+				index = self._lines.index('\tmatched = []')
+				self._lines.insert(index, '\tlast = population + 1 - index')
+				counts_from_last = True
+			
+			self.line(f'\tif {condition}:')
+			self.line(f'\t\tmatched.append({self.constant(rule_id)})')
+		
+		self.line('\treturn matched')
+		
+		namespace = dict(self._constants)
+		code = compile('\n'.join(self._lines), '<rule set>', 'exec')
+		exec(code, namespace)  # noqa: S102
+		
+		dispatch: Dispatcher[T] = namespace['dispatch']  # type: ignore[assignment]
+		dispatch.__doc__ = '\n'.join(self._lines)
+		
+		return dispatch
+
+
+def compile_rules[T](rules: Iterable[Rule[T]], /) -> Dispatcher[T]:
+	'''
+	Generate a function that takes an index and a population
+	and returns the IDs of all rules matching that index,
+	in the order the rules were given.
+	
+	Each rule is a tuple of an ID, an :class:`ANPlusB` object
+	and whether to count indices from the last one, as in
+	``:nth-last-child()``. Remainders are computed once per
+	call for all rules whose steps have the same magnitude.
+	
+	The generated source is available as the function's
+	``__doc__``. Generating is relatively expensive;
+	the returned function should be kept and reused.
+	
+	:param rules: The rules to match against.
+	'''
+	
+	return _Generator().build(rules)
@@ -0,0 +1,166 @@
+'''
+Evaluation of ``:nth-child(An+B of S)`` over a fixed list of children.
+'''
+
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from typing import Self
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren
+from ._predicates import compile_predicate
+
+
+class FilteredChildren:
+	'''
+	The children of an element that match a selector ``S``,
+	against which ``:nth-child(An+B of S)`` and
+	``:nth-last-child(An+B of S)`` can be evaluated.
+	
+	The 1-based indices of the matching children are stored once
+	in ascending order, mapping ordinals to indices (select).
+	The reverse mapping (rank) is a binary search. Any number of
+	patterns can then be evaluated against the same children,
+	each in time proportional to the number of matches.
+	'''
+	
+	__slots__ = ('_population', '_selected')
+	
+	_population: int
+	_selected: list[int]
+	
+	def __init__(self, matches: Iterable[bool], /) -> None:
+		'''
+		:param matches: \
+			Whether each child, in order, matches ``S``.
+		'''
+		
+		population = 0
+		selected: list[int] = []
+		
+		for population, matched in enumerate(matches, 1):
+			if matched:
+				selected.append(population)
+		
+		self._population = population
+		self._selected = selected
+	
+	@classmethod
+	def from_bitmask(cls, mask: int, population: int, /) -> Self:
+		'''
+		Create an instance from a bitmask whose bit ``i - 1``
+		is set if the ``i``-th child matches ``S``.
+		
+		:param mask: The bitmask. Bits past ``population`` are ignored.
+		:param population: The number of children.
+		:raise InvalidNumberOfChildren: If ``population`` is negative.
+		'''
+		
+		if population < 0:
+			raise InvalidNumberOfChildren(population)
+		
+		instance = cls(())
+		bits = format(mask & ((1 << population) - 1), 'b')[::-1]
+		start = 0
+		
+		while (index := bits.find('1', start)) != -1:
+			instance._selected.append(index + 1)
+			start = index + 1
+		
+		instance._population = population
+		
+		return instance
+	
+	def __repr__(self) -> str:
+		population, selected = self._population, len(self._selected)
+		
+		return f'{self.__class__.__name__}({population = }, {selected = })'
+	
+	def __len__(self) -> int:
+		'''
+		The number of children matching ``S``.
+		'''
+		
+		return len(self._selected)
+	
+	@property
+	def population(self) -> int:
+		'''
+		The total number of children.
+		'''
+		
+		return self._population
+	
+	def rank(self, index: int, /) -> int:
+		'''
+		The number of children matching ``S``
+		among the first ``index`` children.
+		
+		:param index: A 1-based index.
+		'''
+		
+		return bisect_right(self._selected, index)
+	
+	def select(self, ordinal: int, /) -> int:
+		'''
+		The index of the ``ordinal``-th child matching ``S``.
+		
+		:param ordinal: A 1-based ordinal.
+		:raise IndexError: If there are fewer matching children.
+		'''
+		
+		if ordinal < 1:
+			raise IndexError(ordinal)
+		
+		return self._selected[ordinal - 1]
+	
+	def indices(
+		self, pattern: ANPlusB, /, *,
+		from_last: bool = False,
+		order: str = 'default'
+	) -> Iterator[int]:
+		'''
+		Yield the 1-based indices of the children matched by
+		``:nth-child(pattern of S)``, or ``:nth-last-child()``
+		if ``from_last`` is true.
+		
+		:param pattern: The ``An+B`` part.
+		:param from_last: Whether to count from the last matching child.
+		:param order: Same as for :meth:`ANPlusB.indices`.
+		:raise InvalidOrder: If ``order`` is not valid.
+		'''
+		
+		selected = self._selected
+		ordinals = pattern.indices(
+			len(selected),
+			from_last = from_last,
+			order = order
+		)
+		
+		return (selected[ordinal - 1] for ordinal in ordinals)
+	
+	def matches(
+		self, pattern: ANPlusB, index: int, /, *,
+		from_last: bool = False
+	) -> bool:
+		'''
+		Check whether the child at ``index`` is matched by
+		``:nth-child(pattern of S)``, or ``:nth-last-child()``
+		if ``from_last`` is true, in logarithmic time.
+		
+		:param pattern: The ``An+B`` part.
+		:param index: A 1-based index.
+		:param from_last: Whether to count from the last matching child.
+		'''
+		
+		selected = self._selected
+		ordinal = bisect_right(selected, index)
+		
+		if not ordinal or selected[ordinal - 1] != index:
+			return False
+		
+		predicate = compile_predicate(
+			pattern.step, pattern.offset,
+			from_last = from_last
+		)
+		
+		return predicate(ordinal, len(selected))
@@ -1,28 +1,82 @@
-import re
+from __future__ import annotations
+
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+	import re
+
+
+_whitespace_characters = '\t\n\f\r\x20'
+_whitespace_deletions = str.maketrans('', '', _whitespace_characters)
 
 
 class Regex:
 	'''
 	Proxy class for ergonomic syntax.
+	
+	The pattern is only compiled when it is first used,
+	so that importing the package does not import :mod:`re`.
 	'''
 	
 	__slots__ = ('_raw_pattern', '_compiled')  # noqa: RUF023
 	
 	_raw_pattern: str
-	_compiled: re.Pattern[str]
+	_compiled: re.Pattern[str] | None
 	
 	def __init__(self, pattern: str, /) -> None:
 		self._raw_pattern = pattern
-		self._compiled = re.compile(pattern)
+		self._compiled = None
 	
 	def __str__(self) -> str:
 		return self._raw_pattern
 	
+	def _pattern(self) -> re.Pattern[str]:
+		if self._compiled is None:
+			import re  # noqa: PLC0415
+			
+			self._compiled = re.compile(self._raw_pattern)
+		
+		return self._compiled
+	
 	def fullmatch(self, text: str, /) -> re.Match[str] | None:
-		return self._compiled.fullmatch(text)
+		return self._pattern().fullmatch(text)
+	
+	def search(self, text: str, /) -> re.Match[str] | None:
+		return self._pattern().search(text)
 	
 	def sub(self, replacement: str, text: str, /) -> str:
-		return self._compiled.sub(replacement, text)
+		return self._pattern().sub(replacement, text)
+
+
+def normalize(text: str, /) -> str:
+	'''
+	Strip surrounding whitespace and
+	convert ``text`` to lowercase.
+	'''
+	
+	return text.strip(_whitespace_characters).lower()
+
+
+def remove_whitespace(text: str, /) -> str:
+	'''
+	Remove all whitespace.
+	'''
+	
+	return text.translate(_whitespace_deletions)
+
+
+def is_integer(text: str, /) -> bool:
+	r'''
+	Equivalent to ``integer.fullmatch(text)``,
+	but without the regular expression engine.
+	'''
+	
+	if text[:1] in ('+', '-'):
+		text = text[1:]
+	
+	# Same as \d, which matches Unicode decimal digits.
+	return text.isdecimal()
 
 
 whitespace = Regex(r'[\t\n\f\r\x20]')
@@ -36,3 +90,7 @@ a_n_plus_b = Regex(fr'''(?x)
 	(?P<b>{_} [+-] {_} \d+)?
 )
 ''')
+
+# The whitespace around "of" is required,
+# as "of" is a separate ident token.
+selector_separator = Regex(fr'(?i){whitespace}of{whitespace}+')
@@ -0,0 +1,255 @@
+'''
+Mapping of the children matched by a pattern
+to the cells of a row-major grid.
+'''
+
+import math
+from collections.abc import Iterator
+from operator import itemgetter
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren
+from ._progressions import length, matched_indices
+from ._relations import intersection
+
+
+class InvalidNumberOfColumns(ValueError):
+	'''
+	Raised when a non-positive number of
+	columns is passed to :class:`Grid`.
+	'''
+	
+	def __init__(self, value: object, /) -> None:
+		'''
+		:param value: The value passed to :class:`Grid`.
+		'''
+		
+		super().__init__(f'Expected a positive number, got: {value!r}')
+
+
+class InvalidGrouping(ValueError):
+	'''
+	Raised when an unknown grouping
+	is passed to :meth:`Grid.cells`.
+	'''
+	
+	def __init__(self, value: object, /) -> None:
+		'''
+		:param value: The value passed to :meth:`Grid.cells`.
+		'''
+		
+		super().__init__(f'Expected "row" or "column", got: {value!r}')
+
+
+class Grid:
+	'''
+	Children laid out row-major in a fixed number of columns,
+	the last row being possibly incomplete.
+	
+	Rows and columns are 1-based: the ``i``-th child is in
+	row ``(i - 1) // columns + 1`` and column ``(i - 1) % columns + 1``.
+	
+	As the indices matched by a pattern form an arithmetic
+	progression, so do the columns matched in each row and
+	the rows matched in each column. Only the rows and
+	columns containing matched children are visited,
+	without going through every index.
+	'''
+	
+	__slots__ = ('_columns', '_population')
+	
+	_columns: int
+	_population: int
+	
+	def __init__(self, population: int, columns: int, /) -> None:
+		'''
+		:param population: The number of children.
+		:param columns: The number of columns.
+		:raise InvalidNumberOfChildren: If ``population`` is negative.
+		:raise InvalidNumberOfColumns: If ``columns`` is not positive.
+		'''
+		
+		if population < 0:
+			raise InvalidNumberOfChildren(population)
+		
+		if columns < 1:
+			raise InvalidNumberOfColumns(columns)
+		
+		self._population = population
+		self._columns = columns
+	
+	def __repr__(self) -> str:
+		population, columns = self._population, self._columns
+		
+		return f'{self.__class__.__name__}({population = }, {columns = })'
+	
+	@property
+	def population(self) -> int:
+		'''
+		The number of children.
+		'''
+		
+		return self._population
+	
+	@property
+	def columns(self) -> int:
+		'''
+		The number of columns.
+		'''
+		
+		return self._columns
+	
+	@property
+	def rows(self) -> int:
+		'''
+		The number of rows, including an incomplete last one.
+		'''
+		
+		return -(-self._population // self._columns)
+	
+	def cell(self, index: int, /) -> tuple[int, int]:
+		'''
+		The row and column of the child at ``index``.
+		
+		:param index: A 1-based index.
+		:raise IndexError: If there is no such child.
+		'''
+		
+		if not 1 <= index <= self._population:
+			raise IndexError(index)
+		
+		row, column = divmod(index - 1, self._columns)
+		
+		return row + 1, column + 1
+	
+	def _matched(self, pattern: ANPlusB, /, *, from_last: bool) -> range:
+		return matched_indices(
+			pattern.step, pattern.offset, self._population,
+			from_last = from_last
+		)
+	
+	def by_row(
+		self, pattern: ANPlusB, /, *,
+		from_last: bool = False
+	) -> Iterator[tuple[int, range]]:
+		'''
+		Yield each row containing a matched child
+		along with the matched columns in that row,
+		both in ascending order.
+		
+		:param pattern: The pattern to evaluate.
+		:param from_last: Whether to count indices from the last one.
+		'''
+		
+		indices = self._matched(pattern, from_last = from_last)
+		columns = self._columns
+		
+		if not indices:
+			return
+		
+		step, last = indices.step, indices[-1]
+		index = indices.start
+		
+		while index <= last:
+			row = (index - 1) // columns
+			row_start = row * columns + 1
+			row_end = min(last, row_start + columns - 1)
+			
+			yield row + 1, range(
+				index - row_start + 1,
+				row_end - row_start + 2,
+				step
+			)
+			
+			# The first matched index past this row.
+			index += ((row_end - index) // step + 1) * step
+	
+	def by_column(
+		self, pattern: ANPlusB, /, *,
+		from_last: bool = False
+	) -> Iterator[tuple[int, range]]:
+		'''
+		Yield each column containing a matched child
+		along with the matched rows in that column,
+		both in ascending order.
+		
+		Only the columns congruent to the first matched index
+		modulo the greatest common divisor of the step and
+		the number of columns can contain matched children.
+		If there are fewer matched children than such columns,
+		each of them is in a column of its own.
+		
+		:param pattern: The pattern to evaluate.
+		:param from_last: Whether to count indices from the last one.
+		'''
+		
+		indices = self._matched(pattern, from_last = from_last)
+		columns, population = self._columns, self._population
+		
+		if not indices:
+			return
+		
+		step = indices.step
+		divisor = math.gcd(step, columns)
+		# The number of columns which can contain matched children,
+		# and also the number of matched children after which
+		# the columns repeat.
+		period = columns // divisor
+		
+		if length(indices) < period:
+			cells = map(self.cell, indices)
+			
+			for row, column in sorted(cells, key = itemgetter(1)):
+				yield column, range(row, row + 1, step // divisor)
+			
+			return
+		
+		first_column = (indices.start - 1) % divisor + 1
+		
+		for column in range(first_column, columns + 1, divisor):
+			children = range(column, population + 1, columns)
+			common = intersection(indices, children)
+			
+			if not common:
+				continue
+			
+			# The step of the intersection is a multiple of the number
+			# of columns, even if there is only one element.
+			first = (common[0] - 1) // columns + 1
+			last = (common[-1] - 1) // columns + 1
+			
+			yield column, range(first, last + 1, common.step // columns)
+	
+	def cells(
+		self, pattern: ANPlusB, /, *,
+		from_last: bool = False,
+		by: str = 'row'
+	) -> Iterator[tuple[int, int]]:
+		'''
+		Yield the row and column of each matched child,
+		ordered by row then column, or by column then row.
+		
+		:param pattern: The pattern to evaluate.
+		:param from_last: Whether to count indices from the last one.
+		:param by: Either ``row`` or ``column``.
+		:raise InvalidGrouping: If ``by`` is neither.
+		'''
+		
+		if by == 'row':
+			groups = self.by_row(pattern, from_last = from_last)
+			
+			return (
+				(row, column)
+				for row, columns in groups
+				for column in columns
+			)
+		
+		if by == 'column':
+			groups = self.by_column(pattern, from_last = from_last)
+			
+			return (
+				(row, column)
+				for column, rows in groups
+				for row in rows
+			)
+		
+		raise InvalidGrouping(by)
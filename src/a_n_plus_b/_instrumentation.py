@@ -0,0 +1,331 @@
+'''
+Opt-in counters, histograms and callbacks for the hot paths.
+'''
+
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping
+from time import perf_counter_ns
+from typing import Any
+
+from ._a_n_plus_b import ANPlusB, ParseError
+from ._grammar import is_integer, normalize
+
+
+type Callback = Callable[[str, Mapping[str, object]], object]
+
+
+def _parse_path(text: str, /) -> str:
+	'''
+	Determine which branch of :meth:`ANPlusB.parse`
+	the given input goes through.
+	'''
+	
+	text = normalize(text)
+	
+	if not text:
+		return 'empty'
+	
+	if text in ('odd', 'even'):
+		return 'keyword'
+	
+	if is_integer(text):
+		return 'integer'
+	
+	return 'a_n_plus_b'
+
+
+def _bucket(value: int, /) -> int:
+	'''
+	The smallest power of two not less than ``value``,
+	or ``0`` if ``value`` is not positive.
+	'''
+	
+	return 1 << (value - 1).bit_length() if value > 0 else 0
+
+
+class Instrumentation:
+	'''
+	Counters and histograms for :meth:`ANPlusB.parse`,
+	:meth:`ANPlusB.try_parse`, :meth:`ANPlusB.is_valid`
+	and :meth:`ANPlusB.indices`.
+	
+	Other ways of parsing, such as :meth:`ANPlusB.parse_with_selector`,
+	:class:`LazyANPlusB` and the command-line interface, go through
+	one of these methods and are counted as well.
+	
+	Nothing is measured until :meth:`enable` is called,
+	which replaces said methods with instrumented versions.
+	:meth:`disable` puts the originals back, so that
+	a disabled instance has no cost at all.
+	
+	Histograms group values into power-of-two buckets,
+	keyed by their upper bounds.
+	'''
+	
+	__slots__ = ('_callbacks', '_counters', '_histograms', '_originals')
+	
+	_callbacks: list[Callback]
+	_counters: Counter[str]
+	_histograms: dict[str, Counter[int]]
+	_originals: dict[str, object] | None
+	
+	def __init__(self) -> None:
+		self._callbacks = []
+		self._counters = Counter()
+		self._histograms = {}
+		self._originals = None
+	
+	@property
+	def enabled(self) -> bool:
+		'''
+		Whether the instrumented methods are in place.
+		'''
+		
+		return self._originals is not None
+	
+	def enable(self, callback: Callback | None = None) -> None:
+		'''
+		Start measuring.
+		
+		:param callback: \
+			An optional function to be called with the name
+			of each event (``parse``, ``indices`` or
+			``indices_done``) and its details.
+			The details of ``parse`` events include the
+			``method`` called: ``parse``, ``try_parse``
+			or ``is_valid``.
+		'''
+		
+		if callback is not None:
+			self._callbacks.append(callback)
+		
+		if self._originals is not None:
+			return
+		
+		originals = {
+			name: ANPlusB.__dict__[name]
+			for name in ('parse', 'try_parse', 'is_valid', 'indices')
+		}
+		self._originals = originals
+		
+		parse = self._instrumented_parse(originals['parse'].__func__)
+		try_parse = self._instrumented_try_parse(
+			originals['try_parse'].__func__
+		)
+		is_valid = self._instrumented_is_valid(originals['is_valid'].__func__)
+		indices = self._instrumented_indices(originals['indices'])
+		
+		setattr(ANPlusB, 'parse', classmethod(parse))  # noqa: B010
+		setattr(ANPlusB, 'try_parse', classmethod(try_parse))  # noqa: B010
+		setattr(ANPlusB, 'is_valid', staticmethod(is_valid))  # noqa: B010
+		setattr(ANPlusB, 'indices', indices)  # noqa: B010
+	
+	def disable(self) -> None:
+		'''
+		Stop measuring and remove all callbacks.
+		Collected data is kept until :meth:`reset` is called.
+		'''
+		
+		self._callbacks.clear()
+		
+		if self._originals is None:
+			return
+		
+		for name, original in self._originals.items():
+			setattr(ANPlusB, name, original)
+		
+		self._originals = None
+	
+	def reset(self) -> None:
+		'''
+		Discard all collected data.
+		'''
+		
+		self._counters.clear()
+		self._histograms.clear()
+	
+	def snapshot(self) -> dict[str, dict[str, Any]]:
+		'''
+		Return a copy of the collected data.
+		
+		Counters:
+		
+		* ``parse.<path>``: Inputs per branch of :meth:`ANPlusB.parse`.
+		* ``parse.errors``: Inputs that were not parsable.
+		
+		Inputs passed to :meth:`ANPlusB.try_parse` and
+		:meth:`ANPlusB.is_valid` are counted as if
+		they were passed to :meth:`ANPlusB.parse`.
+		* ``indices.calls``: Calls to :meth:`ANPlusB.indices`.
+		* ``indices.zero_step``: Such calls where ``a == 0`` and ``b > 0``.
+		
+		Paths are ``empty``, ``keyword``, ``integer`` and ``a_n_plus_b``.
+		
+		Histograms:
+		
+		* ``parse.duration_ns``: Time spent per parse or check.
+		* ``indices.population``: Populations passed.
+		* ``indices.yielded``: Indices yielded per iterator.
+		* ``indices.duration_ns``: Lifetime of an iterator.
+		
+		The lifetime of an iterator spans from
+		its creation to its exhaustion or closure.
+		'''
+		
+		return {
+			'counters': dict(self._counters),
+			'histograms': {
+				name: dict(sorted(histogram.items()))
+				for name, histogram in self._histograms.items()
+			}
+		}
+	
+	def _observe(self, histogram: str, value: int, /) -> None:
+		self._histograms.setdefault(histogram, Counter())[_bucket(value)] += 1
+	
+	def _emit(self, event: str, details: Mapping[str, object], /) -> None:
+		for callback in self._callbacks:
+			callback(event, details)
+	
+	def _record_parse(
+		self, method: str, text: str, result: object, start: int, /, *,
+		failed: bool
+	) -> None:
+		duration = perf_counter_ns() - start
+		path = _parse_path(text)
+		
+		if failed:
+			self._counters['parse.errors'] += 1
+		
+		self._counters[f'parse.{path}'] += 1
+		self._observe('parse.duration_ns', duration)
+		self._emit('parse', {
+			'method': method, 'text': text, 'path': path,
+			'result': result, 'duration_ns': duration
+		})
+	
+	def _instrumented_parse(
+		self,
+		parse: Callable[[type[ANPlusB], str], ANPlusB], /
+	) -> Callable[[type[ANPlusB], str], ANPlusB]:
+		def instrumented_parse(cls: type[ANPlusB], text: str, /) -> ANPlusB:
+			start = perf_counter_ns()
+			result: ANPlusB | ParseError | None = None
+			
+			try:
+				result = parse(cls, text)
+			except ParseError as error:
+				result = error
+				raise
+			else:
+				return result
+			finally:
+				self._record_parse(
+					'parse', text, result, start,
+					failed = isinstance(result, ParseError)
+				)
+		
+		instrumented_parse.__doc__ = parse.__doc__
+		
+		return instrumented_parse
+	
+	def _instrumented_try_parse(
+		self,
+		try_parse: Callable[[type[ANPlusB], str], ANPlusB | None], /
+	) -> Callable[[type[ANPlusB], str], ANPlusB | None]:
+		def instrumented_try_parse(
+			cls: type[ANPlusB], text: str, /
+		) -> ANPlusB | None:
+			start = perf_counter_ns()
+			result = try_parse(cls, text)
+			
+			self._record_parse(
+				'try_parse', text, result, start,
+				failed = result is None
+			)
+			
+			return result
+		
+		instrumented_try_parse.__doc__ = try_parse.__doc__
+		
+		return instrumented_try_parse
+	
+	def _instrumented_is_valid(
+		self,
+		is_valid: Callable[[str], bool], /
+	) -> Callable[[str], bool]:
+		def instrumented_is_valid(text: str, /) -> bool:
+			start = perf_counter_ns()
+			result = is_valid(text)
+			
+			self._record_parse(
+				'is_valid', text, result, start,
+				failed = not result
+			)
+			
+			return result
+		
+		instrumented_is_valid.__doc__ = is_valid.__doc__
+		
+		return instrumented_is_valid
+	
+	def _instrumented_indices(
+		self,
+		indices: Callable[..., Iterator[int]], /
+	) -> Callable[..., Iterator[int]]:
+		def instrumented_indices(
+			instance: ANPlusB, population: int, *,
+			from_last: bool = False,
+			order: str = 'default'
+		) -> Iterator[int]:
+			iterator = indices(
+				instance, population,
+				from_last = from_last,
+				order = order
+			)
+			start = perf_counter_ns()
+			
+			self._counters['indices.calls'] += 1
+			
+			# Steps and offsets both non-positive
+			# never reach the zero step branch.
+			if instance.step == 0 and instance.offset > 0:
+				self._counters['indices.zero_step'] += 1
+			
+			self._observe('indices.population', population)
+			self._emit('indices', {
+				'instance': instance, 'population': population,
+				'from_last': from_last, 'order': order
+			})
+			
+			return self._measured(iterator, start)
+		
+		instrumented_indices.__doc__ = indices.__doc__
+		
+		return instrumented_indices
+	
+	def _measured(
+		self,
+		iterator: Iterator[int],
+		start: int, /
+	) -> Iterator[int]:
+		yielded = 0
+		
+		try:
+			for index in iterator:
+				yielded += 1
+				yield index
+		finally:
+			duration = perf_counter_ns() - start
+			
+			self._observe('indices.yielded', yielded)
+			self._observe('indices.duration_ns', duration)
+			self._emit('indices_done', {
+				'yielded': yielded, 'duration_ns': duration
+			})
+
+
+instrumentation = Instrumentation()
+'''
+The global :class:`Instrumentation` instance.
+'''
@@ -0,0 +1,194 @@
+'''
+Deferred parsing of ``an+b`` arguments.
+'''
+
+from collections.abc import Iterator
+
+from ._a_n_plus_b import (
+	ANPlusB,
+	EmptyInput,
+	InputIsNotParsable,
+	_InfiniteRange  # pyright: ignore[reportPrivateUsage]
+)
+from ._complement import Complement
+from ._grammar import normalize
+
+
+type Source = str | bytes | bytearray | memoryview
+
+
+# Every character that may appear in a valid argument:
+# digits, signs, whitespace and the letters of "n", "odd" and "even".
+_allowed = '0123456789+-\t\n\f\r\x20nNoOdDeEvV'
+_allowed_bytes = _allowed.encode('ascii')
+_deletions = str.maketrans('', '', _allowed)
+
+
+def _disallowed(source: str | bytes, /) -> bool:
+	# Only the disallowed characters are kept, so for valid
+	# sources, neither of these copies anything.
+	if isinstance(source, str):
+		return bool(source.translate(_deletions))
+	
+	return bool(source.translate(None, _allowed_bytes))
+
+
+class LazyANPlusB:
+	'''
+	An :class:`ANPlusB` object that is only parsed when
+	one of its properties or methods is first used.
+	
+	The source is checked for characters that cannot appear in
+	a valid argument on creation; the full parse is deferred and
+	its result, or the error it raised, is cached afterwards.
+	'''
+	
+	__slots__ = ('_parsed', '_source', '_unparsable')
+	
+	_parsed: ANPlusB | None
+	_source: str | bytes
+	_unparsable: str | None
+	
+	def __init__(self, source: Source, /) -> None:
+		'''
+		:param source: \
+			The text to parse, or a buffer holding it as ASCII.
+			:class:`str` and :class:`bytes` objects are kept as is;
+			other buffers are copied once, so that changing or
+			resizing them afterwards does not affect the result.
+		:raise EmptyInput: If the source is empty or only contains whitespace.
+		:raise InputIsNotParsable: \
+			If the source contains a character
+			that cannot appear in a valid argument.
+		'''
+		
+		if not isinstance(source, str | bytes):
+			source = bytes(source)
+		
+		if _disallowed(source):
+			text = source if isinstance(source, str) \
+				else source.decode('ascii', 'backslashreplace')
+			
+			raise InputIsNotParsable(normalize(text))
+		
+		# The only whitespace characters allowed
+		# are those tolerated by ANPlusB.parse().
+		if not source or source.isspace():
+			raise EmptyInput
+		
+		self._source = source
+		self._parsed = None
+		self._unparsable = None
+	
+	def _text(self) -> str:
+		source = self._source
+		
+		if isinstance(source, str):
+			return source
+		
+		return source.decode('ascii')
+	
+	def __repr__(self) -> str:
+		if self._parsed is not None:
+			return f'{self.__class__.__name__}({self._parsed})'
+		
+		return f'{self.__class__.__name__}({self._text()!r})'
+	
+	def __str__(self) -> str:
+		return str(self.instance)
+	
+	@property
+	def is_parsed(self) -> bool:
+		'''
+		Whether the source has already been parsed.
+		'''
+		
+		return self._parsed is not None or self._unparsable is not None
+	
+	@property
+	def instance(self) -> ANPlusB:
+		'''
+		The parsed :class:`ANPlusB` object.
+		
+		:raise InputIsNotParsable: If the source is not parsable.
+		'''
+		
+		if self._parsed is not None:
+			return self._parsed
+		
+		if self._unparsable is None:
+			text = self._text()
+			parsed = ANPlusB.try_parse(text)
+			
+			if parsed is not None:
+				self._parsed = parsed
+				# The source is no longer needed.
+				self._source = ''
+				return parsed
+			
+			self._unparsable = normalize(text)
+		
+		raise InputIsNotParsable(self._unparsable)
+	
+	@property
+	def step(self) -> int:
+		'''
+		The step, also known as ``a``.
+		
+		:raise InputIsNotParsable: If the source is not parsable.
+		'''
+		
+		return self.instance.step
+	
+	@property
+	def offset(self) -> int:
+		'''
+		The offset, also known as ``b``.
+		
+		:raise InputIsNotParsable: If the source is not parsable.
+		'''
+		
+		return self.instance.offset
+	
+	def indices(
+		self, population: int, *,
+		from_last: bool = False,
+		order: str = 'default'
+	) -> Iterator[int]:
+		'''
+		Same as :meth:`ANPlusB.indices`.
+		
+		:raise InputIsNotParsable: If the source is not parsable.
+		'''
+		
+		return self.instance.indices(
+			population,
+			from_last = from_last,
+			order = order
+		)
+	
+	def complement(
+		self, population: int, *,
+		from_last: bool = False,
+		order: str = 'default'
+	) -> Complement:
+		'''
+		Same as :meth:`ANPlusB.complement`.
+		
+		:raise InputIsNotParsable: If the source is not parsable.
+		'''
+		
+		return self.instance.complement(
+			population,
+			from_last = from_last,
+			order = order
+		)
+	
+	def values(self) -> _InfiniteRange:
+		'''
+		Same as :meth:`ANPlusB.values`.
+		
+		:raise InputIsNotParsable: If the source is not parsable.
+		'''
+		
+		return self.instance.values()
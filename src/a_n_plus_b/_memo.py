@@ -0,0 +1,216 @@
+'''
+An opt-in, memory-bounded cache of materialized indices.
+'''
+
+import sys
+from collections.abc import Sequence
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren, InvalidOrder
+from ._progressions import length, ordered_indices
+
+
+type _Key = tuple[int, int, int, bool, str]
+
+
+# Integers from -5 to 256 are shared by the interpreter.
+_largest_shared_integer = 256
+
+
+class InvalidCacheSize(ValueError):
+	'''
+	Raised when a negative maximum length
+	is passed to :class:`IndicesCache`.
+	'''
+	
+	def __init__(self, value: object, /) -> None:
+		'''
+		:param value: The value passed to :class:`IndicesCache`.
+		'''
+		
+		super().__init__(f'Expected a non-negative number, got: {value!r}')
+
+
+def _size_of(indices: tuple[int, ...], /) -> int:
+	return sys.getsizeof(indices) + sum(
+		sys.getsizeof(index) for index in indices
+		if index > _largest_shared_integer
+	)
+
+
+class IndicesCache:
+	'''
+	A cache of the indices :meth:`ANPlusB.indices` would yield,
+	keyed on ``(step, offset, population, from_last, order)``.
+	
+	Results are stored as tuples, so that code laying out the same
+	populations with the same patterns again and again does not
+	regenerate them. The total number of indices stored is bounded
+	by ``max_length``; the least recently used entries are evicted
+	first. Results longer than that are returned as :class:`range`
+	objects, which take constant memory, and are not stored;
+	neither are empty results.
+	'''
+	
+	__slots__ = (
+		'_entries', '_evictions', '_hits', '_length',
+		'_max_length', '_misses', '_nbytes'
+	)
+	
+	_entries: dict[_Key, tuple[tuple[int, ...], int]]
+	_evictions: int
+	_hits: int
+	_length: int
+	_max_length: int
+	_misses: int
+	_nbytes: int
+	
+	def __init__(self, max_length: int = 1 << 16, /) -> None:
+		'''
+		:param max_length: The maximum number of indices to store.
+		:raise InvalidCacheSize: If ``max_length`` is negative.
+		'''
+		
+		if max_length < 0:
+			raise InvalidCacheSize(max_length)
+		
+		self._max_length = max_length
+		self._entries = {}
+		self._length = self._nbytes = 0
+		self._hits = self._misses = self._evictions = 0
+	
+	def __repr__(self) -> str:
+		entries, length, max_length = len(self), self._length, self._max_length
+		
+		return (
+			f'{self.__class__.__name__}('
+			f'{entries = }, {length = }, {max_length = })'
+		)
+	
+	def __len__(self) -> int:
+		'''
+		The number of results stored.
+		'''
+		
+		return len(self._entries)
+	
+	@property
+	def max_length(self) -> int:
+		'''
+		The maximum number of indices stored across all results.
+		'''
+		
+		return self._max_length
+	
+	@property
+	def length(self) -> int:
+		'''
+		The number of indices stored across all results.
+		'''
+		
+		return self._length
+	
+	@property
+	def nbytes(self) -> int:
+		'''
+		The approximate memory held by the stored results, in bytes.
+		'''
+		
+		return self._nbytes
+	
+	@property
+	def hits(self) -> int:
+		'''
+		The number of lookups answered from the cache.
+		'''
+		
+		return self._hits
+	
+	@property
+	def misses(self) -> int:
+		'''
+		The number of lookups that had to compute the result.
+		'''
+		
+		return self._misses
+	
+	@property
+	def evictions(self) -> int:
+		'''
+		The number of results evicted to make room for others.
+		'''
+		
+		return self._evictions
+	
+	def indices(
+		self, pattern: ANPlusB, population: int, /, *,
+		from_last: bool = False,
+		order: str = 'default'
+	) -> Sequence[int]:
+		'''
+		Return the indices :meth:`ANPlusB.indices` would yield,
+		in the same order, as a tuple or a :class:`range`.
+		
+		:param pattern: The pattern to evaluate.
+		:param population: The number of children.
+		:param from_last: Same as for :meth:`ANPlusB.indices`.
+		:param order: Same as for :meth:`ANPlusB.indices`.
+		:raise InvalidOrder: If ``order`` is not valid.
+		:raise InvalidNumberOfChildren: If ``population`` is negative.
+		'''
+		
+		key = (pattern.step, pattern.offset, population, from_last, order)
+		entries = self._entries
+		
+		if (entry := entries.pop(key, None)) is not None:
+			# Reinserting moves the entry to the most recent end.
+			entries[key] = entry
+			self._hits += 1
+			
+			return entry[0]
+		
+		if order not in ('ascending', 'descending', 'default'):
+			raise InvalidOrder(order)
+		
+		if population < 0:
+			raise InvalidNumberOfChildren(population)
+		
+		self._misses += 1
+		
+		progression = ordered_indices(
+			pattern.step, pattern.offset, population,
+			from_last = from_last,
+			order = order
+		)
+		
+		if not progression:
+			return ()
+		
+		if length(progression) > self._max_length:
+			return progression
+		
+		indices = tuple(progression)
+		self._evict(self._max_length - len(indices))
+		
+		nbytes = _size_of(indices)
+		entries[key] = (indices, nbytes)
+		self._length += len(indices)
+		self._nbytes += nbytes
+		
+		return indices
+	
+	def _evict(self, max_length: int, /) -> None:
+		entries = self._entries
+		
+		while self._length > max_length:
+			indices, nbytes = entries.pop(next(iter(entries)))
+			self._length -= len(indices)
+			self._nbytes -= nbytes
+			self._evictions += 1
+	
+	def clear(self) -> None:
+		'''
+		Remove all stored results. Statistics are kept.
+		'''
+		
+		self._entries.clear()
+		self._length = self._nbytes = 0
@@ -0,0 +1,209 @@
+'''
+Shortest serializations and a stylesheet rewriter using them.
+'''
+
+import re
+from collections.abc import Iterable, Iterator
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren
+from ._relations import positions, universe
+
+
+_marker = re.compile(rb':nth-(?:last-)?(?:child|of-type)\(', re.IGNORECASE)
+_of = re.compile(r'\sof\s', re.IGNORECASE)
+
+_longest_marker = len(b':nth-last-of-type(')
+
+# Arguments longer than this are left as is,
+# which bounds the number of bytes held back.
+_maximum_argument = 1024
+
+
+def _candidates(
+	matched: range,
+	population: int, /, *,
+	bounded: bool
+) -> Iterator[ANPlusB]:
+	'''
+	Yield patterns matching exactly the given positions.
+	'''
+	
+	if not matched:
+		yield ANPlusB(0)
+		return
+	
+	first, last, step = matched[0], matched[-1], matched.step
+	
+	if first == last:
+		yield ANPlusB(first)
+		return
+	
+	reaches_end = last + step > population
+	
+	if reaches_end:
+		yield ANPlusB(step, first)
+		
+		if first <= step:
+			yield ANPlusB(step, first - step)
+	
+	if first <= step and (bounded or not reaches_end):
+		yield ANPlusB(-step, last)
+
+
+def minify(instance: ANPlusB, population: int | None = None, /) -> str:
+	'''
+	Return the shortest serialization of a pattern
+	matching the same children as ``instance``,
+	such as ``odd`` for ``2n+1`` or ``3n`` for ``3n+3``.
+	
+	If ``population`` is given, the result only needs to
+	be equivalent for that number of children: for example,
+	``-n+1000`` becomes ``n`` for a list of 10 children.
+	
+	:param instance: The pattern to serialize.
+	:param population: The number of children, if known.
+	:raise InvalidNumberOfChildren: If ``population`` is negative.
+	'''
+	
+	bounded = population is not None
+	pattern = (instance.step, instance.offset)
+	
+	if population is None:
+		population = universe([pattern])
+	elif population < 0:
+		raise InvalidNumberOfChildren(population)
+	
+	matched = positions(pattern, population)
+	serializations = [str(instance)]
+	
+	for candidate in _candidates(matched, population, bounded = bounded):
+		serialization = str(candidate)
+		serializations.append(
+			'odd' if serialization == '2n+1' else serialization
+		)
+	
+	return min(serializations, key = len)
+
+
+def _minified_argument(argument: bytes, population: int | None, /) -> bytes:
+	'''
+	Minify the ``an+b`` part of an argument, keeping
+	any ``of <selector>`` part as is. Arguments that
+	cannot be parsed are returned unchanged.
+	'''
+	
+	try:
+		text = argument.decode('ascii')
+	except UnicodeDecodeError:
+		return argument
+	
+	selector = ''
+	
+	if match := _of.search(text):
+		selector = ' ' + text[match.start():].lstrip()
+		text = text[:match.start()]
+	
+	text = text.strip()
+	
+	# ANPlusB.parse reads an unsigned ``n`` as ``0n``,
+	# whereas in CSS it means ``1n``.
+	if text[:1] in ('n', 'N'):
+		text = '+' + text
+	
+	instance = ANPlusB.try_parse(text)
+	
+	if instance is None:
+		return argument
+	
+	return (minify(instance, population) + selector).encode('ascii')
+
+
+def _rewritten(
+	buffer: bytes,
+	population: int | None, /, *,
+	final: bool
+) -> tuple[bytes, bytes]:
+	'''
+	Rewrite the arguments in ``buffer``. Unless the buffer
+	is the last one, a trailing part that might be continued
+	by the next chunk is held back and returned separately.
+	'''
+	
+	parts: list[bytes] = []
+	position = 0
+	
+	for match in _marker.finditer(buffer):
+		if match.start() < position:
+			continue
+		
+		start = match.end()
+		end = buffer.find(b')', start, start + _maximum_argument)
+		
+		if end == -1:
+			if not final and len(buffer) - start < _maximum_argument:
+				parts.append(buffer[position:match.start()])
+				return b''.join(parts), buffer[match.start():]
+			
+			continue
+		
+		parts.append(buffer[position:start])
+		parts.append(_minified_argument(buffer[start:end], population))
+		position = end
+	
+	cut = len(buffer)
+	
+	if not final:
+		colon = buffer.find(b':', max(position, cut - _longest_marker + 1))
+		cut = cut if colon == -1 else colon
+	
+	parts.append(buffer[position:cut])
+	
+	return b''.join(parts), buffer[cut:]
+
+
+def minify_stylesheet(
+	chunks: Iterable[bytes],
+	population: int | None = None, /
+) -> Iterator[bytes]:
+	'''
+	Lazily rewrite a stylesheet, given as chunks of bytes,
+	replacing the arguments of ``:nth-child()``, ``:nth-last-child()``,
+	``:nth-of-type()`` and ``:nth-last-of-type()``
+	with their shortest serializations.
+	
+	The stylesheet is not tokenized: the pseudo-classes are found
+	by a byte search, everything else is passed through untouched.
+	Occurrences inside comments and strings are rewritten too.
+	Arguments that are not valid ``an+b``, optionally followed
+	by ``of <selector>``, are left as is.
+	
+	:param chunks: The stylesheet, split at arbitrary positions.
+	:param population: \
+		The number of children of every element
+		the stylesheet applies to, if known.
+	:raise InvalidNumberOfChildren: If ``population`` is negative.
+	'''
+	
+	if population is not None and population < 0:
+		raise InvalidNumberOfChildren(population)
+	
+	return _rewrite(chunks, population)
+
+
+def _rewrite(
+	chunks: Iterable[bytes],
+	population: int | None, /
+) -> Iterator[bytes]:
+	buffer = b''
+	
+	for chunk in chunks:
+		buffer += chunk
+		processed, buffer = _rewritten(buffer, population, final = False)
+		
+		if processed:
+			yield processed
+	
+	processed, _ = _rewritten(buffer, population, final = True)
+	
+	if processed:
+		yield processed
@@ -0,0 +1,375 @@
+'''
+Choice between the ways of evaluating a pattern
+against one or many populations.
+'''
+
+from collections.abc import Callable, Iterable
+from math import log2
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren
+from ._predicates import compile_predicate
+from ._progressions import length, matched_indices
+
+
+type _Evaluator = Callable[..., list[int]]
+
+
+strategies = ('range', 'strided', 'predicate', 'table')
+
+# The total population below which planning is not worth it.
+_few_children = 64
+
+
+class InvalidStrategy(ValueError):
+	'''
+	Raised when an unknown strategy is passed
+	to :func:`bitmask` or :func:`bitmasks`.
+	'''
+	
+	def __init__(self, value: object, /) -> None:
+		'''
+		:param value: The strategy passed.
+		'''
+		
+		expected = ', '.join(map(repr, strategies))
+		
+		super().__init__(f'Expected one of {expected}, got: {value!r}')
+
+
+class Plan:
+	'''
+	The strategy chosen to evaluate a pattern against
+	a batch of populations, along with the estimated cost
+	of every strategy, in nanoseconds, for debugging.
+	
+	The strategies are:
+	
+	* ``range``: Set one bit per matched index.
+	* ``strided``: Double a strided pattern of bits until complete.
+	* ``predicate``: Test every index with :meth:`ANPlusB.compile`.
+	* ``table``: Cut each bitmask out of one built beforehand.
+	
+	The ``table`` strategy builds a bitmask per residue modulo
+	the step for the largest population, and is only worth it
+	for large batches.
+	
+	Batches of few children in total always use ``range``,
+	as estimating the costs would take longer than
+	any difference between the strategies.
+	'''
+	
+	__slots__ = ('_costs', '_strategy')
+	
+	_costs: dict[str, float]
+	_strategy: str
+	
+	def __init__(self, strategy: str, costs: dict[str, float], /) -> None:
+		'''
+		:param strategy: The strategy chosen.
+		:param costs: The estimated cost of each strategy.
+		'''
+		
+		self._strategy = strategy
+		self._costs = costs
+	
+	def __repr__(self) -> str:
+		strategy = self._strategy
+		costs = {name: round(cost) for name, cost in self._costs.items()}
+		
+		return f'{self.__class__.__name__}({strategy = }, {costs = })'
+	
+	@property
+	def strategy(self) -> str:
+		'''
+		The strategy chosen, usually the one
+		with the lowest estimated cost.
+		'''
+		
+		return self._strategy
+	
+	@property
+	def costs(self) -> dict[str, float]:
+		'''
+		The estimated cost of each strategy, in nanoseconds.
+		'''
+		
+		return dict(self._costs)
+
+
+# Rough costs measured on CPython, in nanoseconds: a fixed
+# overhead per population, plus costs per operation and per
+# bit of the integers created. Only their ratios matter.
+
+def _estimates(
+	indices: range, population: int, /
+) -> tuple[float, float, float]:
+	count = length(indices)
+	first = indices.start
+	last = first + (count - 1) * indices.step
+	
+	return (
+		1500 + count * (70 + (first + last) * 0.006),
+		1500 + 150 * log2(count + 1) + (last - first) * 0.2 + first * 0.01,
+		1000 + population * 180
+	)
+
+
+def _table_cost(
+	step: int, populations: list[int], /, *,
+	from_last: bool
+) -> float:
+	stride = abs(step) or 1
+	largest = max(populations)
+	# Without from_last, the first index always
+	# has the same residue modulo the step.
+	residues = min(stride, len(populations)) if from_last else 1
+	build = 150 * log2(largest // stride + 1) + largest * 0.2
+	cut = 1800 * len(populations) + sum(populations) * 0.1
+	
+	return residues * build + cut
+
+
+def _costs(
+	pattern: ANPlusB, populations: list[int], /, *,
+	from_last: bool
+) -> tuple[float, ...]:
+	'''
+	The estimated cost of each strategy, in the order of
+	:data:`strategies`. Populations are assumed to be
+	all like the average one.
+	'''
+	
+	count = len(populations)
+	average = sum(populations) // (count or 1)
+	indices = matched_indices(
+		pattern.step, pattern.offset, average,
+		from_last = from_last
+	)
+	range_cost, strided_cost, predicate_cost = _estimates(indices, average)
+	costs = (count * range_cost, count * strided_cost, count * predicate_cost)
+	
+	if count <= 1:
+		return costs
+	
+	table_cost = _table_cost(pattern.step, populations, from_last = from_last)
+	
+	return (*costs, table_cost)
+
+
+def _cheapest(costs: tuple[float, ...], /) -> str:
+	return strategies[costs.index(min(costs))]
+
+
+def plan(
+	pattern: ANPlusB, populations: int | Iterable[int], /, *,
+	from_last: bool = False
+) -> Plan:
+	'''
+	Estimate the cost of evaluating ``pattern`` against the given
+	population or batch of populations using each strategy,
+	and choose the cheapest.
+	
+	:param pattern: The pattern to evaluate.
+	:param populations: A number of children, or many of them.
+	:param from_last: Whether to count indices from the last one.
+	:raise InvalidNumberOfChildren: If a population is negative.
+	'''
+	
+	if isinstance(populations, int):
+		populations = [populations]
+	
+	populations = _validated(populations)
+	costs = _costs(pattern, populations, from_last = from_last)
+	strategy = 'range' if sum(populations) <= _few_children \
+		else _cheapest(costs)
+	
+	return Plan(strategy, dict(zip(strategies, costs, strict = False)))
+
+
+def _validated(populations: Iterable[int], /) -> list[int]:
+	populations = list(populations)
+	
+	if populations and (smallest := min(populations)) < 0:
+		raise InvalidNumberOfChildren(smallest)
+	
+	return populations
+
+
+def _repeated(bits: int, stride: int, count: int, /) -> int:
+	'''
+	``count`` copies of the lowest bit of ``bits``,
+	``stride`` bits apart, built by doubling.
+	'''
+	
+	mask, copies = bits, 1
+	
+	while copies * 2 <= count:
+		mask |= mask << (stride * copies)
+		copies *= 2
+	
+	if copies < count:
+		mask |= (mask & ((1 << (stride * (count - copies))) - 1)) \
+			<< (stride * copies)
+	
+	return mask
+
+
+def _by_range(
+	pattern: ANPlusB, populations: list[int], /, *,
+	from_last: bool
+) -> list[int]:
+	step, offset = pattern.step, pattern.offset
+	masks: list[int] = []
+	
+	for population in populations:
+		mask = 0
+		
+		indices = matched_indices(
+			step, offset, population,
+			from_last = from_last
+		)
+		
+		for index in indices:
+			mask |= 1 << (index - 1)
+		
+		masks.append(mask)
+	
+	return masks
+
+
+def _by_stride(
+	pattern: ANPlusB, populations: list[int], /, *,
+	from_last: bool
+) -> list[int]:
+	step, offset = pattern.step, pattern.offset
+	masks: list[int] = []
+	
+	for population in populations:
+		indices = matched_indices(
+			step, offset, population,
+			from_last = from_last
+		)
+		
+		if not indices:
+			masks.append(0)
+			continue
+		
+		mask = _repeated(1, indices.step, length(indices))
+		masks.append(mask << (indices.start - 1))
+	
+	return masks
+
+
+def _by_predicate(
+	pattern: ANPlusB, populations: list[int], /, *,
+	from_last: bool
+) -> list[int]:
+	predicate = compile_predicate(
+		pattern.step, pattern.offset,
+		from_last = from_last
+	)
+	masks: list[int] = []
+	
+	for population in populations:
+		bits = ''.join([
+			'1' if predicate(index, population) else '0'
+			for index in range(population, 0, -1)
+		])
+		masks.append(int(bits or '0', 2))
+	
+	return masks
+
+
+def _by_table(
+	pattern: ANPlusB, populations: list[int], /, *,
+	from_last: bool
+) -> list[int]:
+	step, offset = pattern.step, pattern.offset
+	largest = max(populations, default = 0)
+	# Bitmasks of the indices from 1 to the largest population
+	# congruent to a given residue modulo the step.
+	table: dict[int, int] = {}
+	masks: list[int] = []
+	
+	for population in populations:
+		indices = matched_indices(
+			step, offset, population,
+			from_last = from_last
+		)
+		
+		if not indices:
+			masks.append(0)
+			continue
+		
+		stride, first = indices.step, indices.start
+		residue = (first - 1) % stride
+		
+		if (row := table.get(residue)) is None:
+			count = (largest - 1 - residue) // stride + 1
+			row = table[residue] = _repeated(1 << residue, stride, count)
+		
+		last = first + (length(indices) - 1) * stride
+		window = row & ((1 << last) - 1)
+		masks.append(window >> (first - 1) << (first - 1))
+	
+	return masks
+
+
+_evaluators: dict[str, _Evaluator] = {
+	'range': _by_range,
+	'strided': _by_stride,
+	'predicate': _by_predicate,
+	'table': _by_table
+}
+
+
+def bitmasks(
+	pattern: ANPlusB, populations: Iterable[int], /, *,
+	from_last: bool = False,
+	strategy: str | None = None
+) -> list[int]:
+	'''
+	Return, for each population, a bitmask whose bit ``i - 1``
+	is set if the ``i``-th child is matched by ``pattern``,
+	as accepted by :meth:`FilteredChildren.from_bitmask`.
+	
+	:param pattern: The pattern to evaluate.
+	:param populations: The numbers of children.
+	:param from_last: Whether to count indices from the last one.
+	:param strategy: \
+		One of the strategies described in :class:`Plan`,
+		or ``None`` to let :func:`plan` choose.
+	:raise InvalidStrategy: If ``strategy`` is not valid.
+	:raise InvalidNumberOfChildren: If a population is negative.
+	'''
+	
+	if strategy is not None and strategy not in _evaluators:
+		raise InvalidStrategy(strategy)
+	
+	populations = _validated(populations)
+	
+	if strategy is None and sum(populations) <= _few_children:
+		strategy = 'range'
+	elif strategy is None:
+		costs = _costs(pattern, populations, from_last = from_last)
+		strategy = _cheapest(costs)
+	
+	evaluate = _evaluators[strategy]
+	
+	return evaluate(pattern, populations, from_last = from_last)
+
+
+def bitmask(
+	pattern: ANPlusB, population: int, /, *,
+	from_last: bool = False,
+	strategy: str | None = None
+) -> int:
+	'''
+	Same as :func:`bitmasks`, for a single population.
+	'''
+	
+	return bitmasks(
+		pattern, [population],
+		from_last = from_last,
+		strategy = strategy
+	)[0]
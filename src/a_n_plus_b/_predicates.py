@@ -0,0 +1,99 @@
+'''
+Specialized membership predicates for :meth:`ANPlusB.compile`.
+'''
+
+from __future__ import annotations
+
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+	
+	type Predicate = Callable[[int, int], bool]
+
+
+def _never(_index: int, _population: int, /) -> bool:
+	return False
+
+
+def _zero_step(offset: int, /, *, from_last: bool) -> Predicate:
+	if from_last:
+		return lambda index, population: \
+			index == population + 1 - offset and index >= 1
+	
+	return lambda index, population: \
+		index == offset and offset <= population
+
+
+def _positive_step(step: int, offset: int, /, *, from_last: bool) -> Predicate:
+	# Positions from max(1, b) onwards,
+	# congruent to b modulo a.
+	lower = max(1, offset)
+	remainder = offset % step
+	
+	if from_last and step == 1:
+		return lambda index, population: \
+			1 <= index <= population + 1 - lower
+	
+	if from_last:
+		return lambda index, population: \
+			1 <= index <= population + 1 - lower \
+			and (population + 1 - index) % step == remainder
+	
+	if step == 1:
+		return lambda index, population: lower <= index <= population
+	
+	if lower == 1:
+		return lambda index, population: \
+			1 <= index <= population and index % step == remainder
+	
+	return lambda index, population: \
+		lower <= index <= population and index % step == remainder
+
+
+def _negative_step(step: int, offset: int, /, *, from_last: bool) -> Predicate:
+	# Positions from 1 to b, congruent to b modulo |a|.
+	step = -step
+	remainder = offset % step
+	
+	if from_last and step == 1:
+		return lambda index, population: \
+			population - offset < index <= population and index >= 1
+	
+	if from_last:
+		return lambda index, population: \
+			population - offset < index <= population and index >= 1 \
+			and (population + 1 - index) % step == remainder
+	
+	if step == 1:
+		return lambda index, population: \
+			1 <= index <= offset and index <= population
+	
+	return lambda index, population: \
+		1 <= index <= offset and index <= population \
+		and index % step == remainder
+
+
+def compile_predicate(
+	step: int, offset: int, /, *,
+	from_last: bool
+) -> Predicate:
+	'''
+	Build a function telling whether a 1-based index
+	is matched by ``an+b`` for a given population.
+	
+	The function is chosen for the given step and offset
+	so that it does as little work as possible per call.
+	'''
+	
+	if step <= 0 and offset <= 0:
+		return _never
+	
+	if step == 0:
+		return _zero_step(offset, from_last = from_last)
+	
+	if step > 0:
+		return _positive_step(step, offset, from_last = from_last)
+	
+	return _negative_step(step, offset, from_last = from_last)
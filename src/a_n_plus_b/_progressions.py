@@ -0,0 +1,104 @@
+'''
+The indices matched by ``an+b`` always form an arithmetic
+progression, represented here as a :class:`range`.
+'''
+
+
+def length(progression: range, /) -> int:
+	'''
+	Same as ``len(progression)``, but without
+	overflowing for very long ranges.
+	'''
+	
+	start, stop, step = progression.start, progression.stop, progression.step
+	
+	if step > 0:
+		return max(0, (stop - start + step - 1) // step)
+	
+	return max(0, (start - stop - step - 1) // -step)
+
+
+def matched_positions(step: int, offset: int, population: int, /) -> range:
+	'''
+	The 1-based positions matched among ``population`` children,
+	counted from the first and ordered by increasing ``n``.
+	'''
+	
+	a, b = step, offset
+	
+	if a == 0:
+		return range(b, b + 1) if 1 <= b <= population else range(0)
+	
+	if a < 0:
+		# 0 -> an -> -inf | 0 -> n -> inf
+		#
+		# n min <=> an + b max <=> an + b <= p
+		# b - |a|n <= p <=> n >= (b - p) / |a|
+		
+		min_n = max(0, -((population - b) // -a))
+		
+		return range(a * min_n + b, 0, a)
+	
+	# (a > 0)
+	# 1 <= an + b <= p
+	# 1 - b <= an <= p - b
+	#
+	# n min <=> an = 1 - b <=> n = (1 - b) / a
+	
+	min_n = max(0, -((b - 1) // a))
+	
+	return range(a * min_n + b, population + 1, a)
+
+
+def matched_indices(
+	step: int, offset: int, population: int, /, *,
+	from_last: bool
+) -> range:
+	'''
+	The 1-based indices matched among ``population`` children,
+	in ascending order.
+	'''
+	
+	positions = matched_positions(step, offset, population)
+	
+	if step < 0:
+		positions = positions[::-1]
+	
+	if not from_last or not positions:
+		return positions
+	
+	first, last = positions[0], positions[-1]
+	
+	return range(population + 1 - last, population + 2 - first, positions.step)
+
+
+def ordered_indices(
+	step: int, offset: int, population: int, /, *,
+	from_last: bool,
+	order: str
+) -> range:
+	'''
+	The 1-based indices matched among ``population`` children,
+	in the order :meth:`ANPlusB.indices` would yield them.
+	'''
+	
+	positions = matched_positions(step, offset, population)
+	default_order = 'descending' if step < 0 else 'ascending'
+	
+	if order == 'default':
+		reverse_order = False
+	elif order == default_order:
+		reverse_order = from_last
+	else:
+		reverse_order = not from_last
+	
+	if reverse_order:
+		positions = positions[::-1]
+	
+	if not from_last:
+		return positions
+	
+	start = population + 1 - positions.start
+	stop = population + 1 - positions.stop
+	
+	return range(start, stop, -positions.step)
@@ -0,0 +1,225 @@
+'''
+Set relations between the positions matched by ``an+b`` patterns.
+
+Patterns are compared as the ranges of positions they match
+among a number of children. When that number is not known,
+a number large enough for every relation to hold or not
+regardless of it is used instead, as explained in :func:`universe`.
+'''
+
+import math
+from itertools import pairwise
+
+from ._progressions import length, matched_indices
+
+
+type Pattern = tuple[int, int]
+
+
+def universe(patterns: list[Pattern], /) -> int:
+	'''
+	A number of children beyond which the relations
+	between the given patterns no longer change.
+	
+	Past all offsets, every pattern is either exhausted or
+	periodic with a period dividing the least common multiple
+	of the steps. Two such periods past the largest offset are
+	enough for every unbounded pattern to match at least twice,
+	which distinguishes it from one that is bounded.
+	'''
+	
+	offsets = max((offset for _, offset in patterns), default = 1)
+	period = math.lcm(*(abs(step) for step, _ in patterns if step))
+	
+	return max(1, offsets) + 2 * period + 1
+
+
+def positions(pattern: Pattern, population: int, /) -> range:
+	'''
+	The positions matched among ``population`` children,
+	in ascending order.
+	'''
+	
+	step, offset = pattern
+	
+	return matched_indices(step, offset, population, from_last = False)
+
+
+def to_pattern(
+	progression: range,
+	population: int | None, /
+) -> Pattern | None:
+	'''
+	A pattern matching exactly the given non-empty ascending
+	positions among ``population`` children, or ``None``
+	if there is none.
+	
+	If ``population`` is ``None``, the positions are
+	all those matched, however many children there are.
+	'''
+	
+	first, last, step = progression[0], progression[-1], progression.step
+	
+	if first == last:
+		return 0, first
+	
+	if population is not None and last + step > population:
+		return step, 0 if first == step else first
+	
+	if first - step < 1:
+		return -step, last
+	
+	return None
+
+
+def composition(
+	outer: Pattern, inner: Pattern,
+	population: int, /
+) -> range:
+	'''
+	The positions matched by ``outer`` among those matched by
+	``inner`` among ``population`` children, in ascending order.
+	
+	As the positions matched by ``inner`` form a progression,
+	picking some of them by their ordinals is slicing it.
+	'''
+	
+	matched = positions(inner, population)
+	ordinals = positions(outer, length(matched))
+	
+	if not ordinals:
+		return range(0)
+	
+	return matched[ordinals[0] - 1:ordinals[-1]:ordinals.step]
+
+
+def is_single(progression: range, /) -> bool:
+	return bool(progression) and progression[0] == progression[-1]
+
+
+def is_subset(this: range, other: range, /) -> bool:
+	'''
+	Whether all elements of ``this`` are also in ``other``.
+	'''
+	
+	if not this:
+		return True
+	
+	if not other or this[0] < other[0] or this[-1] > other[-1]:
+		return False
+	
+	# The elements of an arithmetic progression are all congruent
+	# modulo the step of another if the first one is and, unless
+	# there is only one, the step of the former is a multiple
+	# of the step of the latter.
+	if (this[0] - other[0]) % other.step:
+		return False
+	
+	return is_single(this) or this.step % other.step == 0
+
+
+def intersection(this: range, other: range, /) -> range:
+	'''
+	The elements common to both progressions, as a progression.
+	
+	The solutions of ``x = a (mod m)`` and ``x = b (mod k)``
+	are found using the Chinese remainder theorem.
+	'''
+	
+	if not this or not other:
+		return range(0)
+	
+	first, second = this.step, other.step
+	divisor = math.gcd(first, second)
+	difference = other[0] - this[0]
+	
+	if difference % divisor:
+		return range(0)
+	
+	modulus = second // divisor
+	multiplier = difference // divisor * pow(first // divisor, -1, modulus)
+	solution = this[0] + first * (multiplier % modulus)
+	
+	step = first // divisor * second
+	lowest = max(this[0], other[0])
+	highest = min(this[-1], other[-1])
+	start = lowest + (solution - lowest) % step
+	
+	return range(start, max(start, highest + 1), step)
+
+
+def span(this: range, other: range, /) -> range:
+	'''
+	The shortest progression containing both non-empty ones,
+	which is their union if their union is a progression.
+	'''
+	
+	step = math.gcd(
+		this.step if not is_single(this) else 0,
+		other.step if not is_single(other) else 0,
+		this[0] - other[0]
+	)
+	
+	# Two equal single elements.
+	if step == 0:
+		return this
+	
+	return range(
+		min(this[0], other[0]),
+		max(this[-1], other[-1]) + 1,
+		step
+	)
+
+
+# Beyond this many elements to check, covers() gives up.
+_most_checked = 1 << 16
+
+
+def covers(parts: list[range], whole: range, /) -> bool:
+	'''
+	Whether the union of the given non-empty subsets
+	of ``whole`` is ``whole`` itself.
+	
+	Between two consecutive bounds of the parts,
+	the same parts are present, so whether an element
+	is covered repeats with the least common multiple
+	of their steps, and only one such period is checked.
+	
+	This is conservative: ``False`` is also returned if
+	more than a fixed number of elements would be checked.
+	'''
+	
+	if any(part == whole for part in parts):
+		return True
+	
+	if sum(map(length, parts)) < length(whole):
+		return False
+	
+	step, checked = whole.step, 0
+	bounds = sorted({
+		whole[0], whole[-1] + step,
+		*(part[0] for part in parts),
+		*(part[-1] + step for part in parts)
+	})
+	
+	for start, stop in pairwise(bounds):
+		present = [
+			part for part in parts
+			if part[0] <= start and stop - step <= part[-1]
+		]
+		
+		if not present:
+			return False
+		
+		period = math.lcm(step, *(part.step for part in present))
+		elements = range(start, min(stop, start + period), step)
+		checked += length(elements)
+		
+		if checked > _most_checked:
+			return False
+		
+		for element in elements:
+			if all(element not in part for part in present):
+				return False
+	
+	return True
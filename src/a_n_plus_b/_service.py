@@ -0,0 +1,631 @@
+'''
+A newline-delimited JSON service exposing :meth:`ANPlusB.parse`
+and :meth:`ANPlusB.indices` to non-Python callers,
+along with a matching client.
+'''
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from collections import OrderedDict
+from time import perf_counter_ns
+from typing import Any, cast, Self
+
+from ._a_n_plus_b import (
+	ANPlusB,
+	InvalidNumberOfChildren,
+	InvalidOrder,
+	ParseError
+)
+from ._progressions import length, matched_positions
+
+
+type _JSON = Any
+type _Connection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+type _Connector = Callable[[], Awaitable[_Connection]]
+
+
+_STREAM_LIMIT = 1 << 24
+
+
+class ServiceError(ValueError):
+	'''
+	Raised by :class:`ServiceClient` when
+	the service responds with an error.
+	'''
+	
+	kind: str
+	
+	def __init__(self, kind: str, message: str, /) -> None:
+		'''
+		:param kind: The name of the error raised by the service.
+		:param message: The message of said error.
+		'''
+		
+		super().__init__(f'{kind}: {message}')
+		
+		self.kind = kind
+
+
+class _BadRequest(Exception):
+
+	def __init__(self, field: str, expected: type, /) -> None:
+		super().__init__(f'"{field}" must be of type {expected.__name__}')
+
+
+class _UnknownOperation(_BadRequest):
+
+	def __init__(self, value: object, /) -> None:
+		Exception.__init__(self, f'Unknown op: {value!r}')
+
+
+class _TooManyIndices(_BadRequest):
+
+	def __init__(self, count: int, limit: int, /) -> None:
+		Exception.__init__(
+			self, f'Expected at most {limit} indices, got: {count}'
+		)
+
+
+class _Failure(Exception):
+	'''
+	An error to be reported as is, with the name
+	of the exception originally raised.
+	'''
+	
+	kind: str
+	
+	def __init__(self, kind: str, message: str, /) -> None:
+		super().__init__(message)
+		
+		self.kind = kind
+
+
+class _MismatchedResponse(ConnectionError):
+
+	def __init__(self, expected: int, actual: object, /) -> None:
+		super().__init__(f'Expected a response to {expected}, got: {actual!r}')
+
+
+def _error(kind: str, message: str, /) -> dict[str, str]:
+	return {'kind': kind, 'message': message}
+
+
+_line_too_long = json.dumps(
+	{'id': None, 'error': _error('BadRequest', 'Line too long')},
+	separators = (',', ':')
+).encode() + b'\n'
+
+
+def _field[T](
+	request: Mapping[str, _JSON],
+	name: str,
+	expected: type[T], /
+) -> T:
+	value = request.get(name)
+	
+	if not isinstance(value, expected) or isinstance(value, bool):
+		raise _BadRequest(name, expected)
+	
+	return value
+
+
+def _parse_uncached(text: str, /) -> ANPlusB | tuple[str, str]:
+	# Errors are cached as their names and messages rather than
+	# as exception objects, each raise of which would add to
+	# their tracebacks, keeping more and more frames alive.
+	try:
+		return ANPlusB.parse(text)
+	except ParseError as error:
+		return error.__class__.__name__, str(error)
+
+
+class Service:
+	r'''
+	Serve requests over a Unix domain socket or TCP.
+	
+	Each request is a JSON object on its own line,
+	answered by exactly one JSON line, in order.
+	Clients may send many requests without waiting
+	for responses (pipelining).
+	
+	Requests look like this::
+	
+		{"id": 1, "op": "parse", "text": "2n+1"}
+		{"id": 2, "op": "indices", "text": "odd", "population": 5}
+		{"id": 3, "op": "batch", "requests": [...]}
+		{"id": 4, "op": "stats"}
+	
+	``indices`` also accepts ``from_last`` and ``order``,
+	and is rejected if it would return more than
+	``max_indices`` indices.
+	Responses contain the same ``id`` and either
+	a ``result`` or an ``error`` with a ``kind`` and a ``message``.
+	'''
+	
+	__slots__ = (  # noqa: RUF023
+		'_cache', '_cache_size', '_cache_hits', '_cache_misses', '_handlers',
+		'_max_indices', '_requests', '_errors', '_connections',
+		'_total_latency', '_max_latency'
+	)
+	
+	_cache: OrderedDict[str, ANPlusB | tuple[str, str]]
+	_cache_size: int
+	_cache_hits: int
+	_cache_misses: int
+	_handlers: dict[str, Callable[[Mapping[str, _JSON]], _JSON]]
+	_max_indices: int
+	
+	_requests: int
+	_errors: int
+	_connections: int
+	_total_latency: int
+	_max_latency: int
+	
+	def __init__(
+		self, *,
+		cache_size: int = 4096,
+		max_indices: int = 1 << 20
+	) -> None:
+		'''
+		:param cache_size: \
+			The number of parse results shared
+			by all connections.
+		:param max_indices: \
+			The largest number of indices returned
+			by a single ``indices`` request.
+		'''
+		
+		self._cache = OrderedDict()
+		self._cache_size = cache_size
+		self._max_indices = max_indices
+		self._handlers = {
+			'parse': self._handle_parse,
+			'indices': self._handle_indices,
+			'batch': self._handle_batch,
+			'stats': self._handle_stats
+		}
+		
+		self.reset_stats()
+	
+	def reset_stats(self) -> None:
+		'''
+		Reset all counters.
+		'''
+		
+		self._requests = 0
+		self._cache_hits = 0
+		self._cache_misses = 0
+		self._errors = 0
+		self._connections = 0
+		self._total_latency = 0
+		self._max_latency = 0
+	
+	def stats(self) -> dict[str, int | float]:
+		'''
+		Return throughput, latency and cache counters.
+		Latencies are in microseconds.
+		'''
+		
+		requests = self._requests
+		
+		return {
+			'requests': requests,
+			'errors': self._errors,
+			'connections': self._connections,
+			'mean_latency': self._total_latency / requests / 1000
+				if requests else 0.0,
+			'max_latency': self._max_latency / 1000,
+			'cache_hits': self._cache_hits,
+			'cache_misses': self._cache_misses,
+			'cache_size': len(self._cache)
+		}
+	
+	def _parse(self, text: str, /) -> ANPlusB | tuple[str, str]:
+		cache = self._cache
+		
+		if text in cache:
+			self._cache_hits += 1
+			cache.move_to_end(text)
+			
+			return cache[text]
+		
+		self._cache_misses += 1
+		result = cache[text] = _parse_uncached(text)
+		
+		if len(cache) > self._cache_size:
+			cache.popitem(last = False)
+		
+		return result
+	
+	def _instance(self, request: Mapping[str, _JSON], /) -> ANPlusB:
+		result = self._parse(_field(request, 'text', str))
+		
+		if isinstance(result, tuple):
+			raise _Failure(*result)
+		
+		return result
+	
+	def _handle_parse(self, request: Mapping[str, _JSON], /) -> _JSON:
+		instance = self._instance(request)
+		
+		return {
+			'step': instance.step,
+			'offset': instance.offset,
+			'text': str(instance)
+		}
+	
+	def _handle_indices(self, request: Mapping[str, _JSON], /) -> _JSON:
+		instance = self._instance(request)
+		population = _field(request, 'population', int)
+		
+		if population < 0:
+			raise InvalidNumberOfChildren(population)
+		
+		indices = instance.indices(
+			population,
+			from_last = bool(request.get('from_last', False)),
+			order = str(request.get('order', 'default'))
+		)
+		
+		# Checked before building the list, which would
+		# block every other connection for as long.
+		matched = matched_positions(instance.step, instance.offset, population)
+		
+		if (count := length(matched)) > self._max_indices:
+			raise _TooManyIndices(count, self._max_indices)
+		
+		return list(indices)
+	
+	def _handle_batch(self, request: Mapping[str, _JSON], /) -> _JSON:
+		requests = cast('list[object]', _field(request, 'requests', list))
+		
+		return [self._respond(item) for item in requests]
+	
+	def _handle_stats(self, _request: Mapping[str, _JSON], /) -> _JSON:
+		return self.stats()
+	
+	def _handler(
+		self,
+		operation: object, /
+	) -> Callable[[Mapping[str, _JSON]], _JSON]:
+		if not isinstance(operation, str) or operation not in self._handlers:
+			raise _UnknownOperation(operation)
+		
+		return self._handlers[operation]
+	
+	def _respond(self, message: _JSON, /) -> dict[str, _JSON]:
+		if not isinstance(message, dict):
+			self._errors += 1
+			return {'id': None, 'error': _error('BadRequest', 'Not an object')}
+		
+		request = cast('dict[str, _JSON]', message)
+		response: dict[str, _JSON] = {'id': request.get('id')}
+		
+		try:
+			response['result'] = self._handler(request.get('op'))(request)
+		
+		except _Failure as error:
+			self._errors += 1
+			response['error'] = _error(error.kind, str(error))
+		
+		except (
+			_BadRequest,
+			InvalidNumberOfChildren, InvalidOrder
+		) as error:
+			self._errors += 1
+			kind = 'BadRequest' if isinstance(error, _BadRequest) \
+				else error.__class__.__name__
+			response['error'] = _error(kind, str(error))
+		
+		return response
+	
+	def handle_line(self, line: bytes, /) -> bytes:
+		'''
+		Answer a single request line.
+		
+		:param line: The JSON-encoded request.
+		:return: The JSON-encoded response, including the newline.
+		'''
+		
+		start = perf_counter_ns()
+		
+		try:
+			request = json.loads(line)
+		except ValueError:
+			self._errors += 1
+			response = {'id': None, 'error': _error('BadRequest', 'Bad JSON')}
+		else:
+			response = self._respond(request)
+		
+		encoded = json.dumps(response, separators = (',', ':')).encode()
+		latency = perf_counter_ns() - start
+		
+		self._requests += 1
+		self._total_latency += latency
+		self._max_latency = max(self._max_latency, latency)
+		
+		return encoded + b'\n'
+	
+	async def _serve_connection(
+		self,
+		reader: asyncio.StreamReader,
+		writer: asyncio.StreamWriter
+	) -> None:
+		self._connections += 1
+		
+		try:
+			while True:
+				try:
+					line = await reader.readline()
+				except ValueError:
+					# The line exceeds the limit. What follows is the rest
+					# of it, so the connection cannot be recovered.
+					self._errors += 1
+					writer.write(_line_too_long)
+					await writer.drain()
+					break
+				
+				if not line:
+					break
+				
+				if line.strip():
+					writer.write(self.handle_line(line))
+					await writer.drain()
+		
+		except ConnectionError:
+			pass
+		
+		finally:
+			writer.close()
+	
+	async def start_tcp(
+		self,
+		host: str = '127.0.0.1',
+		port: int = 0
+	) -> asyncio.Server:
+		'''
+		Start listening on a TCP socket.
+		
+		:param host: The host to bind to.
+		:param port: The port to bind to; ``0`` means any free port.
+		:return: The started server.
+		'''
+		
+		return await asyncio.start_server(
+			self._serve_connection, host, port,
+			limit = _STREAM_LIMIT
+		)
+	
+	async def start_unix(self, path: str) -> asyncio.Server:
+		'''
+		Start listening on a Unix domain socket.
+		
+		:param path: The path of the socket.
+		:return: The started server.
+		'''
+		
+		return await asyncio.start_unix_server(
+			self._serve_connection, path,
+			limit = _STREAM_LIMIT
+		)
+
+
+class ServiceClient:
+	'''
+	Asynchronous client for :class:`Service`
+	with a fixed-size pool of connections.
+	
+	A connection that fails or is interrupted in the middle
+	of a request is closed rather than reused, and is replaced
+	by a new one the next time it is needed.
+	'''
+	
+	__slots__ = ('_connect', '_connections', '_next_id', '_pool')
+	
+	_connect: _Connector
+	_pool: asyncio.Queue[_Connection | None]
+	_connections: list[_Connection]
+	_next_id: int
+	
+	def __init__(
+		self, connections: Iterable[_Connection], /, *,
+		connect: _Connector
+	) -> None:
+		'''
+		Use :meth:`connect_tcp` or :meth:`connect_unix` instead.
+		
+		:param connections: The pooled connections.
+		:param connect: A function opening a replacement connection.
+		'''
+		
+		self._connect = connect
+		self._connections = list(connections)
+		self._pool = asyncio.Queue()
+		self._next_id = 0
+		
+		for connection in self._connections:
+			self._pool.put_nowait(connection)
+	
+	@classmethod
+	async def connect_tcp(
+		cls, host: str, port: int, /, *,
+		pool_size: int = 4
+	) -> Self:
+		'''
+		Open ``pool_size`` TCP connections to a :class:`Service`.
+		'''
+		
+		def connect() -> Awaitable[_Connection]:
+			return asyncio.open_connection(host, port, limit = _STREAM_LIMIT)
+		
+		connections = await asyncio.gather(*(
+			connect() for _ in range(pool_size)
+		))
+		
+		return cls(connections, connect = connect)
+	
+	@classmethod
+	async def connect_unix(cls, path: str, /, *, pool_size: int = 4) -> Self:
+		'''
+		Open ``pool_size`` Unix socket connections to a :class:`Service`.
+		'''
+		
+		def connect() -> Awaitable[_Connection]:
+			return asyncio.open_unix_connection(path, limit = _STREAM_LIMIT)
+		
+		connections = await asyncio.gather(*(
+			connect() for _ in range(pool_size)
+		))
+		
+		return cls(connections, connect = connect)
+	
+	async def close(self) -> None:
+		'''
+		Close all connections.
+		'''
+		
+		for _, writer in self._connections:
+			writer.close()
+		
+		for _, writer in self._connections:
+			await writer.wait_closed()
+	
+	async def __aenter__(self) -> Self:
+		return self
+	
+	async def __aexit__(self, *_: object) -> None:
+		await self.close()
+	
+	async def _acquire(self) -> _Connection:
+		connection = await self._pool.get()
+		
+		if connection is not None:
+			return connection
+		
+		try:
+			connection = await self._connect()
+		except BaseException:
+			self._pool.put_nowait(None)
+			raise
+		
+		self._connections.append(connection)
+		
+		return connection
+	
+	def _discard(self, connection: _Connection, /) -> None:
+		connection[1].close()
+		self._connections.remove(connection)
+		self._pool.put_nowait(None)
+	
+	async def pipeline(
+		self,
+		requests: Iterable[Mapping[str, _JSON]], /
+	) -> list[_JSON]:
+		'''
+		Send many requests over one connection without
+		waiting in between, then collect their raw responses.
+		
+		:param requests: The requests, without ``id``.
+		:return: The ``result`` or ``error`` of each request, in order.
+		:raise ConnectionError: \
+			If the connection is lost or a response
+			does not answer the expected request.
+		'''
+		
+		payload = bytearray()
+		ids: list[int] = []
+		
+		for request in requests:
+			self._next_id += 1
+			message = {**request, 'id': self._next_id}
+			payload += json.dumps(message, separators = (',', ':')).encode()
+			payload += b'\n'
+			ids.append(self._next_id)
+		
+		connection = await self._acquire()
+		reader, writer = connection
+		
+		try:
+			writer.write(payload)
+			await writer.drain()
+			
+			responses = [await self._receive(reader, id_) for id_ in ids]
+		
+		except BaseException:
+			# Unread responses would otherwise
+			# be received by the next caller.
+			self._discard(connection)
+			raise
+		
+		self._pool.put_nowait(connection)
+		
+		return responses
+	
+	@staticmethod
+	async def _receive(reader: asyncio.StreamReader, id_: int, /) -> _JSON:
+		line = await reader.readline()
+		
+		if not line:
+			raise ConnectionResetError
+		
+		response = json.loads(line)
+		
+		if not isinstance(response, dict):
+			raise _MismatchedResponse(id_, response)
+		
+		fields = cast('dict[str, _JSON]', response)
+		
+		if fields.get('id') != id_:
+			raise _MismatchedResponse(id_, fields.get('id'))
+		
+		return fields
+	
+	async def request(self, request: Mapping[str, _JSON], /) -> _JSON:
+		'''
+		Send a single request and return its ``result``.
+		
+		:raise ServiceError: If the service responds with an error.
+		'''
+		
+		[response] = await self.pipeline([request])
+		
+		if 'error' in response:
+			error = response['error']
+			raise ServiceError(error['kind'], error['message'])
+		
+		return response['result']
+	
+	async def parse(self, text: str, /) -> ANPlusB:
+		'''
+		Remote equivalent of :meth:`ANPlusB.parse`.
+		
+		:raise ServiceError: If the text is not parsable.
+		'''
+		
+		result = await self.request({'op': 'parse', 'text': text})
+		
+		return ANPlusB(result['step'], result['offset'])
+	
+	async def indices(
+		self, text: str, population: int, *,
+		from_last: bool = False,
+		order: str = 'default'
+	) -> list[int]:
+		'''
+		Remote equivalent of :meth:`ANPlusB.indices`.
+		
+		:raise ServiceError: If any of the arguments is invalid.
+		'''
+		
+		return await self.request({  # type: ignore[no-any-return]
+			'op': 'indices', 'text': text, 'population': population,
+			'from_last': from_last, 'order': order
+		})
+	
+	async def stats(self) -> dict[str, int | float]:
+		'''
+		Return the counters of the service.
+		'''
+		
+		return await self.request({'op': 'stats'})  # type: ignore[no-any-return]
@@ -0,0 +1,145 @@
+'''
+Reduction of a union of patterns to fewer equivalent ones.
+'''
+
+from collections.abc import Iterable
+from itertools import combinations
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren
+from ._relations import covers, is_subset, positions, span, to_pattern, universe
+
+
+class _Entry:
+	'''
+	The positions matched by a pattern among the children
+	considered, and whether it matches infinitely many.
+	'''
+	
+	__slots__ = ('matched', 'pattern', 'unbounded')
+	
+	matched: range
+	pattern: ANPlusB
+	unbounded: bool
+	
+	def __init__(
+		self, matched: range, pattern: ANPlusB, /, *,
+		unbounded: bool
+	) -> None:
+		self.matched = matched
+		self.pattern = pattern
+		self.unbounded = unbounded
+
+
+def _merged(
+	entries: list[_Entry],
+	population: int, /, *,
+	exact: bool
+) -> bool:
+	'''
+	Replace the first group of entries whose positions
+	can be expressed as one pattern with that one, in place.
+	
+	Groups are found from pairs of entries: the shortest
+	progression containing both is checked against all
+	the entries it contains.
+	
+	:param population: The number of children considered.
+	:param exact: \
+		Whether that is the actual number of children,
+		rather than one standing for any number of them.
+	'''
+	
+	for this, that in combinations(entries, 2):
+		candidate = span(this.matched, that.matched)
+		members = [
+			entry for entry in entries
+			if is_subset(entry.matched, candidate)
+		]
+		
+		if not covers([entry.matched for entry in members], candidate):
+			continue
+		
+		unbounded = any(entry.unbounded for entry in members)
+		existing = [
+			entry.pattern for entry in members
+			if entry.matched == candidate and entry.unbounded == unbounded
+		]
+		
+		if existing:
+			pattern = existing[0]
+		else:
+			# A finite union must not become a pattern that
+			# goes on past the children considered.
+			bound = population if exact or unbounded else None
+			
+			if (step_and_offset := to_pattern(candidate, bound)) is None:
+				continue
+			
+			pattern = ANPlusB(*step_and_offset)
+		
+		first = entries.index(members[0])
+		merged = _Entry(candidate, pattern, unbounded = unbounded)
+		entries[:] = [
+			merged if index == first else entry
+			for index, entry in enumerate(entries)
+			if index == first or entry not in members
+		]
+		
+		return True
+	
+	return False
+
+
+def simplify(
+	patterns: Iterable[ANPlusB],
+	population: int | None = None, /
+) -> list[ANPlusB]:
+	'''
+	Reduce a union of patterns to an equivalent list of patterns
+	in which no pattern matches a subset of the children matched
+	by another and no group of patterns can be replaced with one.
+	
+	Patterns matching nothing are dropped. Those kept
+	are returned as given and in their original order;
+	merged ones take the place of the first one they replace.
+	
+	For example, ``3n``, ``3n+1`` and ``3n+2`` are merged into ``n``,
+	but ``2`` and ``6`` are not merged into ``4n+2``, which would
+	also match ``10`` if there were as many children.
+	
+	Groups are found from pairs of patterns, and only checked
+	if that is cheap, so in rare cases involving patterns with
+	large steps, some groups may be left unmerged.
+	
+	All patterns are assumed to count children from the same end.
+	
+	:param patterns: The patterns to simplify.
+	:param population: \
+		The number of children. If not given, the result
+		is equivalent for any number of children.
+	:raise InvalidNumberOfChildren: If ``population`` is negative.
+	'''
+	
+	patterns = list(patterns)
+	exact = population is not None
+	
+	if population is None:
+		population = universe([
+			(pattern.step, pattern.offset) for pattern in patterns
+		])
+	elif population < 0:
+		raise InvalidNumberOfChildren(population)
+	
+	entries: list[_Entry] = []
+	
+	for pattern in patterns:
+		matched = positions((pattern.step, pattern.offset), population)
+		unbounded = not exact and pattern.step > 0
+		
+		if matched:
+			entries.append(_Entry(matched, pattern, unbounded = unbounded))
+	
+	while _merged(entries, population, exact = exact):
+		pass
+	
+	return [entry.pattern for entry in entries]
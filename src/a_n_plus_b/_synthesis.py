@@ -0,0 +1,181 @@
+'''
+Synthesis of patterns from the indices they should match.
+'''
+
+from collections.abc import Iterable
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren
+
+
+type Pattern = tuple[ANPlusB, bool]
+
+
+# How many of the next indices are tried as the second
+# term of a progression through an unmatched index.
+_candidates = 8
+
+
+class IndexOutOfRange(ValueError):
+	'''
+	Raised when an index passed to :func:`from_indices`
+	is not between 1 and the number of children.
+	'''
+	
+	def __init__(self, index: int, population: int, /) -> None:
+		'''
+		:param index: The offending index.
+		:param population: The number of children.
+		'''
+		
+		super().__init__(
+			f'Expected an index between 1 and {population}, '
+			f'got: {index!r}'
+		)
+
+
+def _extended(
+	index: int, step: int,
+	wanted: set[int], population: int, /
+) -> range | None:
+	'''
+	The longest progression with the given step through ``index``
+	whose terms are all wanted, if it can be matched by a pattern;
+	that is, if it cannot be extended past one of the two ends.
+	'''
+	
+	first = index
+	
+	while first - step in wanted:
+		first -= step
+	
+	last = index
+	
+	while last + step in wanted:
+		last += step
+	
+	if first - step >= 1 and last + step <= population:
+		return None
+	
+	return range(first, last + 1, step)
+
+
+def _pattern(progression: range, population: int, /) -> Pattern:
+	'''
+	The pattern matching exactly the given progression,
+	which touches at least one end. Counting from the last
+	index is preferred only when it is shorter to write.
+	'''
+	
+	first, last, step = progression[0], progression[-1], progression.step
+	
+	if first == last:
+		candidates = [
+			(ANPlusB(first), False),
+			(ANPlusB(population + 1 - first), True)
+		]
+	elif last + step > population:
+		candidates = [
+			(ANPlusB(step, 0 if first == step else first), False),
+			(ANPlusB(-step, population + 1 - first), True)
+		]
+	else:
+		mirrored = population + 1 - last
+		candidates = [
+			(ANPlusB(-step, last), False),
+			(ANPlusB(step, 0 if mirrored == step else mirrored), True)
+		]
+	
+	return min(candidates, key = lambda candidate: len(str(candidate[0])))
+
+
+def _redundant(
+	progressions: list[range],
+	multiplicities: dict[int, int], /
+) -> list[bool]:
+	'''
+	Whether each progression, in order, can be dropped because all
+	of its terms are also matched by others that are kept.
+	'''
+	
+	dropped: list[bool] = []
+	
+	for progression in progressions:
+		redundant = all(multiplicities[index] > 1 for index in progression)
+		
+		if redundant:
+			for index in progression:
+				multiplicities[index] -= 1
+		
+		dropped.append(redundant)
+	
+	return dropped
+
+
+def from_indices(indices: Iterable[int], population: int, /) -> list[Pattern]:
+	'''
+	Find a small list of patterns whose union matches exactly
+	the given 1-based indices among ``population`` children.
+	
+	Each pattern is a tuple of an :class:`ANPlusB` object and
+	whether it counts indices from the last one, as expected
+	by :func:`union`. The patterns are built from the longest
+	arithmetic progressions among the indices that reach either
+	the first or the last child, which can be written as
+	``an+b`` or ``-an+b``; other indices are matched one by one.
+	
+	The search is greedy and takes near-linear time
+	in the number of indices. While the result is
+	not always the smallest possible, no pattern
+	in it matches only indices matched by others.
+	
+	:param indices: The indices to match.
+	:param population: The number of children.
+	:raise InvalidNumberOfChildren: If ``population`` is negative.
+	:raise IndexOutOfRange: If an index is not between 1 and ``population``.
+	'''
+	
+	if population < 0:
+		raise InvalidNumberOfChildren(population)
+	
+	wanted = set(indices)
+	
+	for index in wanted:
+		if not 1 <= index <= population:
+			raise IndexOutOfRange(index, population)
+	
+	remaining = sorted(wanted)
+	matched: set[int] = set()
+	multiplicities = dict.fromkeys(remaining, 0)
+	progressions: list[range] = []
+	
+	for position, index in enumerate(remaining):
+		if index in matched:
+			continue
+		
+		best = range(index, index + 1)
+		best_count = 1
+		
+		for other in remaining[position + 1:position + 1 + _candidates]:
+			progression = _extended(index, other - index, wanted, population)
+			
+			if progression is None:
+				continue
+			
+			count = sum(term not in matched for term in progression)
+			
+			if count > best_count:
+				best, best_count = progression, count
+		
+		progressions.append(best)
+		matched.update(best)
+		
+		for term in best:
+			multiplicities[term] += 1
+	
+	dropped = _redundant(progressions, multiplicities)
+	
+	return [
+		_pattern(progression, population)
+		for progression, redundant in zip(progressions, dropped, strict = True)
+		if not redundant
+	]
@@ -0,0 +1,168 @@
+'''
+Lazy, deduplicated unions of the indices matched by many patterns.
+'''
+
+import heapq
+import math
+from collections.abc import Iterable, Iterator
+from itertools import pairwise
+
+from ._a_n_plus_b import ANPlusB, InvalidNumberOfChildren, InvalidOrder
+from ._progressions import matched_indices
+
+
+type Pattern = ANPlusB | tuple[ANPlusB, bool]
+
+
+_maximum_period = 1024
+
+
+def _merged_with_heap(ranges: list[range], /) -> Iterator[int]:
+	heap = [(indices[0], indices.step, indices[-1]) for indices in ranges]
+	heapq.heapify(heap)
+	
+	previous = None
+	
+	while heap:
+		index, step, last = heap[0]
+		
+		if index != previous:
+			yield index
+			previous = index
+		
+		if index < last:
+			heapq.heapreplace(heap, (index + step, step, last))
+		else:
+			heapq.heappop(heap)
+
+
+def _segments(ranges: list[range], /) -> list[tuple[int, int, list[range]]]:
+	'''
+	Split the span of all ranges at their bounds into segments
+	``[start, stop)``, each along with the ranges covering it.
+	'''
+	
+	bounds = sorted(
+		{indices[0] for indices in ranges}
+		| {indices[-1] + 1 for indices in ranges}
+	)
+	
+	return [
+		(start, stop, [
+			indices for indices in ranges
+			if indices[0] <= start and stop <= indices[-1] + 1
+		])
+		for start, stop in pairwise(bounds)
+	]
+
+
+def _merged_with_table(
+	ranges: list[range],
+	period: int, /, *,
+	descending: bool
+) -> Iterator[int]:
+	'''
+	Within a segment, the union is periodic with a period
+	equal to the least common multiple of the steps,
+	so it can be generated from a table of remainders.
+	'''
+	
+	segments = _segments(ranges)
+	
+	if descending:
+		segments.reverse()
+	
+	for start, stop, covering in segments:
+		if not covering:
+			continue
+		
+		remainders = sorted({
+			index % period
+			for indices in covering
+			for index in range(indices[0], indices[0] + period, indices.step)
+		})
+		bases = range(start - start % period, stop, period)
+		
+		if descending:
+			bases, remainders = bases[::-1], remainders[::-1]
+		
+		for base in bases:
+			for remainder in remainders:
+				index = base + remainder
+				
+				if start <= index < stop:
+					yield index
+
+
+def _merged(ranges: list[range], /, *, descending: bool) -> Iterator[int]:
+	'''
+	Merge ascending ranges into one sorted iterator.
+	'''
+	
+	if len(ranges) == 1:
+		return iter(ranges[0][::-1] if descending else ranges[0])
+	
+	period = math.lcm(*(indices.step for indices in ranges))
+	
+	if period <= _maximum_period:
+		return _merged_with_table(ranges, period, descending = descending)
+	
+	if not descending:
+		return _merged_with_heap(ranges)
+	
+	negated = [
+		range(-indices[-1], -indices[0] + 1, indices.step)
+		for indices in ranges
+	]
+	
+	return (-index for index in _merged_with_heap(negated))
+
+
+def union(
+	patterns: Iterable[Pattern],
+	population: int, /, *,
+	order: str = 'ascending'
+) -> Iterator[int]:
+	'''
+	Lazily yield the 1-based indices matched by any
+	of the given patterns, sorted and without duplicates.
+	
+	Each pattern is either an :class:`ANPlusB` object or
+	a tuple of such an object and whether to count indices
+	from the last one, as in ``:nth-last-child()``.
+	
+	When the steps of the patterns are small, the indices are
+	generated from a periodic table of remainders; otherwise,
+	a heap is used to merge the patterns' indices.
+	
+	:param patterns: The patterns to merge.
+	:param population: The number of children.
+	:param order: \
+		Either ``ascending`` or ``descending``.
+		``default`` is the same as ``ascending``.
+	:raise InvalidOrder: If ``order`` is not one of the above.
+	:raise InvalidNumberOfChildren: If ``population`` is negative.
+	'''
+	
+	if order not in ('ascending', 'descending', 'default'):
+		raise InvalidOrder(order)
+	
+	if population < 0:
+		raise InvalidNumberOfChildren(population)
+	
+	descending = order == 'descending'
+	ranges: list[range] = []
+	
+	for pattern in patterns:
+		instance, from_last = \
+			(pattern, False) if isinstance(pattern, ANPlusB) else pattern
+		
+		indices = matched_indices(
+			instance.step, instance.offset, population,
+			from_last = from_last
+		)
+		
+		if indices:
+			ranges.append(indices)
+	
+	return _merged(ranges, descending = descending)
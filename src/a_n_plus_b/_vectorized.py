@@ -0,0 +1,251 @@
+'''
+Evaluation of the values of ``an+b`` many at once,
+into flat buffers of 64-bit integers.
+
+This module is only imported when first needed, as
+:mod:`array` and :mod:`collections.abc` are not cheap.
+
+NumPy is used if, and only if, the caller passes a NumPy array;
+it is never imported by this module.
+'''
+
+import sys
+from array import array
+from collections.abc import Buffer, Iterable
+from operator import index
+from types import ModuleType
+from typing import Any
+
+
+# NumPy is not a dependency, so its arrays cannot be typed more precisely.
+type NDArray = Any
+
+
+_smallest_int64 = -(1 << 63)
+_largest_int64 = (1 << 63) - 1
+
+
+class BufferTooSmall(ValueError):
+	'''
+	Raised when a buffer passed to
+	:meth:`_InfiniteRange.window` cannot hold the window.
+	'''
+	
+	def __init__(self, size: int, needed: int, /) -> None:
+		'''
+		:param size: The number of 64-bit integers the buffer can hold.
+		:param needed: The number of values in the window.
+		'''
+		
+		super().__init__(
+			f'Expected a buffer of at least {needed} integers, got: {size}'
+		)
+
+
+class ValueTooLarge(OverflowError):
+	'''
+	Raised when a value in a window passed to
+	:meth:`_InfiniteRange.window` does not fit in 64 bits.
+	'''
+	
+	def __init__(self, value: int, /) -> None:
+		'''
+		:param value: The first value that does not fit.
+		'''
+		
+		super().__init__(f'Expected a 64-bit integer, got: {value}')
+
+
+class UnsupportedDType(TypeError):
+	'''
+	Raised when the elements of a NumPy array passed to
+	:meth:`_InfiniteRange.window` or
+	:meth:`_InfiniteRange.contains_each` are of the wrong type.
+	'''
+	
+	def __init__(self, dtype: object, expected: str, /) -> None:
+		'''
+		:param dtype: The type of the elements of the array.
+		:param expected: A description of the types accepted.
+		'''
+		
+		super().__init__(f'Expected an array of {expected}, got: {dtype}')
+
+
+def numpy_for(value: object, /) -> ModuleType | None:
+	'''
+	The NumPy module, if ``value`` is a NumPy array.
+	As it must have been imported already to create such
+	an array, this never imports NumPy itself.
+	'''
+	
+	numpy = sys.modules.get('numpy')
+	
+	if numpy is not None and isinstance(value, numpy.ndarray):
+		return numpy
+	
+	return None
+
+
+def _fits(*values: int) -> bool:
+	return all(_smallest_int64 <= value <= _largest_int64 for value in values)
+
+
+def _values(first: int, step: int, count: int, /) -> array[int]:
+	if step == 0:
+		return array('q', [first]) * count
+	
+	return array('q', range(first, first + count * step, step))
+
+
+def _window_with_numpy(
+	numpy: ModuleType,
+	first: int, step: int, count: int,
+	out: NDArray, /
+) -> NDArray:
+	if out.dtype != numpy.int64:
+		raise UnsupportedDType(out.dtype, '64-bit integers')
+	
+	if len(out) < count:
+		raise BufferTooSmall(len(out), count)
+	
+	target = out[:count]
+	
+	# The distance between the first and last value may overflow
+	# even if both fit, in which case NumPy would wrap around.
+	if not _fits(count * step):
+		target[:] = numpy.frombuffer(_values(first, step, count), 'q')
+		return out
+	
+	numpy.multiply(numpy.arange(count, dtype = numpy.int64), step, out = target)
+	target += first
+	
+	return out
+
+
+def window(
+	offset: int, step: int, start: int, stop: int, /, *,
+	out: Buffer | NDArray | None = None
+) -> array[int] | Buffer | NDArray:
+	'''
+	The values of ``step * n + offset`` for ``n``
+	from ``start`` inclusive to ``stop`` exclusive,
+	as a new array or written into ``out``.
+	
+	:raise IndexError: If ``start`` is negative.
+	:raise ValueTooLarge: If a value does not fit in 64 bits.
+	:raise BufferTooSmall: If ``out`` cannot hold every value.
+	:raise UnsupportedDType: \
+		If ``out`` is a NumPy array not of 64-bit integers.
+	'''
+	
+	if start < 0:
+		raise IndexError(start)
+	
+	count = max(0, stop - start)
+	first, last = offset + start * step, offset + (stop - 1) * step
+	
+	if count and not _fits(first):
+		raise ValueTooLarge(first)
+	
+	if count and not _fits(last):
+		raise ValueTooLarge(last)
+	
+	if out is None:
+		return _values(first, step, count)
+	
+	if (numpy := numpy_for(out)) is not None:
+		return _window_with_numpy(numpy, first, step, count, out)
+	
+	values = _values(first, step, count)
+	
+	# Copied byte by byte, so that the buffer
+	# need not have a whole number of integers.
+	with (
+		memoryview(out) as view, view.cast('B') as target,
+		memoryview(values) as source, source.cast('B') as octets
+	):
+		if len(target) < len(octets):
+			raise BufferTooSmall(len(target) // values.itemsize, count)
+		
+		target[:len(octets)] = octets
+	
+	return out
+
+
+def _contains_each_with_numpy(
+	numpy: ModuleType,
+	offset: int, step: int,
+	candidates: NDArray, /
+) -> NDArray:
+	candidates = candidates.astype(numpy.int64, copy = False)
+	
+	if step == 0:
+		return candidates == offset
+	
+	# Neither side of each comparison may overflow.
+	congruent = candidates % step == offset % step
+	
+	if step > 0:
+		return congruent & (candidates >= offset)
+	
+	return congruent & (candidates <= offset)
+
+
+def _vectorizable(
+	numpy: ModuleType,
+	offset: int, step: int,
+	candidates: NDArray, /
+) -> bool:
+	# Checked beforehand, as NumPy would
+	# truncate floating-point numbers silently.
+	if not numpy.issubdtype(candidates.dtype, numpy.integer):
+		raise UnsupportedDType(candidates.dtype, 'integers')
+	
+	# Large unsigned integers would wrap around
+	# when converted to signed 64-bit integers.
+	return (
+		_fits(offset, step)
+		and numpy.can_cast(candidates.dtype, numpy.int64)
+	)
+
+
+def contains_each(
+	offset: int, step: int,
+	candidates: Iterable[int] | NDArray, /
+) -> list[bool] | NDArray:
+	'''
+	Whether each candidate is a value of ``step * n + offset``
+	for some non-negative ``n``.
+	
+	:raise TypeError: If a candidate is not an integer.
+	:raise UnsupportedDType: \
+		If ``candidates`` is a NumPy array not of integers.
+	'''
+	
+	numpy = numpy_for(candidates)
+	
+	if numpy is not None and _vectorizable(numpy, offset, step, candidates):
+		return _contains_each_with_numpy(numpy, offset, step, candidates)
+	
+	# Checked beforehand, so that the comprehensions
+	# below can be specialized for integers.
+	integers = list(map(index, candidates))
+	
+	if step == 0:
+		result = [integer == offset for integer in integers]
+	elif step > 0:
+		result = [
+			integer >= offset and (integer - offset) % step == 0
+			for integer in integers
+		]
+	else:
+		result = [
+			integer <= offset and (integer - offset) % step == 0
+			for integer in integers
+		]
+	
+	if numpy is not None:
+		return numpy.array(result, dtype = bool)
+	
+	return result
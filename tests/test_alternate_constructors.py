@@ -259,6 +259,44 @@ def test_parse_invalid(text: str) -> None:
 		ANPlusB.parse(text)
 
 
+@given(
+	one_of([
+		ParseANPlusBTestCases.valid().map(lambda example: example[0]),
+		_integers_with_potentially_superfluous_sign(),
+		_variations('odd'),
+		_variations('even')
+	])
+)
+def test_try_parse_valid(text: str) -> None:
+	assert ANPlusB.try_parse(text) == ANPlusB.parse(text)
+	assert ANPlusB.is_valid(text)
+
+
+@given(
+	one_of([
+		whitespace_sequences_or_empty(),
+		ParseANPlusBTestCases.whitespace_after_a_sign(),
+		ParseANPlusBTestCases.missing_b(),
+		ParseANPlusBTestCases.missing_operator()
+	])
+)
+def test_try_parse_invalid(text: str) -> None:
+	assert ANPlusB.try_parse(text) is None
+	assert not ANPlusB.is_valid(text)
+
+
+def test_try_parse_creates_no_exceptions(monkeypatch: pytest.MonkeyPatch) -> None:
+	def fail(*_: object) -> None:
+		raise AssertionError
+	
+	monkeypatch.setattr(EmptyInput, '__init__', fail)
+	monkeypatch.setattr(InputIsNotParsable, '__init__', fail)
+	
+	for text in ['', ' ', 'foo', '3n+', '+ n', 'n-n']:
+		assert ANPlusB.try_parse(text) is None
+		assert not ANPlusB.is_valid(text)
+
+
 @given(
 	one_of([
 		tuples(integers(), integers()).map(_make_complex),
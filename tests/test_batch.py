@@ -0,0 +1,115 @@
+from array import array
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, lists, sampled_from
+
+from a_n_plus_b import (
+	ANPlusB,
+	batch_counts,
+	batch_indices,
+	InvalidNumberOfChildren,
+	InvalidOrder
+)
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -30, max_value = 30)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+_populations = lists(integers(min_value = 0, max_value = 100), max_size = 20)
+_orders = sampled_from(['ascending', 'descending', 'default'])
+
+
+@given(_instances, _populations, booleans(), _orders)
+def test_same_as_indices(
+	instance: ANPlusB, populations: list[int],
+	from_last: bool, order: str
+) -> None:
+	indices, offsets = batch_indices(
+		instance, populations,
+		from_last = from_last,
+		order = order
+	)
+	
+	assert isinstance(indices, array)
+	assert len(offsets) == len(populations) + 1
+	assert offsets[0] == 0
+	assert offsets[-1] == len(indices)
+	
+	for position, population in enumerate(populations):
+		start, stop = offsets[position], offsets[position + 1]
+		expected = instance.indices(population, from_last = from_last, order = order)
+		
+		assert list(indices[start:stop]) == list(expected)
+
+
+@given(_instances, _populations)
+def test_counts(instance: ANPlusB, populations: list[int]) -> None:
+	counts = batch_counts(instance, populations)
+	
+	assert list(counts) == [
+		len(list(instance.indices(population))) for population in populations
+	]
+
+
+def test_iterables() -> None:
+	indices, offsets = batch_indices(ANPlusB(2, 1), range(4))
+	
+	assert list(indices) == [1, 1, 1, 3]
+	assert list(offsets) == [0, 0, 1, 2, 4]
+	assert list(batch_counts(ANPlusB(2, 1), iter([0, 1, 5]))) == [0, 1, 3]
+
+
+def test_empty() -> None:
+	indices, offsets = batch_indices(ANPlusB(2, 1), [])
+	
+	assert list(indices) == []
+	assert list(offsets) == [0]
+	assert list(batch_counts(ANPlusB(2, 1), [])) == []
+
+
+def test_invalid_order() -> None:
+	with pytest.raises(InvalidOrder):
+		batch_indices(ANPlusB(2, 1), [1], order = 'random')
+
+
+def test_negative_population() -> None:
+	with pytest.raises(InvalidNumberOfChildren):
+		batch_indices(ANPlusB(2, 1), [3, -1])
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		batch_counts(ANPlusB(2, 1), [3, -1])
+
+
+@given(_instances, _populations, booleans(), _orders)
+def test_numpy(
+	instance: ANPlusB, populations: list[int],
+	from_last: bool, order: str
+) -> None:
+	numpy = pytest.importorskip('numpy')
+	
+	array_populations = numpy.array(populations, dtype = numpy.int64)
+	indices, offsets = batch_indices(
+		instance, array_populations,
+		from_last = from_last,
+		order = order
+	)
+	expected = batch_indices(
+		instance, populations,
+		from_last = from_last,
+		order = order
+	)
+	counts = batch_counts(instance, array_populations)
+	
+	assert isinstance(indices, numpy.ndarray)
+	assert isinstance(counts, numpy.ndarray)
+	assert indices.tolist() == list(expected[0])
+	assert offsets.tolist() == list(expected[1])
+	assert counts.tolist() == list(batch_counts(instance, populations))
+
+
+def test_numpy_negative_population() -> None:
+	numpy = pytest.importorskip('numpy')
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		batch_counts(ANPlusB(2, 1), numpy.array([3, -1]))
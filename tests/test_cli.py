@@ -0,0 +1,122 @@
+import io
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+from a_n_plus_b.__main__ import main
+
+
+_lines = ['odd', ' 2N + 1 ', 'foo', '', '-n+3', '4']
+
+
+def _run(
+	monkeypatch: pytest.MonkeyPatch,
+	arguments: list[str],
+	lines: list[str] = _lines
+) -> bytes:
+	stdin = io.TextIOWrapper(io.BytesIO('\n'.join(lines).encode()))
+	stdout = io.TextIOWrapper(io.BytesIO())
+	
+	monkeypatch.setattr(sys, 'stdin', stdin)
+	monkeypatch.setattr(sys, 'stdout', stdout)
+	
+	assert main(arguments) == 0
+	
+	return stdout.buffer.getvalue()  # type: ignore
+
+
+def test_normalize(monkeypatch: pytest.MonkeyPatch) -> None:
+	output = _run(monkeypatch, ['normalize'])
+	
+	assert output == b'2n+1\n2n+1\n!\n!\n-n+3\n4\n'
+
+
+def test_validate(monkeypatch: pytest.MonkeyPatch) -> None:
+	output = _run(monkeypatch, ['validate'])
+	
+	assert output == b'1\n1\n0\n0\n1\n1\n'
+
+
+@pytest.mark.parametrize(('arguments', 'expected'), [
+	(['-p', '6'], b'1 3 5\n1 3 5\n!\n!\n3 2 1\n4\n'),
+	(['-p', '6', '--from-last'], b'6 4 2\n6 4 2\n!\n!\n4 5 6\n3\n'),
+	(['-p', '6', '--order', 'descending'], b'5 3 1\n5 3 1\n!\n!\n3 2 1\n4\n'),
+	(['-p', '0'], b'\n\n!\n!\n\n\n')
+])
+def test_indices(
+	monkeypatch: pytest.MonkeyPatch,
+	arguments: list[str],
+	expected: bytes
+) -> None:
+	assert _run(monkeypatch, ['indices', *arguments]) == expected
+
+
+def test_count(monkeypatch: pytest.MonkeyPatch) -> None:
+	output = _run(monkeypatch, ['count', '-p', '6'])
+	
+	assert output == b'3\n3\n!\n!\n3\n1\n'
+
+
+def test_binary(monkeypatch: pytest.MonkeyPatch) -> None:
+	output = _run(monkeypatch, ['indices', '-p', '4', '-b'], ['odd', 'x', '9'])
+	
+	assert output == struct.pack('<3q q 1q', 2, 1, 3, -1, 0)
+	
+	output = _run(monkeypatch, ['normalize', '--binary'], ['-n+3', 'x'])
+	
+	assert output == struct.pack('<Bqq Bqq', 1, -1, 3, 0, 0, 0)
+
+
+def test_binary_out_of_range(monkeypatch: pytest.MonkeyPatch) -> None:
+	lines = ['99999999999999999999n+1', '2n-99999999999999999999', 'odd']
+	output = _run(monkeypatch, ['normalize', '-b'], lines)
+	
+	assert output == struct.pack('<Bqq Bqq Bqq', 2, 0, 0, 2, 0, 0, 1, 2, 1)
+	
+	output = _run(monkeypatch, ['count', '-b', '-p', '3'], lines)
+	
+	assert output == struct.pack('<3q', 1, 2, 2)
+
+
+def test_count_large_population(monkeypatch: pytest.MonkeyPatch) -> None:
+	output = _run(monkeypatch, ['count', '-p', str(10 ** 30)], ['odd', '-n+3'])
+	
+	assert output == f'{10 ** 30 // 2}\n3\n'.encode()
+
+
+def test_files_and_workers(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path
+) -> None:
+	path = tmp_path / 'input.txt'
+	path.write_text('\n'.join(_lines * 1000))
+	
+	sequential = _run(monkeypatch, ['count', str(path), '-p', '10'])
+	parallel = _run(monkeypatch, ['count', str(path), '-p', '10', '-j', '2'])
+	
+	assert sequential == parallel
+	assert sequential.count(b'\n') == len(_lines) * 1000
+
+
+def test_invalid_population(monkeypatch: pytest.MonkeyPatch) -> None:
+	with pytest.raises(SystemExit):
+		_run(monkeypatch, ['count', '-p', '-1'])
+	
+	with pytest.raises(SystemExit):
+		_run(monkeypatch, ['count', '-b', '-p', str(1 << 63)])
+
+
+def test_missing_file(
+	monkeypatch: pytest.MonkeyPatch,
+	tmp_path: Path,
+	capsys: pytest.CaptureFixture[str]
+) -> None:
+	path = tmp_path / 'missing.txt'
+	
+	with pytest.raises(SystemExit) as caught:
+		_run(monkeypatch, ['count', str(path)])
+	
+	assert caught.value.code == 1
+	assert str(path) in capsys.readouterr().err
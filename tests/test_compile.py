@@ -0,0 +1,61 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers
+
+from a_n_plus_b import ANPlusB
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -12, max_value = 12)
+
+
+@given(
+	a_n_plus_b_instances(_small_integers, _small_integers),
+	integers(min_value = 0, max_value = 30),
+	booleans()
+)
+def test_compile(instance: ANPlusB, population: int, from_last: bool) -> None:
+	matches = instance.compile(from_last = from_last)
+	expected = set(instance.indices(population, from_last = from_last))
+	
+	assert {
+		index for index in range(-3, population + 4)
+		if matches(index, population)
+	} == expected
+
+
+@given(
+	a_n_plus_b_instances(),
+	integers(min_value = 0),
+	integers(),
+	booleans()
+)
+def test_compile_large(
+	instance: ANPlusB,
+	population: int,
+	index: int,
+	from_last: bool
+) -> None:
+	matches = instance.compile(from_last = from_last)
+	position = population - index + 1 if from_last else index
+	expected = 1 <= index <= population and position in instance.values()
+	
+	assert matches(index, population) is expected
+
+
+@pytest.mark.parametrize(('instance', 'index', 'population', 'expected'), [
+	(ANPlusB(0, 3), 3, 3, True),
+	(ANPlusB(0, 3), 3, 2, False),
+	(ANPlusB(2, -1), 1, 1, True),
+	(ANPlusB(2, 5), 3, 10, False),
+	(ANPlusB(-2, 5), 5, 4, False),
+	(ANPlusB(-1, 0), 1, 5, False),
+	(ANPlusB(1, 0), 0, 5, False)
+])
+def test_compile_examples(
+	instance: ANPlusB,
+	index: int,
+	population: int,
+	expected: bool
+) -> None:
+	assert instance.compile()(index, population) is expected
@@ -0,0 +1,96 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, sampled_from
+
+from a_n_plus_b import ANPlusB, InvalidNumberOfChildren, InvalidOrder
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -20, max_value = 20)
+
+
+@given(
+	a_n_plus_b_instances(_small_integers, _small_integers),
+	integers(min_value = 0, max_value = 60),
+	booleans(),
+	sampled_from(['ascending', 'descending', 'default'])
+)
+def test_complement(
+	instance: ANPlusB,
+	population: int,
+	from_last: bool,
+	order: str
+) -> None:
+	complement = instance.complement(
+		population,
+		from_last = from_last,
+		order = order
+	)
+	matched = set(instance.indices(population, from_last = from_last))
+	expected = [
+		index for index in range(1, population + 1)
+		if index not in matched
+	]
+	
+	if order == 'descending' or order == 'default' and from_last:
+		expected.reverse()
+	
+	assert list(complement) == expected
+	assert list(reversed(complement)) == expected[::-1]
+	assert len(complement) == len(expected)
+	assert all(index in complement for index in expected)
+	assert not any(index in complement for index in matched)
+	assert 0 not in complement
+	assert population + 1 not in complement
+
+
+@given(
+	a_n_plus_b_instances(),
+	integers(min_value = 0, max_value = 1000),
+	booleans()
+)
+def test_complement_length(
+	instance: ANPlusB,
+	population: int,
+	from_last: bool
+) -> None:
+	complement = instance.complement(population, from_last = from_last)
+	matches = instance.compile(from_last = from_last)
+	expected = sum(
+		not matches(index, population)
+		for index in range(1, population + 1)
+	)
+	
+	assert len(complement) == expected
+
+
+@pytest.mark.parametrize(('instance', 'population', 'expected'), [
+	(ANPlusB(1, 0), 2 ** 64, 0),
+	(ANPlusB(-1, 2 ** 64), 2 ** 64 + 5, 5),
+	(ANPlusB(1, 5), 2 ** 64, 4)
+])
+def test_complement_length_large(
+	instance: ANPlusB,
+	population: int,
+	expected: int
+) -> None:
+	assert len(instance.complement(population)) == expected
+
+
+def test_complement_is_lazy() -> None:
+	complement = ANPlusB(1, 3).complement(10 ** 18)
+	
+	assert list(complement) == [1, 2]
+	assert next(reversed(ANPlusB(2, 1).complement(10 ** 18))) == 10 ** 18
+
+
+def test_complement_not_integer() -> None:
+	assert 2.0 not in ANPlusB(2, 1).complement(10)
+
+
+def test_complement_invalid() -> None:
+	with pytest.raises(InvalidOrder):
+		ANPlusB(2, 1).complement(10, order = 'random')
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		ANPlusB(2, 1).complement(-1)
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from a_n_plus_b import ANPlusB
+from benchmarks.corpus import arguments, categories, populations
+from benchmarks.end_to_end import report
+
+
+def test_deterministic() -> None:
+	assert arguments(500, seed = 7) == arguments(500, seed = 7)
+	assert arguments(500, seed = 7) != arguments(500, seed = 8)
+	assert populations(500, seed = 7) == populations(500, seed = 7)
+
+
+@pytest.mark.parametrize('category', list(categories))
+def test_categories(category: str) -> None:
+	generate, _ = categories[category]
+	generator = random.Random(0)
+	texts = [generate(generator) for _ in range(200)]
+	parsed = [ANPlusB.try_parse(text) for text in texts]
+	
+	if category == 'invalid':
+		assert all(instance is None for instance in parsed)
+	elif category != 'padded':
+		assert all(instance is not None for instance in parsed)
+
+
+def test_weights() -> None:
+	texts = arguments(10_000)
+	invalid = sum(ANPlusB.try_parse(text) is None for text in texts)
+	total = sum(weight for _, weight in categories.values())
+	expected = categories['invalid'][1] / total
+	
+	# Some padded arguments, like "+ 5", are not valid either.
+	assert expected <= invalid / len(texts) <= expected * 1.5
+
+
+def test_populations() -> None:
+	values = populations(10_000)
+	
+	assert all(0 <= value <= 100_000 for value in values)
+	assert sorted(values)[len(values) // 2] < 50
+
+
+def test_report() -> None:
+	results = report(50)
+	
+	assert list(results) == ['parse', 'serialize', 'indices', 'end_to_end']
+	assert results['parse'].items == 50
+	assert results['end_to_end'].items == 50
+	
+	for result in results.values():
+		assert result.p50 <= result.p90 <= result.p99
+		assert result.items_per_second > 0
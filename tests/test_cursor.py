@@ -0,0 +1,165 @@
+import json
+import pickle
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, sampled_from
+
+from a_n_plus_b import (
+	ANPlusB,
+	IndicesCursor,
+	InvalidCursorState,
+	InvalidNumberOfChildren,
+	InvalidNumberOfParts,
+	InvalidOrder
+)
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -30, max_value = 30)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+_populations = integers(min_value = 0, max_value = 200)
+_orders = sampled_from(['ascending', 'descending', 'default'])
+
+
+@given(_instances, _populations, booleans(), _orders)
+def test_same_as_indices(
+	instance: ANPlusB, population: int,
+	from_last: bool, order: str
+) -> None:
+	cursor = IndicesCursor(instance, population, from_last = from_last, order = order)
+	expected = list(instance.indices(population, from_last = from_last, order = order))
+	
+	assert cursor.remaining == len(expected)
+	assert list(cursor) == expected
+	assert cursor.remaining == 0
+	assert list(cursor) == []
+
+
+@given(_instances, _populations, booleans(), _orders, integers(1, 10))
+def test_split(
+	instance: ANPlusB, population: int,
+	from_last: bool, order: str, parts: int
+) -> None:
+	cursor = IndicesCursor(instance, population, from_last = from_last, order = order)
+	expected = list(instance.indices(population, from_last = from_last, order = order))
+	
+	next(cursor, None)
+	cursors = cursor.split(parts)
+	sizes = [part.remaining for part in cursors]
+	
+	assert len(cursors) == parts
+	assert max(sizes) - min(sizes) <= 1
+	assert [index for part in cursors for index in part] == expected[1:]
+	assert cursor.position == min(1, len(expected))
+
+
+@given(_instances, _populations, booleans(), _orders, integers(0, 200))
+def test_seek(
+	instance: ANPlusB, population: int,
+	from_last: bool, order: str, rank: int
+) -> None:
+	cursor = IndicesCursor(instance, population, from_last = from_last, order = order)
+	expected = list(instance.indices(population, from_last = from_last, order = order))
+	
+	if rank > len(expected):
+		with pytest.raises(IndexError):
+			cursor.seek(rank)
+		
+		return
+	
+	cursor.seek(rank)
+	
+	assert list(cursor) == expected[rank:]
+
+
+def test_seek_huge_population() -> None:
+	cursor = IndicesCursor(ANPlusB(3, 1), 10 ** 30)
+	
+	cursor.seek(10 ** 28)
+	
+	assert cursor.take(3) == range(3 * 10 ** 28 + 1, 3 * 10 ** 28 + 8, 3)
+	assert cursor.position == 10 ** 28 + 3
+	assert cursor.remaining == (10 ** 30 + 2) // 3 - 10 ** 28 - 3
+
+
+def test_take() -> None:
+	cursor = IndicesCursor(ANPlusB(-2, 9), 10)
+	
+	assert cursor.take(2) == range(9, 5, -2)
+	assert cursor.take(-1) == range(5, 5, -2)
+	assert list(cursor.take(10)) == [5, 3, 1]
+	assert not cursor.take(1)
+
+
+def test_sub_cursor_bounds() -> None:
+	first, second = IndicesCursor(ANPlusB(1, 0), 10).split(2)
+	
+	assert (second.start, second.position, second.stop) == (5, 5, 10)
+	
+	with pytest.raises(IndexError):
+		second.seek(4)
+	
+	second.seek(10)
+	
+	assert list(second) == []
+	assert list(first) == [1, 2, 3, 4, 5]
+
+
+@given(_instances, _populations, booleans(), _orders, integers(1, 5), integers(0, 50))
+def test_serialization(
+	instance: ANPlusB, population: int,
+	from_last: bool, order: str, parts: int, consumed: int
+) -> None:
+	cursor = IndicesCursor(instance, population, from_last = from_last, order = order)
+	cursor = cursor.split(parts)[-1]
+	cursor.take(consumed)
+	
+	state = json.loads(json.dumps(cursor.to_json()))
+	restored = IndicesCursor.from_json(state)
+	unpickled = pickle.loads(pickle.dumps(cursor))
+	
+	assert restored == unpickled == cursor
+	assert list(restored) == list(unpickled) == list(cursor)
+
+
+@pytest.mark.parametrize('state', [
+	{},
+	{'step': 1, 'offset': 0, 'population': 10, 'from_last': False, 'order': 'foo',
+		'start': 0, 'position': 0, 'stop': 10},
+	{'step': 1, 'offset': 0, 'population': 10, 'from_last': False, 'order': 'default',
+		'start': 0, 'position': 0, 'stop': 11},
+	{'step': 1, 'offset': 0, 'population': 10, 'from_last': False, 'order': 'default',
+		'start': 5, 'position': 4, 'stop': 10},
+	{'step': 1, 'offset': 0, 'population': 10, 'from_last': False, 'order': 'default',
+		'start': '0', 'position': 0, 'stop': 10},
+	{'step': 1, 'offset': 0, 'population': 10, 'from_last': False, 'order': 'default',
+		'start': 0, 'position': 0.0, 'stop': 10},
+	{'step': 1, 'offset': 0, 'population': 10, 'from_last': 'no', 'order': 'default',
+		'start': 0, 'position': 0, 'stop': 10},
+	{'step': True, 'offset': 0, 'population': 10, 'from_last': False, 'order': 'default',
+		'start': 0, 'position': 0, 'stop': 10},
+	{'step': 1, 'offset': 0, 'population': -1, 'from_last': False, 'order': 'default',
+		'start': 0, 'position': 0, 'stop': 0},
+	{'step': 1, 'offset': 0, 'population': 10, 'from_last': False, 'order': None,
+		'start': 0, 'position': 0, 'stop': 10}
+])
+def test_invalid_state(state: dict[str, object]) -> None:
+	with pytest.raises(InvalidCursorState):
+		IndicesCursor.from_json(state)
+
+
+def test_state_not_a_mapping() -> None:
+	with pytest.raises(InvalidCursorState):
+		IndicesCursor.from_json([1])  # type: ignore
+
+
+def test_invalid_arguments() -> None:
+	with pytest.raises(InvalidOrder):
+		IndicesCursor(ANPlusB(1, 0), 10, order = 'foo')
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		IndicesCursor(ANPlusB(1, 0), -1)
+	
+	with pytest.raises(InvalidNumberOfParts):
+		IndicesCursor(ANPlusB(1, 0), 10).split(0)
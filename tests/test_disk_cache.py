@@ -0,0 +1,273 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from hypothesis import given, settings, HealthCheck
+from hypothesis.strategies import integers, text
+
+from a_n_plus_b import (
+	ANPlusB,
+	CorruptedCacheFile,
+	EmptyInput,
+	InputIsNotParsable,
+	PersistentParseCache
+)
+
+
+def _refuse_to_parse(_cls: type[ANPlusB], _text: str) -> ANPlusB:
+	raise AssertionError('parse() should not have been called')
+
+
+@pytest.mark.parametrize('text', ['odd', ' -N+ 3', '4', '+0n-8'])
+def test_parse(tmp_path: Path, text: str) -> None:
+	cache = PersistentParseCache(tmp_path / 'cache')
+	
+	assert cache.parse(text) == ANPlusB.parse(text)
+	assert cache.parse(text) is cache.parse(text)
+	assert text in cache
+
+
+@pytest.mark.parametrize(('text', 'error'), [
+	(' \n', EmptyInput),
+	('foo', InputIsNotParsable),
+	('2n +', InputIsNotParsable)
+])
+def test_parse_invalid(
+	tmp_path: Path,
+	text: str,
+	error: type[Exception]
+) -> None:
+	with PersistentParseCache(tmp_path / 'cache') as cache:
+		with pytest.raises(error):
+			cache.parse(text)
+	
+	reloaded = PersistentParseCache(tmp_path / 'cache')
+	
+	with pytest.raises(error) as information:
+		reloaded.parse(text)
+	
+	with pytest.raises(error) as expected:
+		ANPlusB.parse(text)
+	
+	assert str(information.value) == str(expected.value)
+
+
+def test_warm_load_does_not_parse(
+	tmp_path: Path,
+	monkeypatch: pytest.MonkeyPatch
+) -> None:
+	texts = ['odd', 'even', '3n-1', '-n+6', '42', 'foo', '']
+	
+	with PersistentParseCache(tmp_path / 'cache') as cache:
+		expected = [cache.parse(text) for text in texts[:-2]]
+	
+	with PersistentParseCache(tmp_path / 'cache') as cache:
+		for text in texts[-2:]:
+			with pytest.raises((EmptyInput, InputIsNotParsable)):
+				cache.parse(text)
+	
+	monkeypatch.setattr(ANPlusB, 'parse', classmethod(_refuse_to_parse))
+	reloaded = PersistentParseCache(tmp_path / 'cache')
+	
+	assert len(reloaded) == len(texts)
+	assert [reloaded.parse(text) for text in texts[:-2]] == expected
+
+
+@settings(suppress_health_check = [HealthCheck.function_scoped_fixture])
+@given(integers(), integers(), text(max_size = 20))
+def test_round_trip(
+	tmp_path: Path,
+	step: int,
+	offset: int,
+	suffix: str
+) -> None:
+	path = tmp_path / 'cache'
+	path.unlink(missing_ok = True)
+	instance = ANPlusB(step, offset)
+	key = f'{instance}'
+	
+	with PersistentParseCache(path) as cache:
+		cache.parse(key)
+		
+		try:
+			cache.parse(suffix)
+		except (EmptyInput, InputIsNotParsable):
+			pass
+	
+	reloaded = PersistentParseCache(path)
+	
+	assert reloaded.parse(key) == instance
+	assert suffix in reloaded
+
+
+def test_flush_is_lazy(tmp_path: Path) -> None:
+	cache = PersistentParseCache(tmp_path / 'cache')
+	cache.parse('2n+1')
+	
+	assert len(PersistentParseCache(tmp_path / 'cache')) == 0
+	
+	cache.flush()
+	cache.flush()
+	
+	assert len(PersistentParseCache(tmp_path / 'cache')) == 1
+
+
+def test_multiple_writers(tmp_path: Path) -> None:
+	first = PersistentParseCache(tmp_path / 'cache')
+	second = PersistentParseCache(tmp_path / 'cache')
+	
+	first.parse('odd')
+	second.parse('even')
+	second.parse('odd')
+	first.flush()
+	second.flush()
+	
+	assert first.load() == second.load() == 3
+	assert len(first) == len(second) == 2
+
+
+def test_multiple_processes(tmp_path: Path) -> None:
+	path = tmp_path / 'cache'
+	code = '\n'.join([
+		'import sys',
+		'from a_n_plus_b import PersistentParseCache',
+		'with PersistentParseCache(sys.argv[1]) as cache:',
+		'    for step in range(int(sys.argv[2]), 500, 4):',
+		'        cache.parse(f"{step}n+1")',
+		'        if step % 20 == 0: cache.flush()'
+	])
+	
+	workers = [
+		subprocess.Popen([sys.executable, '-c', code, str(path), str(worker)])
+		for worker in range(4)
+	]
+	
+	assert all(worker.wait() == 0 for worker in workers)
+	
+	cache = PersistentParseCache(path)
+	
+	assert len(cache) == 500
+	assert all(
+		cache.parse(f'{step}n+1') == ANPlusB(step, 1)
+		for step in range(500)
+	)
+
+
+def test_incomplete_tail_is_ignored(tmp_path: Path) -> None:
+	path = tmp_path / 'cache'
+	
+	with PersistentParseCache(path) as cache:
+		cache.parse('odd')
+		cache.parse('even')
+	
+	data = path.read_bytes()
+	path.write_bytes(data[:-3])
+	
+	reader = PersistentParseCache(path)
+	
+	assert 'odd' in reader
+	assert 'even' not in reader
+	
+	path.write_bytes(data)
+	
+	assert reader.load() == 1
+	assert 'even' in reader
+
+
+def test_damaged_tail_is_ignored(tmp_path: Path) -> None:
+	path = tmp_path / 'cache'
+	
+	with PersistentParseCache(path) as cache:
+		cache.parse('odd')
+	
+	with path.open('ab') as file:
+		file.write(bytes(64))
+	
+	assert len(PersistentParseCache(path)) == 1
+
+
+def test_not_a_cache_file(tmp_path: Path) -> None:
+	path = tmp_path / 'cache'
+	path.write_bytes(b'not a cache file')
+	
+	with pytest.raises(CorruptedCacheFile):
+		PersistentParseCache(path)
+	
+	path.write_bytes(b'')
+	
+	with pytest.raises(CorruptedCacheFile):
+		PersistentParseCache(path)
+
+
+def test_merge(tmp_path: Path) -> None:
+	with PersistentParseCache(tmp_path / 'first') as first:
+		first.parse('odd')
+		first.parse('3n')
+	
+	with PersistentParseCache(tmp_path / 'second') as second:
+		second.parse('3n')
+		second.parse('-n+4')
+		
+		with pytest.raises(InputIsNotParsable):
+			second.parse('foo')
+	
+	target = PersistentParseCache(tmp_path / 'target')
+	
+	assert target.merge(tmp_path / 'first', tmp_path / 'second') == 4
+	assert target.merge(tmp_path / 'first') == 0
+	
+	reloaded = PersistentParseCache(tmp_path / 'target')
+	
+	assert len(reloaded) == 4
+	assert reloaded.parse('-n+4') == ANPlusB(-1, 4)
+	
+	(tmp_path / 'other').write_bytes(b'foo')
+	
+	with pytest.raises(CorruptedCacheFile):
+		target.merge(tmp_path / 'other')
+
+
+def test_no_temporary_files_left(tmp_path: Path) -> None:
+	PersistentParseCache(tmp_path / 'cache')
+	PersistentParseCache(tmp_path / 'cache')
+	
+	assert os.listdir(tmp_path) == ['cache']
+
+
+def test_damaged_record_is_skipped(tmp_path: Path) -> None:
+	path = tmp_path / 'cache'
+	
+	with PersistentParseCache(path) as cache:
+		cache.parse('odd')
+	
+	with path.open('ab') as file:
+		file.write(b'\xa5\xa5N')
+	
+	with PersistentParseCache(path) as other:
+		other.parse('3n+4')
+	
+	reloaded = PersistentParseCache(path)
+	
+	assert reloaded.parse('3n+4') == ANPlusB(3, 4)
+	assert len(reloaded) == 2
+
+
+def test_partial_record_is_skipped(tmp_path: Path) -> None:
+	path = tmp_path / 'cache'
+	
+	with PersistentParseCache(path) as cache:
+		cache.parse('odd')
+		cache.parse('-n+6')
+	
+	data = path.read_bytes()
+	path.write_bytes(data[:-5])
+	reader = PersistentParseCache(path)
+	
+	with PersistentParseCache(path) as other:
+		other.parse('even')
+	
+	assert reader.load() == 1
+	assert 'even' in reader
+	assert '-n+6' not in reader
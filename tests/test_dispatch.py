@@ -0,0 +1,82 @@
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, lists, tuples
+
+from a_n_plus_b import ANPlusB, compile_rules
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -8, max_value = 8)
+_rules = lists(
+	tuples(
+		a_n_plus_b_instances(_small_integers, _small_integers),
+		booleans()
+	),
+	max_size = 12
+)
+
+
+@given(_rules, integers(min_value = 0, max_value = 20))
+def test_compile_rules(rules: list[tuple[ANPlusB, bool]], population: int) -> None:
+	dispatch = compile_rules([
+		(rule_id, instance, from_last)
+		for rule_id, (instance, from_last) in enumerate(rules)
+	])
+	
+	for index in range(-1, population + 3):
+		expected = [
+			rule_id
+			for rule_id, (instance, from_last) in enumerate(rules)
+			if instance.compile(from_last = from_last)(index, population)
+		]
+		
+		assert dispatch(index, population) == expected
+
+
+@given(integers(), integers(), integers(min_value = 0), integers())
+def test_compile_rules_large(
+	step: int,
+	offset: int,
+	population: int,
+	index: int
+) -> None:
+	instance = ANPlusB(step, offset)
+	dispatch = compile_rules([
+		('first', instance, False),
+		('last', instance, True)
+	])
+	expected = [
+		rule_id
+		for rule_id, from_last in [('first', False), ('last', True)]
+		if instance.compile(from_last = from_last)(index, population)
+	]
+	
+	assert dispatch(index, population) == expected
+
+
+def test_compile_rules_arbitrary_ids() -> None:
+	ids = [object(), 'odd', (1, 2), None]
+	dispatch = compile_rules([
+		(ids[0], ANPlusB(2, 1), False),
+		(ids[1], ANPlusB(2, 1), True),
+		(ids[2], ANPlusB(0, 3), False),
+		(ids[3], ANPlusB(-1, 3), True)
+	])
+	
+	assert dispatch(3, 5) == ids
+	assert dispatch(2, 5) == []
+
+
+def test_compile_rules_empty() -> None:
+	assert compile_rules([])(1, 1) == []
+
+
+def test_compile_rules_shares_remainders() -> None:
+	dispatch = compile_rules([
+		('a', ANPlusB(3, 0), False),
+		('b', ANPlusB(3, 1), False),
+		('c', ANPlusB(-3, 7), False),
+		('d', ANPlusB(3, 2), True)
+	])
+	
+	assert dispatch.__doc__ is not None
+	assert dispatch.__doc__.count('% 3') == 2
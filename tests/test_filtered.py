@@ -0,0 +1,91 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, lists
+
+from a_n_plus_b import ANPlusB, FilteredChildren, InputIsNotParsable
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -20, max_value = 20)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+
+
+def _expected(pattern: ANPlusB, matches: list[bool], from_last: bool) -> list[int]:
+	selected = [index for index, matched in enumerate(matches, 1) if matched]
+	
+	if from_last:
+		selected.reverse()
+	
+	ordinals = set(pattern.indices(len(selected)))
+	
+	return sorted(
+		index for ordinal, index in enumerate(selected, 1)
+		if ordinal in ordinals
+	)
+
+
+@given(_instances, lists(booleans(), max_size = 60), booleans())
+def test_indices(pattern: ANPlusB, matches: list[bool], from_last: bool) -> None:
+	children = FilteredChildren(matches)
+	expected = _expected(pattern, matches, from_last)
+	
+	assert sorted(children.indices(pattern, from_last = from_last)) == expected
+	assert list(children.indices(
+		pattern, from_last = from_last, order = 'ascending'
+	)) == expected
+	
+	for index in range(len(matches) + 2):
+		matched = children.matches(pattern, index, from_last = from_last)
+		
+		assert matched == (index in expected)
+
+
+@given(lists(booleans(), max_size = 60), integers(min_value = 0, max_value = 100))
+def test_from_bitmask(matches: list[bool], extra: int) -> None:
+	mask = sum(1 << index for index, matched in enumerate(matches) if matched)
+	# Bits past the population are ignored.
+	mask |= extra << len(matches)
+	
+	children = FilteredChildren.from_bitmask(mask, len(matches))
+	expected = FilteredChildren(matches)
+	
+	assert children.population == expected.population == len(matches)
+	assert len(children) == len(expected) == sum(matches)
+	assert list(children.indices(ANPlusB(1, 0))) == list(expected.indices(ANPlusB(1, 0)))
+
+
+def test_rank_and_select() -> None:
+	children = FilteredChildren([False, True, True, False, True])
+	
+	assert [children.rank(index) for index in range(7)] == [0, 0, 1, 2, 2, 3, 3]
+	assert [children.select(ordinal) for ordinal in (1, 2, 3)] == [2, 3, 5]
+	
+	for ordinal in (0, 4):
+		with pytest.raises(IndexError):
+			children.select(ordinal)
+
+
+def test_reused_across_patterns() -> None:
+	children = FilteredChildren(index % 3 == 0 for index in range(1, 31))
+	
+	assert list(children.indices(ANPlusB(2, 1))) == [3, 9, 15, 21, 27]
+	assert list(children.indices(ANPlusB(-1, 2))) == [6, 3]
+	assert list(children.indices(ANPlusB(-1, 2), from_last = True)) == [27, 30]
+	assert repr(children) == 'FilteredChildren(population = 30, selected = 10)'
+
+
+@pytest.mark.parametrize(('text', 'expected'), [
+	('2n+1 of li.item', (ANPlusB(2, 1), 8)),
+	('odd OF  .a', (ANPlusB(2, 1), 8)),
+	('  -n+3\tof\n.a .b', (ANPlusB(-1, 3), 10)),
+	('3', (ANPlusB(3), None)),
+	(' 2n + 1 ', (ANPlusB(2, 1), None))
+])
+def test_parse_with_selector(text: str, expected: tuple[ANPlusB, int | None]) -> None:
+	assert ANPlusB.parse_with_selector(text) == expected
+
+
+@pytest.mark.parametrize('text', ['2n+1 of ', '2n+1of .a', 'foo of .a', 'n of'])
+def test_parse_with_selector_invalid(text: str) -> None:
+	with pytest.raises(InputIsNotParsable):
+		ANPlusB.parse_with_selector(text)
@@ -0,0 +1,125 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers
+
+from a_n_plus_b import (
+	ANPlusB,
+	Grid,
+	InvalidGrouping,
+	InvalidNumberOfChildren,
+	InvalidNumberOfColumns
+)
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -30, max_value = 30)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+_populations = integers(min_value = 0, max_value = 200)
+_columns = integers(min_value = 1, max_value = 20)
+
+
+def _expected(
+	instance: ANPlusB, population: int,
+	columns: int, from_last: bool
+) -> list[tuple[int, int]]:
+	indices = sorted(instance.indices(population, from_last = from_last))
+	
+	return [
+		((index - 1) // columns + 1, (index - 1) % columns + 1)
+		for index in indices
+	]
+
+
+@given(_instances, _populations, _columns, booleans())
+def test_by_row(
+	instance: ANPlusB, population: int,
+	columns: int, from_last: bool
+) -> None:
+	grid = Grid(population, columns)
+	expected = _expected(instance, population, columns, from_last)
+	groups = list(grid.by_row(instance, from_last = from_last))
+	
+	assert list(grid.cells(instance, from_last = from_last)) == expected
+	assert [row for row, _ in groups] == sorted({row for row, _ in expected})
+	assert all(matched for _, matched in groups)
+
+
+@given(_instances, _populations, _columns, booleans())
+def test_by_column(
+	instance: ANPlusB, population: int,
+	columns: int, from_last: bool
+) -> None:
+	grid = Grid(population, columns)
+	expected = _expected(instance, population, columns, from_last)
+	groups = list(grid.by_column(instance, from_last = from_last))
+	cells = list(grid.cells(instance, from_last = from_last, by = 'column'))
+	
+	assert cells == sorted(expected, key = lambda cell: (cell[1], cell[0]))
+	assert [column for column, _ in groups] == sorted({column for _, column in expected})
+	assert all(matched for _, matched in groups)
+
+
+def test_groups() -> None:
+	grid = Grid(20, 4)
+	
+	# 3n+1: 1, 4, 7, 10, 13, 16, 19
+	assert list(grid.by_row(ANPlusB(3, 1))) == [
+		(1, range(1, 5, 3)),
+		(2, range(3, 4, 3)),
+		(3, range(2, 5, 3)),
+		(4, range(1, 5, 3)),
+		(5, range(3, 4, 3))
+	]
+	assert list(grid.by_column(ANPlusB(3, 1))) == [
+		(1, range(1, 5, 3)),
+		(2, range(3, 4, 3)),
+		(3, range(2, 6, 3)),
+		(4, range(1, 5, 3))
+	]
+
+
+def test_sparse_rows() -> None:
+	grid = Grid(10 ** 12, 10)
+	groups = grid.by_row(ANPlusB(10 ** 11 + 1, 5))
+	
+	assert next(groups) == (1, range(5, 6, 10 ** 11 + 1))
+	assert next(groups) == (10 ** 10 + 1, range(6, 7, 10 ** 11 + 1))
+
+
+def test_sparse_columns() -> None:
+	grid = Grid(10 ** 12, 10 ** 6)
+	
+	assert list(grid.by_column(ANPlusB(5))) == [(5, range(1, 2))]
+	assert list(grid.by_column(ANPlusB(-1, 3))) == [
+		(1, range(1, 2)),
+		(2, range(1, 2)),
+		(3, range(1, 2))
+	]
+	assert list(grid.by_column(ANPlusB(10 ** 11 + 1, 0))) == [
+		(k, range(k * 10 ** 5 + 1, k * 10 ** 5 + 2)) for k in range(1, 10)
+	]
+	assert list(grid.by_column(ANPlusB(2 * 10 ** 6, 0))) == [
+		(10 ** 6, range(2, 10 ** 6 + 1, 2))
+	]
+
+def test_layout() -> None:
+	grid = Grid(10, 4)
+	
+	assert grid.rows == 3
+	assert grid.cell(1) == (1, 1)
+	assert grid.cell(10) == (3, 2)
+	assert repr(grid) == 'Grid(population = 10, columns = 4)'
+	
+	with pytest.raises(IndexError):
+		grid.cell(11)
+
+
+def test_errors() -> None:
+	with pytest.raises(InvalidNumberOfChildren):
+		Grid(-1, 3)
+	
+	with pytest.raises(InvalidNumberOfColumns):
+		Grid(10, 0)
+	
+	with pytest.raises(InvalidGrouping):
+		Grid(10, 3).cells(ANPlusB(2, 1), by = 'diagonal')
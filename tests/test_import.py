@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# Generous, since CI machines vary wildly;
+# importing the package used to take ~10 times as long
+# as it does now, mostly due to asyncio and re.
+_budget_in_microseconds = 50_000
+
+_heavy_modules = ['asyncio', 'collections', 'json', 're', 'typing']
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+	# Subprocess coverage would be measured as part of the import.
+	environment = {
+		name: value for name, value in os.environ.items()
+		if not name.startswith(('COV_CORE_', 'COVERAGE_'))
+	}
+	
+	return subprocess.run(
+		[sys.executable, *options, '-c', code],
+		capture_output = True, text = True, check = True,
+		env = environment
+	)
+
+
+def _import_time() -> int:
+	process = _run('import a_n_plus_b', '-X', 'importtime')
+	
+	# import time: self [us] | cumulative | imported package
+	for line in process.stderr.splitlines():
+		_, cumulative, name = line.split('|')
+		
+		if name.strip() == 'a_n_plus_b':
+			return int(cumulative)
+	
+	raise AssertionError(process.stderr)
+
+
+def test_import_time() -> None:
+	best = min(_import_time() for _ in range(5))
+	
+	assert best < _budget_in_microseconds
+
+
+@pytest.mark.parametrize('module', _heavy_modules)
+def test_no_heavy_imports(module: str) -> None:
+	code = f'import sys, a_n_plus_b; print({module!r} in sys.modules)'
+	
+	assert _run(code).stdout.strip() == 'False'
+
+
+def test_no_regex_compilation() -> None:
+	code = '\n'.join([
+		'from a_n_plus_b import _grammar, ANPlusB',
+		'patterns = [value for value in vars(_grammar).values()',
+		'            if isinstance(value, _grammar.Regex)]',
+		'ANPlusB.parse("odd"), ANPlusB.parse(" -42 ")',
+		'print(any(pattern._compiled for pattern in patterns))',
+		'ANPlusB.parse("2n+1")',
+		'print(_grammar.a_n_plus_b._compiled is not None)'
+	])
+	
+	assert _run(code).stdout.split() == ['False', 'True']
+
+
+def test_lazy_exports() -> None:
+	code = '\n'.join([
+		'import sys, a_n_plus_b',
+		'from a_n_plus_b import Service, instrumentation',
+		'print("asyncio" in sys.modules, "Service" in dir(a_n_plus_b))'
+	])
+	
+	assert _run(code).stdout.split() == ['True', 'True']
@@ -145,13 +145,16 @@ def _test_case_group(
 	*_test_case_group(ANPlusB(-2, 6), 10, [6, 4, 2]),
 	*_test_case_group(ANPlusB(-1, 4), 8, [4, 3, 2, 1]),
 	*_test_case_group(ANPlusB(-3, 8), 18, [8, 5, 2]),
+	*_test_case_group(ANPlusB(-2, 9), 4, [3, 1]),
+	*_test_case_group(ANPlusB(-1, 2), 1, [1]),
 	
 	*_test_case_group(ANPlusB(4, -5), 20, [3, 7, 11, 15, 19]),
 	*_test_case_group(ANPlusB(5, -2), 12, [3, 8]),
 	
 	*_test_case_group(ANPlusB(2, 1), 15, [1, 3, 5, 7, 9, 11, 13, 15]),
 	*_test_case_group(ANPlusB(3, 1), 10, [1, 4, 7, 10]),
-	*_test_case_group(ANPlusB(1, 4), 11, [4, 5, 6, 7, 8, 9, 10, 11])
+	*_test_case_group(ANPlusB(1, 4), 11, [4, 5, 6, 7, 8, 9, 10, 11]),
+	*_test_case_group(ANPlusB(10 ** 20, 1 - 10 ** 40), 10 ** 20, [1])
 ])
 def test_indices(instance_arguments_expected: _TestCase) -> None:
 	instance, arguments, expected = instance_arguments_expected
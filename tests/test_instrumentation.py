@@ -0,0 +1,167 @@
+import time
+from collections.abc import Iterator, Mapping
+
+import pytest
+
+from a_n_plus_b import (
+	ANPlusB,
+	instrumentation,
+	InvalidOrder,
+	LazyANPlusB,
+	ParseError
+)
+
+
+_original_parse = ANPlusB.__dict__['parse']
+_original_try_parse = ANPlusB.__dict__['try_parse']
+_original_is_valid = ANPlusB.__dict__['is_valid']
+_original_indices = ANPlusB.__dict__['indices']
+
+
+@pytest.fixture(autouse = True)
+def _clean_instrumentation() -> Iterator[None]:
+	instrumentation.reset()
+	
+	yield
+	
+	instrumentation.disable()
+	instrumentation.reset()
+
+
+def test_disabled_by_default() -> None:
+	assert not instrumentation.enabled
+	assert ANPlusB.__dict__['parse'] is _original_parse
+	assert ANPlusB.__dict__['indices'] is _original_indices
+
+
+def test_enable_disable() -> None:
+	instrumentation.enable()
+	instrumentation.enable()
+	
+	assert instrumentation.enabled
+	assert ANPlusB.__dict__['parse'] is not _original_parse
+	
+	instrumentation.disable()
+	
+	assert not instrumentation.enabled
+	assert ANPlusB.__dict__['parse'] is _original_parse
+	assert ANPlusB.__dict__['try_parse'] is _original_try_parse
+	assert ANPlusB.__dict__['is_valid'] is _original_is_valid
+	assert ANPlusB.__dict__['indices'] is _original_indices
+
+
+def test_parse_paths() -> None:
+	instrumentation.enable()
+	
+	for text in ['odd', ' EVEN ', '42', '-3n+1', '-3n+1', 'foo', ' ']:
+		try:
+			ANPlusB.parse(text)
+		except ParseError:
+			pass
+	
+	snapshot = instrumentation.snapshot()
+	
+	assert snapshot['counters'] == {
+		'parse.keyword': 2,
+		'parse.integer': 1,
+		'parse.a_n_plus_b': 3,
+		'parse.empty': 1,
+		'parse.errors': 2
+	}
+	assert sum(snapshot['histograms']['parse.duration_ns'].values()) == 7
+
+
+def test_parse_results_unchanged() -> None:
+	instrumentation.enable()
+	
+	assert ANPlusB.parse(' 2n + 1 ') == ANPlusB(2, 1)
+	assert ANPlusB.try_parse(' 2n + 1 ') == ANPlusB(2, 1)
+	assert ANPlusB.try_parse('n+') is None
+	assert ANPlusB(2, 1).is_valid('odd')
+	assert not ANPlusB.is_valid('n+')
+	
+	with pytest.raises(ParseError):
+		ANPlusB.parse('n+')
+
+
+def test_try_parse_and_is_valid() -> None:
+	events: list[tuple[str, Mapping[str, object]]] = []
+	
+	instrumentation.enable(lambda event, details: events.append((event, details)))
+	
+	ANPlusB.try_parse('odd')
+	ANPlusB.try_parse('foo')
+	ANPlusB.is_valid('-3n+1')
+	ANPlusB.is_valid(' ')
+	LazyANPlusB('42').step  # noqa: B018
+	
+	assert instrumentation.snapshot()['counters'] == {
+		'parse.keyword': 1,
+		'parse.a_n_plus_b': 2,
+		'parse.empty': 1,
+		'parse.integer': 1,
+		'parse.errors': 2
+	}
+	assert [details['method'] for _, details in events] == [
+		'try_parse', 'try_parse', 'is_valid', 'is_valid', 'try_parse'
+	]
+
+
+def test_indices() -> None:
+	instrumentation.enable()
+	
+	assert list(ANPlusB(2, 1).indices(10, from_last = True)) == [10, 8, 6, 4, 2]
+	assert list(ANPlusB(0, 3).indices(2)) == []
+	assert list(ANPlusB(0, -3).indices(2)) == []
+	
+	iterator = ANPlusB(1, 0).indices(100)
+	next(iterator)
+	iterator.close()
+	
+	with pytest.raises(InvalidOrder):
+		ANPlusB(1, 0).indices(3, order = 'foo')
+	
+	snapshot = instrumentation.snapshot()
+	
+	assert snapshot['counters'] == {'indices.calls': 4, 'indices.zero_step': 1}
+	assert snapshot['histograms']['indices.population'] == {2: 2, 16: 1, 128: 1}
+	assert snapshot['histograms']['indices.yielded'] == {0: 2, 1: 1, 8: 1}
+
+
+def test_indices_duration_includes_time_before_first_item() -> None:
+	instrumentation.enable()
+	
+	iterator = ANPlusB(1, 0).indices(10)
+	time.sleep(0.01)
+	list(iterator)
+	
+	durations = instrumentation.snapshot()['histograms']['indices.duration_ns']
+	
+	assert min(durations) >= 10_000_000
+
+
+def test_callback() -> None:
+	events: list[tuple[str, Mapping[str, object]]] = []
+	
+	instrumentation.enable(lambda event, details: events.append((event, details)))
+	
+	ANPlusB.parse('odd')
+	list(ANPlusB(3, 0).indices(9))
+	
+	names = [event for event, _ in events]
+	
+	assert names == ['parse', 'indices', 'indices_done']
+	assert events[0][1]['path'] == 'keyword'
+	assert events[2][1]['yielded'] == 3
+
+
+def test_reset() -> None:
+	instrumentation.enable()
+	ANPlusB.parse('odd')
+	instrumentation.disable()
+	
+	assert instrumentation.snapshot()['counters'] == {'parse.keyword': 1}
+	
+	instrumentation.reset()
+	
+	assert instrumentation.snapshot() == {'counters': {}, 'histograms': {}}
@@ -0,0 +1,101 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, text
+
+from a_n_plus_b import ANPlusB, EmptyInput, InputIsNotParsable, LazyANPlusB
+from . import a_n_plus_b_instances
+
+
+_instances = a_n_plus_b_instances(integers(-1000, 1000), integers(-1000, 1000))
+
+
+@given(_instances)
+def test_same_as_parsed(instance: ANPlusB) -> None:
+	lazy = LazyANPlusB(str(instance))
+	# An unsigned n is parsed as 0n.
+	instance = ANPlusB.parse(str(instance))
+	
+	assert not lazy.is_parsed
+	assert (lazy.step, lazy.offset) == (instance.step, instance.offset)
+	assert lazy.is_parsed
+	assert lazy.instance is lazy.instance
+	assert str(lazy) == str(instance)
+	assert list(lazy.indices(50)) == list(instance.indices(50))
+	assert list(lazy.complement(50)) == list(instance.complement(50))
+	assert lazy.values()[3] == instance.values()[3]
+
+
+@pytest.mark.parametrize('source', [
+	b' 2n+1 ',
+	bytearray(b'2n+1'),
+	memoryview(b'li:nth-child(2n+1)')[13:17],
+	'odd'
+])
+def test_sources(source: str | bytes | bytearray | memoryview) -> None:
+	lazy = LazyANPlusB(source)
+	
+	assert lazy.instance == ANPlusB(2, 1)
+
+
+def test_buffer_not_kept() -> None:
+	buffer = bytearray(b'li:nth-child(2n+1)')
+	lazy = LazyANPlusB(memoryview(buffer)[13:17])
+	
+	buffer[13:17] = b'-n+3'
+	buffer.extend(b' > a')
+	
+	assert lazy.instance == ANPlusB(2, 1)
+
+
+@pytest.mark.parametrize('method', [
+	lambda lazy: lazy.step,
+	lambda lazy: lazy.offset,
+	lambda lazy: lazy.indices(10),
+	lambda lazy: lazy.values(),
+	lambda lazy: str(lazy)
+])
+def test_parses_on_first_use(method: object) -> None:
+	lazy = LazyANPlusB('-3n+7')
+	
+	assert repr(lazy) == "LazyANPlusB('-3n+7')"
+	assert not lazy.is_parsed
+	
+	method(lazy)  # type: ignore
+	
+	assert lazy.is_parsed
+	assert repr(lazy) == 'LazyANPlusB(-3n+7)'
+
+
+@pytest.mark.parametrize('source', ['2n+1px', 'n + 1 /* */', b'\xff', 'nth'])
+def test_invalid_characters(source: str | bytes) -> None:
+	with pytest.raises(InputIsNotParsable):
+		LazyANPlusB(source)
+
+
+@pytest.mark.parametrize('source', ['', ' \t\n', b'', b'\f'])
+def test_empty(source: str | bytes) -> None:
+	with pytest.raises(EmptyInput):
+		LazyANPlusB(source)
+
+
+@given(text(alphabet = '0123456789+-nNoOdDeEvV \t', min_size = 1, max_size = 10))
+def test_deferred_errors(source: str) -> None:
+	try:
+		expected = ANPlusB.parse(source)
+	except EmptyInput:
+		with pytest.raises(EmptyInput):
+			LazyANPlusB(source)
+		
+		return
+	except InputIsNotParsable as error:
+		lazy = LazyANPlusB(source)
+		
+		for _ in range(2):
+			with pytest.raises(InputIsNotParsable) as info:
+				_ = lazy.step
+			
+			assert info.value.args == error.args
+		
+		return
+	
+	assert LazyANPlusB(source).instance == expected
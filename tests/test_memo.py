@@ -0,0 +1,106 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, sampled_from
+
+from a_n_plus_b import (
+	ANPlusB,
+	IndicesCache,
+	InvalidCacheSize,
+	InvalidNumberOfChildren,
+	InvalidOrder
+)
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -30, max_value = 30)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+_populations = integers(min_value = 0, max_value = 200)
+_orders = sampled_from(['ascending', 'descending', 'default'])
+
+
+@given(_instances, _populations, booleans(), _orders)
+def test_same_as_indices(
+	instance: ANPlusB, population: int,
+	from_last: bool, order: str
+) -> None:
+	cache = IndicesCache()
+	expected = list(instance.indices(population, from_last = from_last, order = order))
+	
+	for _ in range(2):
+		indices = cache.indices(instance, population, from_last = from_last, order = order)
+		
+		assert list(indices) == expected
+	
+	assert cache.length <= cache.max_length
+	assert cache.length == (len(expected) if cache else 0)
+
+
+def test_hits() -> None:
+	cache = IndicesCache()
+	first = cache.indices(ANPlusB(2, 1), 10)
+	
+	assert first == (1, 3, 5, 7, 9)
+	assert (cache.hits, cache.misses) == (0, 1)
+	assert cache.indices(ANPlusB(2, 1), 10) is first
+	assert (cache.hits, cache.misses) == (1, 1)
+	
+	cache.indices(ANPlusB(2, 1), 10, from_last = True)
+	cache.indices(ANPlusB(2, 1), 10, order = 'descending')
+	
+	assert (cache.hits, cache.misses) == (1, 3)
+	assert len(cache) == 3
+	assert cache.length == 15
+	assert cache.nbytes > 0
+
+
+def test_eviction_by_length() -> None:
+	cache = IndicesCache(10)
+	
+	cache.indices(ANPlusB(1, 0), 4)
+	cache.indices(ANPlusB(1, 0), 5)
+	cache.indices(ANPlusB(1, 0), 4)
+	cache.indices(ANPlusB(1, 0), 3)
+	
+	# The least recently used entry, for 5, was evicted.
+	assert len(cache) == 2
+	assert cache.length == 7
+	assert cache.evictions == 1
+	
+	cache.indices(ANPlusB(1, 0), 4)
+	
+	assert cache.hits == 2
+
+
+def test_not_stored() -> None:
+	cache = IndicesCache(10)
+	
+	assert cache.indices(ANPlusB(1, 0), 100) == range(1, 101)
+	assert cache.indices(ANPlusB(1, 0), 10 ** 30) == range(1, 10 ** 30 + 1)
+	assert cache.indices(ANPlusB(0, 5), 3) == ()
+	assert len(cache) == 0
+	assert cache.nbytes == 0
+	assert cache.misses == 3
+
+
+def test_clear() -> None:
+	cache = IndicesCache()
+	cache.indices(ANPlusB(3, 0), 1000)
+	
+	assert cache.nbytes > 0
+	
+	cache.clear()
+	
+	assert len(cache) == 0
+	assert (cache.length, cache.nbytes) == (0, 0)
+	assert cache.misses == 1
+
+
+def test_errors() -> None:
+	with pytest.raises(InvalidCacheSize):
+		IndicesCache(-1)
+	
+	with pytest.raises(InvalidOrder):
+		IndicesCache().indices(ANPlusB(2, 1), 10, order = 'random')
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		IndicesCache().indices(ANPlusB(2, 1), -1)
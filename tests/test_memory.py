@@ -0,0 +1,103 @@
+import sys
+
+import pytest
+
+from a_n_plus_b import ANPlusB
+from benchmarks.memory import instance_size, per_item, retained, transient
+
+
+_int_size = sys.getsizeof(10 ** 3)
+
+# Measurements are slightly noisy when running under coverage.
+_block_tolerance = 0.05
+_short_input_budget = 4096
+
+
+class _TwoSlots:
+	__slots__ = ('first', 'second')
+
+_short_inputs = ['odd', 'EVEN', '42', '-12n+345', ' -12n + 345 ', '\t+n-\n7\f']
+_long_whitespace = '\t\n\f\r ' * 2000
+
+
+def test_instance_layout() -> None:
+	instance = ANPlusB(3, 2)
+	
+	assert not hasattr(instance, '__dict__')
+	assert not hasattr(instance, '__weakref__')
+	assert instance_size() <= sys.getsizeof(_TwoSlots())
+
+
+def test_instance_retained() -> None:
+	allocation = retained(lambda: ANPlusB(3, 2))
+	
+	assert allocation.blocks <= 1 + _block_tolerance
+	assert allocation.retained <= instance_size() + 1
+
+
+def test_parse_retained() -> None:
+	allocation = retained(lambda: ANPlusB.parse('-12n+345'))
+	
+	# The instance itself and two non-cached integers.
+	assert allocation.blocks <= 3 + _block_tolerance
+	assert allocation.retained <= instance_size() + 2 * _int_size + 1
+
+
+@pytest.mark.parametrize('text', _short_inputs)
+def test_parse_transient(text: str) -> None:
+	allocation = transient(lambda: ANPlusB.parse(text))
+	
+	assert allocation.retained <= 256
+	assert allocation.peak <= _short_input_budget
+
+
+@pytest.mark.parametrize('text', [
+	f'{_long_whitespace}2n+1{_long_whitespace}',
+	f'{_long_whitespace}odd{_long_whitespace}',
+	f'{_long_whitespace}-42{_long_whitespace}'
+])
+def test_parse_surrounding_whitespace(text: str) -> None:
+	allocation = transient(lambda: ANPlusB.parse(text))
+	
+	assert allocation.peak <= _short_input_budget
+
+
+@pytest.mark.parametrize('text', [
+	f'2n{_long_whitespace}+{_long_whitespace}1',
+	f'-n+{_long_whitespace}1'
+])
+def test_parse_inner_whitespace(text: str) -> None:
+	allocation = transient(lambda: ANPlusB.parse(text))
+	
+	# At most a few copies of the input, never one per whitespace.
+	assert allocation.peak <= len(text) * 3.5
+
+
+@pytest.mark.parametrize(('instance', 'population', 'length'), [
+	(ANPlusB(3, -2), 30_000, 10_000),
+	(ANPlusB(-1, 10_000), 10_000, 10_000),
+	(ANPlusB(1, 0), 10_000, 10_000)
+])
+@pytest.mark.parametrize('from_last', [False, True])
+@pytest.mark.parametrize('order', ['ascending', 'descending', 'default'])
+def test_indices_per_index(
+	instance: ANPlusB,
+	population: int,
+	length: int,
+	from_last: bool,
+	order: str
+) -> None:
+	allocation = per_item(
+		lambda: instance.indices(population, from_last = from_last, order = order),
+		length
+	)
+	
+	assert allocation.retained < 1
+	assert allocation.peak == 0
+
+
+def test_values_per_step() -> None:
+	allocation = per_item(ANPlusB(3, 2).values, 10_000)
+	
+	assert allocation.retained < 1
+	assert allocation.peak == 0
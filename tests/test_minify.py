@@ -0,0 +1,109 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, none, one_of, sampled_from
+
+from a_n_plus_b import (
+	ANPlusB,
+	InvalidNumberOfChildren,
+	minify,
+	minify_stylesheet
+)
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -50, max_value = 50)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+
+
+def _parse(text: str) -> ANPlusB:
+	if text == 'odd':
+		return ANPlusB(2, 1)
+	
+	# An unsigned n is parsed as 0n.
+	return ANPlusB.parse('+' + text if text.startswith('n') else text)
+
+
+@given(_instances, one_of(none(), integers(min_value = 0, max_value = 200)))
+def test_minify(instance: ANPlusB, population: int | None) -> None:
+	minified = minify(instance, population)
+	
+	assert len(minified) <= len(str(instance))
+	assert _parse(minified).is_equivalent(instance, population)
+
+
+@pytest.mark.parametrize(('instance', 'population', 'expected'), [
+	(ANPlusB(2, 1), None, 'odd'),
+	(ANPlusB(2, -1), None, 'odd'),
+	(ANPlusB(2, 0), None, '2n'),
+	(ANPlusB(2, 2), None, '2n'),
+	(ANPlusB(3, 3), None, '3n'),
+	(ANPlusB(1, 1), None, 'n'),
+	(ANPlusB(1, -5), None, 'n'),
+	(ANPlusB(-1, 0), None, '0'),
+	(ANPlusB(5, -3), None, '5n-3'),
+	(ANPlusB(5, 12), None, '5n+12'),
+	(ANPlusB(-2, 5), None, '-2n+5'),
+	(ANPlusB(0, 7), None, '7'),
+	(ANPlusB(-1, 1000), 10, 'n'),
+	(ANPlusB(-2, 5), 6, 'odd'),
+	(ANPlusB(0, 17), 5, '0'),
+	(ANPlusB(4, 3), 3, '3')
+])
+def test_minify_examples(
+	instance: ANPlusB,
+	population: int | None,
+	expected: str
+) -> None:
+	assert minify(instance, population) == expected
+
+
+_stylesheet = (
+	b'li:nth-child(2n+1) { color: red }\n'
+	b'p:NTH-LAST-CHILD( even ), td:nth-of-type(3n+3 of .a) {}\n'
+	b'a:nth-child(foo), b:nth-last-of-type(-n+1000) {}\n'
+	b'i:nth-child( n+1 ), q:nth-child(N) {}\n'
+	b'/* \xe2\x9c\x93 */ c:nth-child(n+1'
+)
+
+
+@pytest.mark.parametrize(('population', 'expected'), [
+	(None, (
+		b'li:nth-child(odd) { color: red }\n'
+		b'p:NTH-LAST-CHILD(2n), td:nth-of-type(3n of .a) {}\n'
+		b'a:nth-child(foo), b:nth-last-of-type(-n+1000) {}\n'
+		b'i:nth-child(n), q:nth-child(n) {}\n'
+		b'/* \xe2\x9c\x93 */ c:nth-child(n+1'
+	)),
+	(10, (
+		b'li:nth-child(odd) { color: red }\n'
+		b'p:NTH-LAST-CHILD(2n), td:nth-of-type(3n of .a) {}\n'
+		b'a:nth-child(foo), b:nth-last-of-type(n) {}\n'
+		b'i:nth-child(n), q:nth-child(n) {}\n'
+		b'/* \xe2\x9c\x93 */ c:nth-child(n+1'
+	))
+])
+def test_minify_stylesheet(population: int | None, expected: bytes) -> None:
+	assert b''.join(minify_stylesheet([_stylesheet], population)) == expected
+
+
+@given(lists(sampled_from(range(len(_stylesheet) + 1)), max_size = 10))
+def test_minify_stylesheet_chunks(cuts: list[int]) -> None:
+	bounds = [0, *sorted(cuts), len(_stylesheet)]
+	chunks = [_stylesheet[start:end] for start, end in zip(bounds, bounds[1:])]
+	expected = b''.join(minify_stylesheet([_stylesheet]))
+	
+	assert b''.join(minify_stylesheet(chunks)) == expected
+
+
+def test_minify_stylesheet_long_argument() -> None:
+	stylesheet = b':nth-child(' + b' ' * 5000 + b'2n+2)'
+	
+	assert b''.join(minify_stylesheet([stylesheet])) == stylesheet
+
+
+def test_negative_population() -> None:
+	with pytest.raises(InvalidNumberOfChildren):
+		minify(ANPlusB(2, 1), -1)
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		minify_stylesheet([], -1)
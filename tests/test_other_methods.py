@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from hypothesis import given, infer
 from hypothesis.strategies import from_type, integers
@@ -114,3 +116,11 @@ def test_eq(this: ANPlusB) -> None:
 ])
 def test_eq_subclass(this: ANPlusB, that: ANPlusB, expected: bool) -> None:
 	assert (this == that) is expected
+
+
+@given(a_n_plus_b_instances())
+def test_pickle(instance: ANPlusB) -> None:
+	unpickled = pickle.loads(pickle.dumps(instance))
+	
+	assert unpickled == instance
+	assert type(unpickled) is ANPlusB
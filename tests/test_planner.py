@@ -0,0 +1,92 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, lists, sampled_from
+
+from a_n_plus_b import (
+	ANPlusB,
+	bitmask,
+	bitmasks,
+	FilteredChildren,
+	InvalidNumberOfChildren,
+	InvalidStrategy,
+	plan,
+	Plan
+)
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -30, max_value = 30)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+_populations = lists(integers(min_value = 0, max_value = 300), max_size = 10)
+_strategies = sampled_from(['range', 'strided', 'predicate', 'table', None])
+
+
+def _expected(instance: ANPlusB, population: int, from_last: bool) -> int:
+	indices = instance.indices(population, from_last = from_last)
+	
+	return sum(1 << (index - 1) for index in indices)
+
+
+@given(_instances, _populations, booleans(), _strategies)
+def test_same_as_indices(
+	instance: ANPlusB, populations: list[int],
+	from_last: bool, strategy: str | None
+) -> None:
+	masks = bitmasks(
+		instance, populations,
+		from_last = from_last,
+		strategy = strategy
+	)
+	
+	assert masks == [
+		_expected(instance, population, from_last)
+		for population in populations
+	]
+
+
+@given(_instances, integers(min_value = 0, max_value = 300), booleans())
+def test_single(instance: ANPlusB, population: int, from_last: bool) -> None:
+	mask = bitmask(instance, population, from_last = from_last)
+	children = FilteredChildren.from_bitmask(mask, population)
+	
+	assert mask == _expected(instance, population, from_last)
+	assert list(children.indices(ANPlusB(1, 0))) == sorted(
+		instance.indices(population, from_last = from_last)
+	)
+
+
+def test_plan() -> None:
+	result = plan(ANPlusB(2, 1), 100_000)
+	
+	assert isinstance(result, Plan)
+	assert result.strategy == 'strided'
+	assert set(result.costs) == {'range', 'strided', 'predicate'}
+	assert repr(result).startswith("Plan(strategy = 'strided', costs = {")
+
+
+@pytest.mark.parametrize(('instance', 'populations', 'from_last', 'expected'), [
+	(ANPlusB(2, 1), 10, False, 'range'),
+	(ANPlusB(2, 1), [], False, 'range'),
+	(ANPlusB(-1, 5), 100_000, True, 'strided'),
+	(ANPlusB(10_000, 3), 100_000, False, 'range'),
+	(ANPlusB(3, 0), 100_000, True, 'strided'),
+	(ANPlusB(3, 2), [5000 - population for population in range(500)], True, 'table')
+])
+def test_decisions(
+	instance: ANPlusB, populations: int | list[int],
+	from_last: bool, expected: str
+) -> None:
+	assert plan(instance, populations, from_last = from_last).strategy == expected
+
+
+def test_invalid_strategy() -> None:
+	with pytest.raises(InvalidStrategy):
+		bitmask(ANPlusB(2, 1), 10, strategy = 'guess')
+
+
+def test_negative_population() -> None:
+	with pytest.raises(InvalidNumberOfChildren):
+		bitmasks(ANPlusB(2, 1), [3, -1])
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		plan(ANPlusB(2, 1), -1)
@@ -0,0 +1,242 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, sampled_from
+
+from a_n_plus_b import ANPlusB, InvalidNumberOfChildren, NotComposable, simplify
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -20, max_value = 20)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+_populations = integers(min_value = 0, max_value = 100)
+
+# Mostly bounded patterns with small steps, which are
+# often merged into one another.
+_bounded_instances = a_n_plus_b_instances(
+	sampled_from([0, 0, 0, -1, -2, -3, 2, 3, 4, 6]),
+	integers(min_value = -3, max_value = 15)
+)
+
+# Larger than any number of children beyond which
+# relations between the generated patterns may change.
+_window = 3000
+
+
+def _matched(instance: ANPlusB, population: int | None) -> set[int]:
+	return set(instance.indices(_window if population is None else population))
+
+
+def _matched_by_all(patterns: list[ANPlusB], population: int | None) -> set[int]:
+	return {index for pattern in patterns for index in _matched(pattern, population)}
+
+
+@given(_instances, _instances, _populations)
+def test_relations(this: ANPlusB, that: ANPlusB, population: int) -> None:
+	first, second = _matched(this, population), _matched(that, population)
+	
+	assert this.is_subset(that, population) == (first <= second)
+	assert this.is_disjoint(that, population) == first.isdisjoint(second)
+	assert this.is_equivalent(that, population) == (first == second)
+
+
+@given(_instances, _instances)
+def test_relations_unbounded(this: ANPlusB, that: ANPlusB) -> None:
+	first, second = _matched(this, None), _matched(that, None)
+	
+	assert this.is_subset(that) == (first <= second)
+	assert this.is_disjoint(that) == first.isdisjoint(second)
+	assert this.is_equivalent(that) == (first == second)
+
+
+@pytest.mark.parametrize(('this', 'that', 'population', 'expected'), [
+	(ANPlusB(4, 0), ANPlusB(2, 0), None, True),
+	(ANPlusB(2, 0), ANPlusB(4, 0), None, False),
+	(ANPlusB(-1, 3), ANPlusB(1, 0), None, True),
+	(ANPlusB(1, 0), ANPlusB(-1, 3), None, False),
+	(ANPlusB(1, 0), ANPlusB(-1, 3), 3, True),
+	(ANPlusB(0, 0), ANPlusB(0, 5), None, True),
+	(ANPlusB(0, 6), ANPlusB(3, 0), None, True),
+	(ANPlusB(10 ** 30, 1), ANPlusB(5, 1), None, True)
+])
+def test_is_subset(
+	this: ANPlusB, that: ANPlusB,
+	population: int | None,
+	expected: bool
+) -> None:
+	assert this.is_subset(that, population) is expected
+
+
+@pytest.mark.parametrize(('this', 'that', 'population', 'expected'), [
+	(ANPlusB(2, 0), ANPlusB(2, 1), None, True),
+	(ANPlusB(4, 2), ANPlusB(6, 0), None, False),
+	(ANPlusB(4, 2), ANPlusB(6, 1), None, True),
+	(ANPlusB(3, 0), ANPlusB(5, 0), 14, True),
+	(ANPlusB(3, 0), ANPlusB(5, 0), 15, False),
+	(ANPlusB(-1, 4), ANPlusB(1, 5), None, True)
+])
+def test_is_disjoint(
+	this: ANPlusB, that: ANPlusB,
+	population: int | None,
+	expected: bool
+) -> None:
+	assert this.is_disjoint(that, population) is expected
+
+
+@pytest.mark.parametrize(('this', 'that', 'population', 'expected'), [
+	(ANPlusB(2, 0), ANPlusB(2, 2), None, True),
+	(ANPlusB(2, -1), ANPlusB(2, 1), None, True),
+	(ANPlusB(-1, 1000), ANPlusB(1, 0), None, False),
+	(ANPlusB(-1, 1000), ANPlusB(1, 0), 10, True),
+	(ANPlusB(0, 0), ANPlusB(-1, 0), None, True)
+])
+def test_is_equivalent(
+	this: ANPlusB, that: ANPlusB,
+	population: int | None,
+	expected: bool
+) -> None:
+	assert this.is_equivalent(that, population) is expected
+
+
+@given(lists(_instances, max_size = 6), _populations)
+def test_simplify(patterns: list[ANPlusB], population: int) -> None:
+	simplified = simplify(patterns, population)
+	
+	assert len(simplified) <= len(patterns)
+	assert _matched_by_all(simplified, population) == _matched_by_all(patterns, population)
+	
+	for index, pattern in enumerate(simplified):
+		assert _matched(pattern, population)
+		
+		for other in simplified[index + 1:]:
+			assert not pattern.is_subset(other, population)
+			assert not other.is_subset(pattern, population)
+
+
+@given(lists(_instances, max_size = 6))
+def test_simplify_unbounded(patterns: list[ANPlusB]) -> None:
+	simplified = simplify(patterns)
+	
+	assert _matched_by_all(simplified, None) == _matched_by_all(patterns, None)
+
+
+@given(lists(_bounded_instances, max_size = 8))
+def test_simplify_bounded_unbounded(patterns: list[ANPlusB]) -> None:
+	simplified = simplify(patterns)
+	
+	for population in range(0, 200):
+		assert _matched_by_all(simplified, population) \
+			== _matched_by_all(patterns, population)
+
+
+@pytest.mark.parametrize(('patterns', 'population', 'expected'), [
+	([ANPlusB(2), ANPlusB(6)], None, [ANPlusB(-4, 6)]),
+	([ANPlusB(2), ANPlusB(6)], 6, [ANPlusB(4, 2)]),
+	([ANPlusB(8), ANPlusB(-2, 2)], None, [ANPlusB(-6, 8)]),
+	([ANPlusB(2), ANPlusB(6), ANPlusB(10)], None, [ANPlusB(-4, 10)]),
+	([ANPlusB(3), ANPlusB(7), ANPlusB(4, 11)], None, [ANPlusB(4, 3)]),
+	([ANPlusB(3, 0), ANPlusB(3, 1), ANPlusB(3, 2)], None, [ANPlusB(1, 0)]),
+	([ANPlusB(6, 0), ANPlusB(6, 2), ANPlusB(6, 4)], None, [ANPlusB(2, 0)]),
+	(
+		[ANPlusB(2, 0), ANPlusB(3, 0), ANPlusB(4, 1), ANPlusB(6, 5), ANPlusB(12, 7)],
+		None,
+		[ANPlusB(1, 0)]
+	),
+	([ANPlusB(4, 1), ANPlusB(4, 3), ANPlusB(2)], None, [ANPlusB(2, 1), ANPlusB(2)]),
+	([ANPlusB(2, 0), ANPlusB(2, 1)], None, [ANPlusB(1, 0)]),
+	([ANPlusB(4, 0), ANPlusB(4, 2)], None, [ANPlusB(2, 0)]),
+	([ANPlusB(1, 3), ANPlusB(-1, 2)], None, [ANPlusB(1, 0)]),
+	([ANPlusB(3, 0), ANPlusB(6, 0), ANPlusB(0, 5)], None, [ANPlusB(3, 0), ANPlusB(5)]),
+	([ANPlusB(6, 0), ANPlusB(3, 0)], None, [ANPlusB(3, 0)]),
+	([ANPlusB(0, 1), ANPlusB(0, 2), ANPlusB(3, 3)], 3, [ANPlusB(1, 0)]),
+	([ANPlusB(0, 0), ANPlusB(-1, 0)], None, []),
+	([ANPlusB(2, 3), ANPlusB(2, 6)], None, [ANPlusB(2, 3), ANPlusB(2, 6)])
+])
+def test_simplify_examples(
+	patterns: list[ANPlusB],
+	population: int | None,
+	expected: list[ANPlusB]
+) -> None:
+	assert simplify(patterns, population) == expected
+
+
+def test_negative_population() -> None:
+	with pytest.raises(InvalidNumberOfChildren):
+		ANPlusB(2, 0).is_subset(ANPlusB(1, 0), -1)
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		simplify([ANPlusB(2, 0)], -1)
+
+
+def _composed(outer: ANPlusB, inner: ANPlusB, population: int) -> list[int]:
+	matched = sorted(inner.indices(population))
+	
+	return sorted(matched[index - 1] for index in outer.indices(len(matched)))
+
+
+@given(_instances, _instances, _populations)
+def test_compose(outer: ANPlusB, inner: ANPlusB, population: int) -> None:
+	expected = _composed(outer, inner, population)
+	
+	try:
+		composed = outer.compose(inner, population)
+	except NotComposable:
+		step = expected[1] - expected[0]
+		
+		assert expected[0] - step >= 1
+		assert expected[-1] + step <= population
+	else:
+		assert sorted(composed.indices(population)) == expected
+
+
+@given(_instances, _instances)
+def test_compose_unbounded(outer: ANPlusB, inner: ANPlusB) -> None:
+	try:
+		composed = outer.compose(inner)
+	except NotComposable:
+		expected = _composed(outer, inner, _window)
+		
+		assert len(expected) > 1
+		assert expected[0] > expected[1] - expected[0]
+		assert expected[-1] < _window // 2
+		return
+	
+	for population in range(0, 200):
+		assert sorted(composed.indices(population)) \
+			== _composed(outer, inner, population)
+
+
+@pytest.mark.parametrize(('outer', 'inner', 'population', 'expected'), [
+	(ANPlusB(3, 0), ANPlusB(2, 1), None, ANPlusB(6, 5)),
+	(ANPlusB(2, 0), ANPlusB(2, 0), None, ANPlusB(4, 0)),
+	(ANPlusB(1, 0), ANPlusB(-1, 3), None, ANPlusB(-1, 3)),
+	(ANPlusB(-1, 2), ANPlusB(3, 1), None, ANPlusB(-3, 4)),
+	(ANPlusB(0, 3), ANPlusB(5, 0), None, ANPlusB(15)),
+	(ANPlusB(0, 0), ANPlusB(1, 0), None, ANPlusB(0, 0)),
+	(ANPlusB(1, 4), ANPlusB(-1, 2), None, ANPlusB(0, 0)),
+	(ANPlusB(-1, 3), ANPlusB(1, 5), 7, ANPlusB(1, 5)),
+	(ANPlusB(2, 0), ANPlusB(-2, 9), 10, ANPlusB(4, 3))
+])
+def test_compose_examples(
+	outer: ANPlusB, inner: ANPlusB,
+	population: int | None,
+	expected: ANPlusB
+) -> None:
+	assert outer.compose(inner, population) == expected
+
+
+def test_compose_chained() -> None:
+	pattern = ANPlusB(2, 0).compose(ANPlusB(3, 1)).compose(ANPlusB(2, 1))
+	
+	assert pattern == ANPlusB(12, 7)
+	assert pattern == ANPlusB(2, 0).compose(ANPlusB(3, 1).compose(ANPlusB(2, 1)))
+
+
+def test_not_composable() -> None:
+	with pytest.raises(NotComposable, match = r'^-n\+3 of n\+5 cannot'):
+		ANPlusB(-1, 3).compose(ANPlusB(1, 5))
+	
+	with pytest.raises(NotComposable):
+		ANPlusB(-1, 3).compose(ANPlusB(1, 5), 10)
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		ANPlusB(2, 0).compose(ANPlusB(1, 0), -1)
@@ -0,0 +1,237 @@
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+
+from a_n_plus_b import ANPlusB, Service, ServiceClient, ServiceError
+
+
+def _with_client[T](
+	test: Callable[[Service, ServiceClient], Awaitable[T]]
+) -> T:
+	async def run() -> T:
+		service = Service(cache_size = 64)
+		server = await service.start_tcp()
+		host, port = server.sockets[0].getsockname()[:2]
+		
+		async with server, await ServiceClient.connect_tcp(
+			host, port, pool_size = 2
+		) as client:
+			return await test(service, client)
+	
+	return asyncio.run(run())
+
+
+@pytest.mark.parametrize('text', ['odd', ' -N+ 3', '4', '+0n-8'])
+def test_parse(text: str) -> None:
+	async def test(_service: Service, client: ServiceClient) -> ANPlusB:
+		return await client.parse(text)
+	
+	assert _with_client(test) == ANPlusB.parse(text)
+
+
+@pytest.mark.parametrize(('text', 'kind'), [
+	('', 'EmptyInput'),
+	('foo', 'InputIsNotParsable')
+])
+def test_parse_invalid(text: str, kind: str) -> None:
+	async def test(_service: Service, client: ServiceClient) -> None:
+		await client.parse(text)
+	
+	with pytest.raises(ServiceError) as error:
+		_with_client(test)
+	
+	assert error.value.kind == kind
+
+
+def test_indices() -> None:
+	async def test(_service: Service, client: ServiceClient) -> list[int]:
+		return await client.indices('4n-7', 40, from_last = True)
+	
+	instance = ANPlusB(4, -7)
+	
+	assert _with_client(test) == list(instance.indices(40, from_last = True))
+
+
+@pytest.mark.parametrize(('arguments', 'kind'), [
+	({'population': -1}, 'InvalidNumberOfChildren'),
+	({'population': 5, 'order': 'foo'}, 'InvalidOrder'),
+	({'population': '5'}, 'BadRequest')
+])
+def test_indices_invalid(arguments: dict[str, Any], kind: str) -> None:
+	async def test(_service: Service, client: ServiceClient) -> None:
+		await client.request({'op': 'indices', 'text': 'odd', **arguments})
+	
+	with pytest.raises(ServiceError) as error:
+		_with_client(test)
+	
+	assert error.value.kind == kind
+
+
+def test_pipeline_and_stats() -> None:
+	texts = [f'{step}n+{offset}' for step in range(5) for offset in range(5)]
+	
+	async def test(
+		service: Service,
+		client: ServiceClient
+	) -> list[Any]:
+		requests = [{'op': 'parse', 'text': text} for text in texts * 2]
+		responses = await client.pipeline(requests)
+		
+		stats = await client.stats()
+		
+		assert stats['requests'] == len(requests)
+		assert stats['cache_hits'] == len(texts)
+		assert service.stats()['errors'] == 0
+		
+		return responses
+	
+	responses = _with_client(test)
+	results = [response['result']['text'] for response in responses]
+	
+	assert results == [str(ANPlusB.parse(text)) for text in texts * 2]
+	assert len({response['id'] for response in responses}) == len(responses)
+
+
+def test_batch() -> None:
+	async def test(_service: Service, client: ServiceClient) -> Any:
+		return await client.request({
+			'op': 'batch',
+			'requests': [
+				{'id': 'a', 'op': 'parse', 'text': 'even'},
+				{'id': 'b', 'op': 'foo'},
+				42
+			]
+		})
+	
+	first, second, third = _with_client(test)
+	
+	assert first == {'id': 'a', 'result': {'step': 2, 'offset': 0, 'text': '2n'}}
+	assert second['id'] == 'b'
+	assert second['error']['kind'] == 'BadRequest'
+	assert third['error']['kind'] == 'BadRequest'
+
+
+def test_handle_line() -> None:
+	service = Service()
+	
+	response = json.loads(service.handle_line(b'{"id": 1, "op": "parse"'))
+	
+	assert response['error']['kind'] == 'BadRequest'
+	assert service.stats()['errors'] == 1
+	
+	service.reset_stats()
+	
+	assert service.stats()['errors'] == 0
+
+
+def test_cached_errors_are_raised_fresh() -> None:
+	service = Service()
+	
+	for _ in range(100):
+		response = json.loads(service.handle_line(b'{"op": "parse", "text": "zz"}'))
+		
+		assert response['error'] == {
+			'kind': 'InputIsNotParsable',
+			'message': "'zz'"
+		}
+	
+	assert not isinstance(service._cache['zz'], BaseException)  # noqa: SLF001
+
+
+def test_interrupted_pipeline() -> None:
+	async def run() -> Any:
+		service = Service()
+		server = await service.start_tcp()
+		host, port = server.sockets[0].getsockname()[:2]
+		
+		async with server, await ServiceClient.connect_tcp(
+			host, port, pool_size = 1
+		) as client:
+			requests = [{'op': 'indices', 'text': 'n', 'population': 1000}] * 200
+			task = asyncio.create_task(client.pipeline(requests))
+			
+			await asyncio.sleep(0)
+			await asyncio.sleep(0)
+			task.cancel()
+			
+			with pytest.raises(asyncio.CancelledError):
+				await task
+			
+			return await client.parse('odd')
+	
+	assert asyncio.run(run()) == ANPlusB(2, 1)
+
+
+def test_mismatched_response() -> None:
+	async def respond(
+		reader: asyncio.StreamReader,
+		writer: asyncio.StreamWriter
+	) -> None:
+		while await reader.readline():
+			writer.write(b'{"id": -1, "result": null}\n')
+		
+		writer.close()
+	
+	async def run() -> None:
+		server = await asyncio.start_server(respond, '127.0.0.1', 0)
+		host, port = server.sockets[0].getsockname()[:2]
+		
+		async with server, await ServiceClient.connect_tcp(
+			host, port, pool_size = 1
+		) as client:
+			for _ in range(2):
+				with pytest.raises(ConnectionError):
+					await client.parse('odd')
+	
+	asyncio.run(run())
+
+
+@pytest.mark.parametrize(('text', 'population'), [
+	('+n', 10 ** 12),
+	('-n+1000000000000', 10 ** 12)
+])
+def test_too_many_indices(text: str, population: int) -> None:
+	async def test(_service: Service, client: ServiceClient) -> None:
+		await client.indices(text, population)
+	
+	with pytest.raises(ServiceError) as error:
+		_with_client(test)
+	
+	assert error.value.kind == 'BadRequest'
+
+
+def test_max_indices() -> None:
+	service = Service(max_indices = 3)
+	
+	def respond(population: int) -> Any:
+		line = json.dumps({'op': 'indices', 'text': 'odd', 'population': population})
+		
+		return json.loads(service.handle_line(line.encode()))
+	
+	assert respond(6) == {'id': None, 'result': [1, 3, 5]}
+	assert respond(7)['error']['kind'] == 'BadRequest'
+	assert respond(10 ** 30)['error']['kind'] == 'BadRequest'
+
+
+def test_line_too_long() -> None:
+	async def run() -> bytes:
+		service = Service()
+		server = await service.start_tcp()
+		host, port = server.sockets[0].getsockname()[:2]
+		
+		async with server:
+			reader, writer = await asyncio.open_connection(host, port)
+			writer.write(b'"' + b'x' * (1 << 24) + b'"\n')
+			await writer.drain()
+			
+			response = await reader.read()
+			writer.close()
+			
+			return response
+	
+	response = json.loads(asyncio.run(run()))
+	
+	assert response['error']['kind'] == 'BadRequest'
@@ -0,0 +1,91 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import data, DataObject, integers, sets
+
+from a_n_plus_b import (
+	ANPlusB,
+	from_indices,
+	IndexOutOfRange,
+	InvalidNumberOfChildren
+)
+
+
+def _matched(patterns: list[tuple[ANPlusB, bool]], population: int) -> set[int]:
+	return {
+		index
+		for instance, from_last in patterns
+		for index in instance.indices(population, from_last = from_last)
+	}
+
+
+@given(integers(min_value = 0, max_value = 200), data())
+def test_round_trip(population: int, draw: DataObject) -> None:
+	indices = draw.draw(sets(integers(min_value = 1, max_value = max(1, population))))
+	indices = {index for index in indices if index <= population}
+	patterns = from_indices(indices, population)
+	
+	assert _matched(patterns, population) == indices
+	assert len(patterns) <= len(indices)
+	
+	for index, (instance, from_last) in enumerate(patterns):
+		others = patterns[:index] + patterns[index + 1:]
+		matched = set(instance.indices(population, from_last = from_last))
+		
+		assert not matched <= _matched(others, population)
+
+
+@given(
+	integers(min_value = 1, max_value = 30),
+	integers(min_value = 1, max_value = 30),
+	integers(min_value = 0, max_value = 500)
+)
+def test_single_progression(step: int, offset: int, population: int) -> None:
+	indices = set(ANPlusB(step, offset).indices(population))
+	patterns = from_indices(indices, population)
+	
+	assert _matched(patterns, population) == indices
+	assert len(patterns) == min(1, len(indices))
+
+
+@pytest.mark.parametrize(('indices', 'population', 'expected'), [
+	([], 10, []),
+	([5], 10, [(ANPlusB(5), False)]),
+	([2, 4, 6, 8, 10], 10, [(ANPlusB(2, 0), False)]),
+	([1, 3, 5, 7], 8, [(ANPlusB(2, 1), False)]),
+	([1, 3, 5], 10, [(ANPlusB(2, 6), True)]),
+	([1, 2, 3], 3, [(ANPlusB(1, 0), False)]),
+	([98, 99, 100], 100, [(ANPlusB(1, 98), False)]),
+	([996, 998, 1000], 1000, [(ANPlusB(-2, 5), True)]),
+	([1, 2, 3, 8, 9, 10], 10, [(ANPlusB(1, 8), True), (ANPlusB(1, 8), False)]),
+	([4, 7], 10, [(ANPlusB(4), False), (ANPlusB(7), False)]),
+	(
+		[*range(1, 101, 2), 4, 8], 100,
+		[(ANPlusB(2, 1), False), (ANPlusB(-4, 8), False)]
+	)
+])
+def test_examples(
+	indices: list[int],
+	population: int,
+	expected: list[tuple[ANPlusB, bool]]
+) -> None:
+	assert from_indices(indices, population) == expected
+
+
+def test_large_input() -> None:
+	population = 10 ** 6
+	indices = [*range(1, population + 1, 3), *range(2, 1000, 7)]
+	patterns = from_indices(indices, population)
+	
+	assert _matched(patterns, population) == set(indices)
+	assert len(patterns) <= 3
+
+
+@pytest.mark.parametrize('index', [0, -1, 11])
+def test_index_out_of_range(index: int) -> None:
+	with pytest.raises(IndexOutOfRange):
+		from_indices([1, index], 10)
+
+
+def test_negative_population() -> None:
+	with pytest.raises(InvalidNumberOfChildren):
+		from_indices([], -1)
@@ -0,0 +1,76 @@
+import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, lists, one_of, tuples
+
+from a_n_plus_b import ANPlusB, InvalidNumberOfChildren, InvalidOrder, union
+from a_n_plus_b._union import _merged_with_heap
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -30, max_value = 30)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+_patterns = lists(one_of(_instances, tuples(_instances, booleans())), max_size = 6)
+
+
+def _expected(
+	patterns: list[ANPlusB | tuple[ANPlusB, bool]],
+	population: int
+) -> list[int]:
+	indices: set[int] = set()
+	
+	for pattern in patterns:
+		instance, from_last = \
+			(pattern, False) if isinstance(pattern, ANPlusB) else pattern
+		indices.update(instance.indices(population, from_last = from_last))
+	
+	return sorted(indices)
+
+
+@given(_patterns, integers(min_value = 0, max_value = 100))
+def test_union(
+	patterns: list[ANPlusB | tuple[ANPlusB, bool]],
+	population: int
+) -> None:
+	expected = _expected(patterns, population)
+	
+	assert list(union(patterns, population)) == expected
+	assert list(union(patterns, population, order = 'default')) == expected
+	assert list(union(patterns, population, order = 'descending')) == expected[::-1]
+
+
+@given(
+	lists(
+		tuples(a_n_plus_b_instances(integers(1, 10 ** 6), _small_integers), booleans()),
+		min_size = 2, max_size = 6
+	),
+	integers(min_value = 0, max_value = 10 ** 4)
+)
+def test_union_large_steps(
+	patterns: list[tuple[ANPlusB, bool]],
+	population: int
+) -> None:
+	expected = _expected(list(patterns), population)
+	
+	assert list(union(patterns, population)) == expected
+	assert list(union(patterns, population, order = 'descending')) == expected[::-1]
+
+
+def test_union_heap() -> None:
+	ranges = [range(3, 40, 3), range(1, 40, 5), range(1, 5)]
+	expected = sorted({*ranges[0], *ranges[1], *ranges[2]})
+	
+	assert list(_merged_with_heap(ranges)) == expected
+
+
+def test_union_is_lazy() -> None:
+	indices = union([ANPlusB(3, 0), ANPlusB(10 ** 6 + 3, 1)], 10 ** 18)
+	
+	assert [next(indices) for _ in range(5)] == [1, 3, 6, 9, 12]
+
+
+def test_union_invalid() -> None:
+	with pytest.raises(InvalidOrder):
+		union([ANPlusB(2, 1)], 10, order = 'random')
+	
+	with pytest.raises(InvalidNumberOfChildren):
+		union([ANPlusB(2, 1)], -1)
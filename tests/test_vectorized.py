@@ -0,0 +1,167 @@
+from array import array
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists
+
+from a_n_plus_b import (
+	ANPlusB,
+	BufferTooSmall,
+	UnsupportedDType,
+	ValueTooLarge
+)
+from . import a_n_plus_b_instances
+
+
+_small_integers = integers(min_value = -1000, max_value = 1000)
+_instances = a_n_plus_b_instances(_small_integers, _small_integers)
+_ns = integers(min_value = 0, max_value = 200)
+_candidates = lists(integers(min_value = -5000, max_value = 5000), max_size = 50)
+
+
+@given(_instances, _ns, _ns)
+def test_window(instance: ANPlusB, start: int, stop: int) -> None:
+	values = instance.values()
+	window = values.window(start, stop)
+	
+	assert isinstance(window, array)
+	assert window.typecode == 'q'
+	assert list(window) == [values[n] for n in range(start, stop)]
+
+
+@given(_instances, _ns, _ns)
+def test_window_into_buffer(instance: ANPlusB, start: int, stop: int) -> None:
+	values = instance.values()
+	expected = list(values.window(start, stop))
+	
+	into_array = array('q', [-1]) * (len(expected) + 1)
+	into_bytes = bytearray(8 * len(expected))
+	
+	assert values.window(start, stop, out = into_array) is into_array
+	assert values.window(start, stop, out = into_bytes) is into_bytes
+	
+	assert list(into_array) == [*expected, -1]
+	assert list(array('q', bytes(into_bytes))) == expected
+
+
+@given(_instances, _ns, _ns)
+def test_window_numpy(instance: ANPlusB, start: int, stop: int) -> None:
+	numpy = pytest.importorskip('numpy')
+	
+	values = instance.values()
+	out = numpy.full(max(0, stop - start) + 1, -1, dtype = numpy.int64)
+	
+	assert values.window(start, stop, out = out) is out
+	assert out.tolist() == [*values.window(start, stop), -1]
+
+
+@pytest.mark.parametrize(('instance', 'start', 'stop'), [
+	(ANPlusB(1 << 62, 0), 0, 3),
+	(ANPlusB(1 << 62, 0), 2, 3),
+	(ANPlusB(-(1 << 62), 0), 0, 4),
+	(ANPlusB(0, 1 << 63), 0, 1)
+])
+def test_window_too_large(instance: ANPlusB, start: int, stop: int) -> None:
+	with pytest.raises(ValueTooLarge):
+		instance.values().window(start, stop)
+
+
+def test_window_large_distance() -> None:
+	numpy = pytest.importorskip('numpy')
+	
+	values = ANPlusB((1 << 63) - 1, -(1 << 62)).values()
+	out = numpy.zeros(2, dtype = numpy.int64)
+	
+	assert values.window(0, 2, out = out).tolist() == list(values.window(0, 2))
+
+
+def test_window_numpy_invalid() -> None:
+	numpy = pytest.importorskip('numpy')
+	
+	values = ANPlusB(2, 1).values()
+	
+	for dtype in (numpy.int32, numpy.uint64, numpy.float64):
+		out = numpy.zeros(3, dtype = dtype)
+		
+		with pytest.raises(UnsupportedDType):
+			values.window(0, 3, out = out)
+		
+		assert not out.any()
+	
+	with pytest.raises(UnsupportedDType):
+		values.window(0, 0, out = numpy.zeros(0, dtype = numpy.int32))
+
+
+def test_window_invalid() -> None:
+	values = ANPlusB(2, 1).values()
+	
+	with pytest.raises(IndexError):
+		values.window(-1, 3)
+	
+	with pytest.raises(BufferTooSmall):
+		values.window(0, 3, out = array('q', [0, 0]))
+	
+	with pytest.raises(BufferTooSmall):
+		values.window(0, 3, out = bytearray(23))
+	
+	with pytest.raises(TypeError):
+		values.window(0, 3, out = bytes(24))  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+
+@given(_instances, _candidates)
+def test_contains_each(instance: ANPlusB, candidates: list[int]) -> None:
+	values = instance.values()
+	
+	assert values.contains_each(candidates) == [
+		candidate in values for candidate in candidates
+	]
+
+
+@given(_instances, _candidates)
+def test_contains_each_numpy(instance: ANPlusB, candidates: list[int]) -> None:
+	numpy = pytest.importorskip('numpy')
+	
+	values = instance.values()
+	result = values.contains_each(numpy.array(candidates, dtype = numpy.int64))
+	
+	assert isinstance(result, numpy.ndarray)
+	assert result.dtype == numpy.bool_
+	assert result.tolist() == [candidate in values for candidate in candidates]
+
+
+def test_contains_each_huge() -> None:
+	numpy = pytest.importorskip('numpy')
+	
+	values = ANPlusB(1 << 70, 3).values()
+	candidates = numpy.array([3, 4, -3], dtype = numpy.int64)
+	
+	result = values.contains_each(candidates)
+	
+	assert isinstance(result, numpy.ndarray)
+	assert result.tolist() == [True, False, False]
+	assert values.contains_each([3, (1 << 70) + 3, 1 << 70]) == [True, True, False]
+
+
+def test_contains_each_invalid() -> None:
+	with pytest.raises(TypeError):
+		ANPlusB(2, 1).values().contains_each([1.0])  # pyright: ignore[reportArgumentType]
+
+
+def test_contains_each_numpy_dtypes() -> None:
+	numpy = pytest.importorskip('numpy')
+	
+	values = ANPlusB(3, 1).values()
+	
+	for dtype in (numpy.float64, numpy.bool_, numpy.complex128):
+		with pytest.raises(UnsupportedDType):
+			values.contains_each(numpy.array([1, 4], dtype = dtype))
+	
+	with pytest.raises(UnsupportedDType):
+		ANPlusB(1 << 70, 3).values().contains_each(numpy.array([3.5]))
+	
+	small = numpy.array([1, 2, 4], dtype = numpy.int8)
+	large = numpy.array([1, 2, (1 << 64) - 3], dtype = numpy.uint64)
+	
+	assert values.contains_each(small).tolist() == [True, False, True]
+	assert values.contains_each(large).tolist() == [True, False, True]
+	assert ANPlusB(-3, -2).values().contains_each(large).tolist() == [False] * 3